@@ -1,6 +1,17 @@
+from .await_operations import await_operations
+from .batch_update import batch_update
 from .create_collection import create_collection
 from .delete_collection import delete_collection
+from .delete_payload_keys import delete_payload_keys
+from .delete_points import delete_points
+from .overwrite_payload import overwrite_payload
+from .recommend_points import recommend_points
+from .search_collections import search_collections
+from .search_groups import search_groups
 from .search_points import search_points
+from .set_payload import set_payload
 from .upsert_points import upsert_points
 
-__all__ = ["create_collection", "upsert_points", "search_points", "delete_collection"]
+__all__ = ["create_collection", "upsert_points", "search_points", "delete_collection", "recommend_points", "batch_update", "delete_points",
+           "set_payload", "overwrite_payload", "delete_payload_keys", "await_operations",
+           "search_groups", "search_collections"]
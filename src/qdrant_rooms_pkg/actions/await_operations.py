@@ -0,0 +1,88 @@
+from typing import Optional
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from qdrant_rooms_pkg.configuration import CustomAddonConfig
+from qdrant_rooms_pkg.services.endpoints import get_client
+from qdrant_rooms_pkg.services.operations import operation_tracker, write_barrier
+from qdrant_rooms_pkg.services.semantic_cache import semantic_cache
+from qdrant_rooms_pkg.services.tenancy import resolve_collection
+from qdrant_rooms_pkg.storage.hot_tier import hot_tier
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+
+class ActionInput(BaseModel):
+    collection_name: str = Field(..., description="Name of the collection the writes were sent to")
+    operation_ids: Optional[list[int]] = Field(None, description="Operation ids to wait for, all pending writes when omitted")
+
+
+class ActionOutput(OutputBase):
+    collection_name: str = Field(..., description="Name of the collection")
+    completed: list = Field(..., description="Operation ids confirmed as applied by this call")
+    success: bool = Field(..., description="Whether the operations were confirmed")
+    message: str = Field(..., description="Status message")
+
+
+def await_operations(
+    config: CustomAddonConfig,
+    collection_name: str,
+    operation_ids: list = None
+) -> ActionResponse:
+    logger.debug("Awaiting pending writes to collection: {}", collection_name)
+
+    try:
+        request = ActionInput(collection_name=collection_name, operation_ids=operation_ids)
+        endpoint = config.endpoint_key()
+
+        physical_name, _ = resolve_collection(config, collection_name)
+        pending = operation_tracker.pending(endpoint, physical_name)
+        wanted = [
+            operation_id for name, operation_id in pending
+            if name == collection_name and (request.operation_ids is None or operation_id in request.operation_ids)
+        ]
+
+        if wanted:
+            write_barrier(get_client(config), physical_name)
+            # the barrier confirms every write sent before it, including other rooms' writes
+            operation_tracker.complete(endpoint, physical_name, pending)
+            for name in {name for name, _ in pending}:
+                # searches run while the writes were in flight may have cached or mirrored stale results
+                semantic_cache.invalidate(endpoint, name)
+                hot_tier.drop(endpoint, name)
+
+        logger.info("Confirmed {} writes to collection '{}'", len(wanted), collection_name)
+
+        tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
+        output = ActionOutput(
+            collection_name=collection_name,
+            completed=wanted,
+            success=True,
+            message=f"Confirmed {len(wanted)} pending operations"
+        )
+
+        return ActionResponse(
+            output=output,
+            tokens=tokens,
+            message="Operations completed",
+            code=200
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to await operations: {str(e)}")
+
+        tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
+        output = ActionOutput(
+            collection_name=collection_name,
+            completed=[],
+            success=False,
+            message=f"Error: {str(e)}"
+        )
+
+        return ActionResponse(
+            output=output,
+            tokens=tokens,
+            message=f"Failed to await operations: {str(e)}",
+            code=500
+        )
@@ -0,0 +1,201 @@
+from typing import Literal, Optional, Union
+
+from loguru import logger
+from pydantic import BaseModel, Field
+from qdrant_client.models import (
+    ClearPayloadOperation,
+    DeleteOperation,
+    DeletePayload,
+    DeletePayloadOperation,
+    OverwritePayloadOperation,
+    PointsList,
+    PointStruct,
+    SetPayload,
+    SetPayloadOperation,
+    UpsertOperation,
+)
+
+from qdrant_rooms_pkg.configuration import CustomAddonConfig
+from qdrant_rooms_pkg.services.endpoints import get_client
+from qdrant_rooms_pkg.services.operations import operation_tracker
+from qdrant_rooms_pkg.services.selectors import (
+    payload_keys,
+    payload_overwrites,
+    payload_update,
+    points_selector,
+    selector_fields,
+)
+from qdrant_rooms_pkg.services.semantic_cache import semantic_cache
+from qdrant_rooms_pkg.services.tenancy import resolve_collection, stamp_point
+from qdrant_rooms_pkg.storage.hot_tier import hot_tier
+from qdrant_rooms_pkg.storage.spool import drain_spool
+from qdrant_rooms_pkg.utils.vectors import preprocess_points
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+
+class Operation(BaseModel):
+    type: Literal["upsert", "delete", "set_payload", "overwrite_payload", "delete_payload", "clear_payload"] = Field(
+        ..., description="Kind of operation"
+    )
+    points: Optional[list] = Field(None, description="Points with id, vector and optional payload, for 'upsert'")
+    ids: Optional[list] = Field(None, description="IDs of the points the operation applies to")
+    filter: Optional[dict] = Field(None, description="Qdrant filter selecting the points the operation applies to")
+    payload: Optional[dict] = Field(None, description="Payload for 'set_payload' and 'overwrite_payload'")
+    keys: Optional[list] = Field(None, description="Payload keys to remove, for 'delete_payload'")
+    key: Optional[str] = Field(None, description="Nested payload path to set the payload under, for 'set_payload'")
+    shard_key: Optional[Union[str, int, list]] = Field(None, description="Shard key(s) the operation applies to")
+
+
+class ActionInput(BaseModel):
+    collection_name: str = Field(..., description="Name of the collection to update")
+    operations: list[Operation] = Field(..., description="Operations applied in order in a single request")
+    wait: bool = Field(True, description="Wait until the batch is applied before returning")
+
+
+class ActionOutput(OutputBase):
+    collection_name: str = Field(..., description="Name of the collection")
+    operations_count: int = Field(..., description="Number of operations applied")
+    results: list = Field(..., description="Status of each operation, in request order")
+    success: bool = Field(..., description="Whether the batch was applied successfully")
+    message: str = Field(..., description="Status message")
+
+
+def _require(operation: Operation, field: str):
+    value = getattr(operation, field)
+    if value is None:
+        raise ValueError(f"'{field}' is required")
+    return value
+
+
+def _build_operation(config: CustomAddonConfig, tenant: Optional[str], operation: Operation) -> list:
+    """Qdrant update operations for one requested operation, usually exactly one."""
+    if operation.type == "upsert":
+        points = [stamp_point(config, tenant, point) for point in _require(operation, "points")]
+        return [UpsertOperation(upsert=PointsList(
+            points=[
+                PointStruct(id=point.get("id"), vector=point.get("vector"), payload=point.get("payload", {}))
+                for point in points
+            ],
+            shard_key=operation.shard_key
+        ))]
+
+    if operation.type in ("overwrite_payload", "clear_payload"):
+        if operation.type == "clear_payload" and tenant is None:
+            return [ClearPayloadOperation(
+                clear_payload=points_selector(config, tenant, operation.ids, operation.filter, operation.shard_key)
+            )]
+        payload = _require(operation, "payload") if operation.type == "overwrite_payload" else {}
+        return [
+            OverwritePayloadOperation(overwrite_payload=SetPayload(payload=point_payload, **selector_fields(selector)))
+            for point_payload, selector in payload_overwrites(
+                config, tenant, payload, operation.ids, operation.filter, operation.shard_key
+            )
+        ]
+
+    selector = points_selector(config, tenant, operation.ids, operation.filter, operation.shard_key)
+    if operation.type == "delete":
+        return [DeleteOperation(delete=selector)]
+    if operation.type == "set_payload":
+        payload = payload_update(config, tenant, _require(operation, "payload"), operation.key)
+        return [SetPayloadOperation(set_payload=SetPayload(payload=payload, key=operation.key, **selector_fields(selector)))]
+    keys = payload_keys(config, tenant, _require(operation, "keys"))
+    return [DeletePayloadOperation(delete_payload=DeletePayload(keys=keys, **selector_fields(selector)))]
+
+
+def batch_update(
+    config: CustomAddonConfig,
+    collection_name: str,
+    operations: list,
+    wait: bool = True
+) -> ActionResponse:
+    logger.debug("Applying {} operations to collection: {}", len(operations or []), collection_name)
+
+    try:
+        request = ActionInput(collection_name=collection_name, operations=operations, wait=wait)
+        drain_spool(config)
+        client = get_client(config)
+
+        physical_name, tenant = resolve_collection(config, collection_name)
+
+        update_operations = []
+        spans = []
+        for index, operation in enumerate(request.operations):
+            try:
+                if operation.type == "upsert" and operation.points:
+                    # prepared like upsert_points, so the hot tier below mirrors what is stored
+                    operation.points = preprocess_points(config, operation.points)
+                built = _build_operation(config, tenant, operation)
+            except ValueError as e:
+                raise ValueError(f"Operation {index} ({operation.type}): {e}") from e
+            spans.append(len(built))
+            update_operations.extend(built)
+
+        update_results = []
+        if update_operations:
+            update_results = client.batch_update_points(
+                collection_name=physical_name,
+                update_operations=update_operations,
+                wait=request.wait
+            )
+            if not request.wait:
+                for update in update_results:
+                    operation_tracker.track(config.endpoint_key(), physical_name, collection_name, update.operation_id)
+
+        endpoint = config.endpoint_key()
+        semantic_cache.invalidate(endpoint, collection_name)
+        if all(operation.type == "upsert" for operation in request.operations):
+            points = [point for operation in request.operations for point in operation.points]
+            hot_tier.upsert(endpoint, collection_name, points, config.hot_tier_max_points)
+        else:
+            hot_tier.drop(endpoint, collection_name)
+
+        results = []
+        position = 0
+        for index, (operation, span) in enumerate(zip(request.operations, spans)):
+            position += span
+            # an operation split into several reports the status of its last part
+            update = update_results[position - 1] if span else None
+            results.append({
+                "index": index,
+                "type": operation.type,
+                "operation_id": update.operation_id if update else None,
+                "status": update.status.value if update else "skipped"
+            })
+
+        logger.info("Applied {} operations to collection '{}'", len(results), collection_name)
+
+        tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
+        output = ActionOutput(
+            collection_name=collection_name,
+            operations_count=len(results),
+            results=results,
+            success=True,
+            message=f"Successfully applied {len(results)} operations"
+        )
+
+        return ActionResponse(
+            output=output,
+            tokens=tokens,
+            message="Batch update applied successfully",
+            code=200
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to apply batch update: {str(e)}")
+
+        tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
+        output = ActionOutput(
+            collection_name=collection_name,
+            operations_count=0,
+            results=[],
+            success=False,
+            message=f"Error: {str(e)}"
+        )
+
+        return ActionResponse(
+            output=output,
+            tokens=tokens,
+            message=f"Failed to apply batch update: {str(e)}",
+            code=500
+        )
@@ -1,12 +1,28 @@
+from typing import Optional, Union
 
 from loguru import logger
 from pydantic import BaseModel, Field
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams
+from qdrant_client.models import (
+    Datatype,
+    Distance,
+    Filter,
+    FilterSelector,
+    HnswConfigDiff,
+    KeywordIndexParams,
+    PointStruct,
+    ShardingMethod,
+    VectorParams,
+)
 
 from qdrant_rooms_pkg.configuration import CustomAddonConfig
+from qdrant_rooms_pkg.services.endpoints import get_client
+from qdrant_rooms_pkg.services.semantic_cache import semantic_cache
+from qdrant_rooms_pkg.services.tenancy import ROOM_MARKER_KEY, resolve_collection, room_marker_id, tenant_filter
+from qdrant_rooms_pkg.storage.hot_tier import hot_tier
 
 from .base import ActionResponse, OutputBase, TokensSchema
+from .search_collections import forget_distance
 
 
 class ActionInput(BaseModel):
@@ -14,6 +30,12 @@ class ActionInput(BaseModel):
     vector_size: int = Field(..., description="Size of the vectors to store")
     distance: str = Field("Cosine", description="Distance metric: Cosine, Euclid, or Dot")
     if_exists: str = Field("error", description="Action if collection exists: 'error', 'skip', or 'recreate'")
+    shard_number: Optional[int] = Field(None, description="Number of shards (per shard key with custom sharding)")
+    replication_factor: Optional[int] = Field(None, description="Number of replicas of each shard")
+    write_consistency_factor: Optional[int] = Field(None, description="Number of replicas that must acknowledge a write")
+    sharding_method: str = Field("auto", description="Sharding method: 'auto' or 'custom'")
+    shard_keys: Optional[list[Union[str, int]]] = Field(None, description="Shard keys to create with custom sharding")
+    datatype: Optional[str] = Field(None, description="Vector datatype: 'float32', 'float16' or 'uint8' (default: the addon's vector_datatype, which it must match unless that is 'float32')")
 
 
 class ActionOutput(OutputBase):
@@ -22,34 +44,78 @@ class ActionOutput(OutputBase):
     message: str = Field(..., description="Status message")
 
 
+def _ensure_shared_collection(client: QdrantClient, config: CustomAddonConfig, vector_size: int,
+                              distance_metric: Distance, datatype: Datatype, sharding_params: dict) -> tuple[bool, bool]:
+    """Create the shared collection if needed, return ``(created, custom_sharded)``."""
+    shared_name = config.tenancy_collection
+    if client.collection_exists(shared_name):
+        params = client.get_collection(shared_name).config.params
+        vectors_config = params.vectors
+        if isinstance(vectors_config, VectorParams) and vectors_config.size != vector_size:
+            raise ValueError(
+                f"Shared collection '{shared_name}' stores vectors of size {vectors_config.size}, not {vector_size}"
+            )
+        if isinstance(vectors_config, VectorParams) and vectors_config.distance != distance_metric:
+            raise ValueError(
+                f"Shared collection '{shared_name}' uses {vectors_config.distance.value} distance, not {distance_metric.value}"
+            )
+        return False, params.sharding_method == ShardingMethod.CUSTOM
+
+    # rooms are always searched with a tenant filter, so only the per-tenant payload graph is built
+    client.create_collection(
+        collection_name=shared_name,
+        vectors_config=VectorParams(size=vector_size, distance=distance_metric, datatype=datatype),
+        hnsw_config=HnswConfigDiff(payload_m=16, m=0),
+        **sharding_params
+    )
+    client.create_payload_index(
+        collection_name=shared_name,
+        field_name=config.tenancy_key,
+        field_schema=KeywordIndexParams(type="keyword", is_tenant=True)
+    )
+    logger.info("Shared collection '{}' created for room tenancy", shared_name)
+    return True, sharding_params.get("sharding_method") == ShardingMethod.CUSTOM
+
+
+def _record_room(client: QdrantClient, config: CustomAddonConfig, tenant: str, vector_size: int,
+                 custom_sharded: bool, shard_keys: Optional[list]) -> None:
+    if custom_sharded and not shard_keys:
+        logger.warning("Room '{}' is not recorded, its custom-sharded collection needs a shard key for it", tenant)
+        return
+    client.upsert(
+        collection_name=config.tenancy_collection,
+        points=[PointStruct(id=room_marker_id(tenant), vector=[1.0] * vector_size, payload={ROOM_MARKER_KEY: tenant})],
+        shard_key_selector=shard_keys[0] if custom_sharded else None
+    )
+
+
+def _room_exists(client: QdrantClient, config: CustomAddonConfig, tenant: str) -> bool:
+    if not client.collection_exists(config.tenancy_collection):
+        return False
+    if client.retrieve(config.tenancy_collection, [room_marker_id(tenant)], with_payload=False):
+        return True
+    # rooms without a marker are only known by their points
+    room_points = Filter(**tenant_filter(config, tenant))
+    return client.count(config.tenancy_collection, count_filter=room_points, exact=True).count > 0
+
+
 def create_collection(
     config: CustomAddonConfig,
     collection_name: str,
     vector_size: int,
     distance: str = "Cosine",
-    if_exists: str = "error"
+    if_exists: str = "error",
+    shard_number: int = None,
+    replication_factor: int = None,
+    write_consistency_factor: int = None,
+    sharding_method: str = "auto",
+    shard_keys: list = None,
+    datatype: str = None
 ) -> ActionResponse:
-    logger.debug(f"Creating collection: {collection_name} with vector size: {vector_size}, distance: {distance}, if_exists: {if_exists}")
+    logger.debug("Creating collection: {} with vector size: {}, distance: {}, if_exists: {}", collection_name, vector_size, distance, if_exists)
 
     try:
-        client_params = {}
-
-        if config.url:
-            client_params["url"] = config.url
-        elif config.host:
-            client_params["host"] = config.host
-            client_params["port"] = config.port
-
-        if config.prefer_grpc and config.grpc_port:
-            client_params["grpc_port"] = config.grpc_port
-            client_params["prefer_grpc"] = True
-
-        if "qdrant_api_key" in config.secrets and config.secrets["qdrant_api_key"]:
-            client_params["api_key"] = config.secrets["qdrant_api_key"]
-
-        client_params["timeout"] = config.timeout
-
-        client = QdrantClient(**client_params)
+        client = get_client(config)
 
         distance_map = {
             "Cosine": Distance.COSINE,
@@ -58,17 +124,53 @@ def create_collection(
         }
 
         distance_metric = distance_map.get(distance, Distance.COSINE)
+        datatype = datatype or config.vector_datatype
+        if datatype not in ("float32", "float16", "uint8"):
+            raise ValueError(f"Unknown vector datatype: {datatype}")
+        if config.vector_datatype != "float32" and datatype != config.vector_datatype:
+            # upserts are rounded to vector_datatype whatever the collection stores
+            raise ValueError(
+                f"Vectors are converted to vector_datatype '{config.vector_datatype}', "
+                f"a '{datatype}' collection would store them rounded"
+            )
+        vector_datatype = Datatype(datatype)
+        physical_name, tenant = resolve_collection(config, collection_name)
+
+        if sharding_method not in ("auto", "custom"):
+            raise ValueError(f"Unknown sharding method: {sharding_method}")
+        if shard_keys and sharding_method != "custom":
+            raise ValueError("shard_keys require sharding_method 'custom'")
+
+        sharding_params = {}
+        if shard_number is not None:
+            sharding_params["shard_number"] = shard_number
+        if replication_factor is not None:
+            sharding_params["replication_factor"] = replication_factor
+        if write_consistency_factor is not None:
+            sharding_params["write_consistency_factor"] = write_consistency_factor
+        if sharding_method == "custom":
+            sharding_params["sharding_method"] = ShardingMethod.CUSTOM
+
+        created = False
+        if tenant is not None:
+            # a request the shared collection cannot hold fails here, before a recreate deletes the room
+            created, custom_sharded = _ensure_shared_collection(
+                client, config, vector_size, distance_metric, vector_datatype, sharding_params
+            )
 
         collection_exists = False
         try:
-            collections = client.get_collections().collections
-            collection_exists = any(c.name == collection_name for c in collections)
+            if tenant is None:
+                collections = client.get_collections().collections
+                collection_exists = any(c.name == collection_name for c in collections)
+            else:
+                collection_exists = _room_exists(client, config, tenant)
         except Exception as e:
-            logger.warning(f"Could not check if collection exists: {e}")
+            logger.warning("Could not check if collection exists: {}", e)
 
         if collection_exists:
             if if_exists == "skip":
-                logger.info(f"Collection '{collection_name}' already exists, skipping creation")
+                logger.info("Collection '{}' already exists, skipping creation", collection_name)
                 tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
                 output = ActionOutput(
                     collection_name=collection_name,
@@ -82,9 +184,16 @@ def create_collection(
                     code=200
                 )
             elif if_exists == "recreate":
-                logger.info(f"Collection '{collection_name}' already exists, recreating")
-                client.delete_collection(collection_name=collection_name)
-                logger.info(f"Deleted existing collection '{collection_name}'")
+                logger.info("Collection '{}' already exists, recreating", collection_name)
+                if tenant is None:
+                    client.delete_collection(collection_name=collection_name)
+                else:
+                    client.delete(
+                        collection_name=physical_name,
+                        points_selector=FilterSelector(filter=Filter(**tenant_filter(config, tenant)))
+                    )
+                semantic_cache.invalidate(config.endpoint_key(), collection_name)
+                logger.info("Deleted existing collection '{}'", collection_name)
             elif if_exists == "error":
                 logger.error(f"Collection '{collection_name}' already exists")
                 tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
@@ -100,7 +209,7 @@ def create_collection(
                     code=409
                 )
             else:
-                logger.warning(f"Unknown if_exists value: {if_exists}, defaulting to 'error'")
+                logger.warning("Unknown if_exists value: {}, defaulting to 'error'", if_exists)
                 tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
                 output = ActionOutput(
                     collection_name=collection_name,
@@ -114,13 +223,27 @@ def create_collection(
                     code=409
                 )
 
-        client.create_collection(
-            collection_name=collection_name,
-            vectors_config=VectorParams(size=vector_size, distance=distance_metric)
-        )
+        if tenant is None:
+            client.create_collection(
+                collection_name=collection_name,
+                vectors_config=VectorParams(size=vector_size, distance=distance_metric, datatype=vector_datatype),
+                **sharding_params
+            )
+            created = True
+
+        if created:
+            for shard_key in shard_keys or []:
+                client.create_shard_key(collection_name=physical_name, shard_key=shard_key)
+                logger.debug("Created shard key '{}' in collection '{}'", shard_key, physical_name)
+        if tenant is not None:
+            _record_room(client, config, tenant, vector_size, custom_sharded, shard_keys)
+
+        forget_distance(config, collection_name)
+        if config.hot_tier_enabled:
+            hot_tier.create(config.endpoint_key(), collection_name, vector_size, distance_metric.value)
 
         action_taken = "recreated" if (collection_exists and if_exists == "recreate") else "created"
-        logger.info(f"Collection '{collection_name}' {action_taken} successfully")
+        logger.info("Collection '{}' {} successfully", collection_name, action_taken)
 
         tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
         output = ActionOutput(
@@ -1,10 +1,16 @@
 from loguru import logger
 from pydantic import BaseModel, Field
-from qdrant_client import QdrantClient
+from qdrant_client.models import Filter, FilterSelector
 
 from qdrant_rooms_pkg.configuration import CustomAddonConfig
+from qdrant_rooms_pkg.services.endpoints import get_client
+from qdrant_rooms_pkg.services.semantic_cache import semantic_cache
+from qdrant_rooms_pkg.services.tenancy import resolve_collection, room_filter
+from qdrant_rooms_pkg.storage.hot_tier import hot_tier
+from qdrant_rooms_pkg.storage.spool import drain_spool
 
 from .base import ActionResponse, OutputBase, TokensSchema
+from .search_collections import forget_distance
 
 
 class ActionInput(BaseModel):
@@ -21,31 +27,25 @@ def delete_collection(
     config: CustomAddonConfig,
     collection_name: str
 ) -> ActionResponse:
-    logger.debug(f"Deleting collection: {collection_name}")
+    logger.debug("Deleting collection: {}", collection_name)
 
     try:
-        client_params = {}
-
-        if config.url:
-            client_params["url"] = config.url
-        elif config.host:
-            client_params["host"] = config.host
-            client_params["port"] = config.port
-
-        if config.prefer_grpc and config.grpc_port:
-            client_params["grpc_port"] = config.grpc_port
-            client_params["prefer_grpc"] = True
-
-        if "qdrant_api_key" in config.secrets and config.secrets["qdrant_api_key"]:
-            client_params["api_key"] = config.secrets["qdrant_api_key"]
-
-        client_params["timeout"] = config.timeout
-
-        client = QdrantClient(**client_params)
-
-        client.delete_collection(collection_name=collection_name)
-
-        logger.info(f"Collection '{collection_name}' deleted successfully")
+        drain_spool(config)
+        client = get_client(config)
+
+        physical_name, tenant = resolve_collection(config, collection_name)
+        if tenant is None:
+            client.delete_collection(collection_name=collection_name)
+        else:
+            client.delete(
+                collection_name=physical_name,
+                points_selector=FilterSelector(filter=Filter(**room_filter(config, tenant)))
+            )
+        semantic_cache.invalidate(config.endpoint_key(), collection_name)
+        forget_distance(config, collection_name)
+        hot_tier.drop(config.endpoint_key(), collection_name)
+
+        logger.info("Collection '{}' deleted successfully", collection_name)
 
         tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
         output = ActionOutput(
@@ -0,0 +1,105 @@
+from typing import Optional, Union
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from qdrant_rooms_pkg.configuration import CustomAddonConfig
+from qdrant_rooms_pkg.services.endpoints import get_client
+from qdrant_rooms_pkg.services.operations import operation_tracker
+from qdrant_rooms_pkg.services.selectors import payload_keys, points_selector
+from qdrant_rooms_pkg.services.semantic_cache import semantic_cache
+from qdrant_rooms_pkg.services.tenancy import resolve_collection
+from qdrant_rooms_pkg.storage.hot_tier import hot_tier
+from qdrant_rooms_pkg.storage.spool import drain_spool
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+
+class ActionInput(BaseModel):
+    collection_name: str = Field(..., description="Name of the collection")
+    keys: list[str] = Field(..., description="Payload keys to remove")
+    ids: Optional[list] = Field(None, description="IDs of the points to update")
+    query_filter: Optional[dict] = Field(None, description="Qdrant filter selecting the points to update")
+    wait: bool = Field(True, description="Wait until the update is applied before returning")
+    shard_key: Optional[Union[str, int, list]] = Field(None, description="Shard key(s) to update in custom-sharded collections")
+
+
+class ActionOutput(OutputBase):
+    collection_name: str = Field(..., description="Name of the collection")
+    operation_id: Optional[int] = Field(None, description="Qdrant operation id of the update")
+    status: Optional[str] = Field(None, description="'completed', or 'acknowledged' when not waiting")
+    success: bool = Field(..., description="Whether the update was successful")
+    message: str = Field(..., description="Status message")
+
+
+def delete_payload_keys(
+    config: CustomAddonConfig,
+    collection_name: str,
+    keys: list,
+    ids: list = None,
+    query_filter: dict = None,
+    wait: bool = True,
+    shard_key: Union[str, int, list] = None
+) -> ActionResponse:
+    logger.debug("Deleting payload keys {} in collection: {}", keys, collection_name)
+
+    try:
+        request = ActionInput(
+            collection_name=collection_name,
+            keys=keys,
+            ids=ids,
+            query_filter=query_filter,
+            wait=wait,
+            shard_key=shard_key
+        )
+        drain_spool(config)
+        client = get_client(config)
+
+        physical_name, tenant = resolve_collection(config, collection_name)
+
+        result = client.delete_payload(
+            collection_name=physical_name,
+            keys=payload_keys(config, tenant, request.keys),
+            points=points_selector(config, tenant, request.ids, request.query_filter),
+            wait=request.wait,
+            shard_key_selector=request.shard_key
+        )
+        if not request.wait:
+            operation_tracker.track(config.endpoint_key(), physical_name, collection_name, result.operation_id)
+        semantic_cache.invalidate(config.endpoint_key(), collection_name)
+        hot_tier.drop(config.endpoint_key(), collection_name)
+
+        logger.info("Deleted payload keys in collection '{}' ({})", collection_name, result.status.value)
+
+        tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
+        output = ActionOutput(
+            collection_name=collection_name,
+            operation_id=result.operation_id,
+            status=result.status.value,
+            success=True,
+            message=f"Payload update {result.status.value}"
+        )
+
+        return ActionResponse(
+            output=output,
+            tokens=tokens,
+            message="Payload keys deleted successfully",
+            code=200
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to delete payload keys: {str(e)}")
+
+        tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
+        output = ActionOutput(
+            collection_name=collection_name,
+            success=False,
+            message=f"Error: {str(e)}"
+        )
+
+        return ActionResponse(
+            output=output,
+            tokens=tokens,
+            message=f"Failed to delete payload keys: {str(e)}",
+            code=500
+        )
@@ -0,0 +1,126 @@
+from typing import Optional, Union
+
+from loguru import logger
+from pydantic import BaseModel, Field
+from qdrant_client.models import OverwritePayloadOperation, SetPayload
+
+from qdrant_rooms_pkg.configuration import CustomAddonConfig
+from qdrant_rooms_pkg.services.endpoints import get_client
+from qdrant_rooms_pkg.services.operations import operation_tracker
+from qdrant_rooms_pkg.services.selectors import payload_overwrites, selector_fields
+from qdrant_rooms_pkg.services.semantic_cache import semantic_cache
+from qdrant_rooms_pkg.services.tenancy import resolve_collection
+from qdrant_rooms_pkg.storage.hot_tier import hot_tier
+from qdrant_rooms_pkg.storage.spool import drain_spool
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+
+class ActionInput(BaseModel):
+    collection_name: str = Field(..., description="Name of the collection")
+    payload: dict = Field(..., description="Payload replacing the whole payload of the selected points")
+    ids: Optional[list] = Field(None, description="IDs of the points to update")
+    query_filter: Optional[dict] = Field(None, description="Qdrant filter selecting the points to update")
+    wait: bool = Field(True, description="Wait until the update is applied before returning")
+    shard_key: Optional[Union[str, int, list]] = Field(None, description="Shard key(s) to update in custom-sharded collections")
+
+
+class ActionOutput(OutputBase):
+    collection_name: str = Field(..., description="Name of the collection")
+    operation_id: Optional[int] = Field(None, description="Qdrant operation id of the update")
+    status: Optional[str] = Field(None, description="'completed', 'acknowledged' when not waiting, or 'skipped' when no point was selected")
+    success: bool = Field(..., description="Whether the update was successful")
+    message: str = Field(..., description="Status message")
+
+
+def overwrite_payload(
+    config: CustomAddonConfig,
+    collection_name: str,
+    payload: dict,
+    ids: list = None,
+    query_filter: dict = None,
+    wait: bool = True,
+    shard_key: Union[str, int, list] = None
+) -> ActionResponse:
+    logger.debug("Overwriting payload in collection: {}", collection_name)
+
+    try:
+        request = ActionInput(
+            collection_name=collection_name,
+            payload=payload,
+            ids=ids,
+            query_filter=query_filter,
+            wait=wait,
+            shard_key=shard_key
+        )
+        drain_spool(config)
+        client = get_client(config)
+
+        physical_name, tenant = resolve_collection(config, collection_name)
+        overwrites = payload_overwrites(config, tenant, request.payload, request.ids, request.query_filter)
+
+        if len(overwrites) == 1:
+            point_payload, selector = overwrites[0]
+            results = [client.overwrite_payload(
+                collection_name=physical_name,
+                payload=point_payload,
+                points=selector,
+                wait=request.wait,
+                shard_key_selector=request.shard_key
+            )]
+        elif overwrites:
+            # points of a room keep their own room keys, so each gets its own operation in one request
+            results = client.batch_update_points(
+                collection_name=physical_name,
+                update_operations=[
+                    OverwritePayloadOperation(overwrite_payload=SetPayload(
+                        payload=point_payload, **{**selector_fields(selector), "shard_key": request.shard_key}
+                    ))
+                    for point_payload, selector in overwrites
+                ],
+                wait=request.wait
+            )
+        else:
+            results = []
+        if not request.wait:
+            for result in results:
+                operation_tracker.track(config.endpoint_key(), physical_name, collection_name, result.operation_id)
+        semantic_cache.invalidate(config.endpoint_key(), collection_name)
+        hot_tier.drop(config.endpoint_key(), collection_name)
+
+        result = results[-1] if results else None
+        status = result.status.value if result else "skipped"
+        logger.info("Overwrote payload in collection '{}' ({})", collection_name, status)
+
+        tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
+        output = ActionOutput(
+            collection_name=collection_name,
+            operation_id=result.operation_id if result else None,
+            status=status,
+            success=True,
+            message=f"Payload update {status}"
+        )
+
+        return ActionResponse(
+            output=output,
+            tokens=tokens,
+            message="Payload overwritten successfully",
+            code=200
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to overwrite payload: {str(e)}")
+
+        tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
+        output = ActionOutput(
+            collection_name=collection_name,
+            success=False,
+            message=f"Error: {str(e)}"
+        )
+
+        return ActionResponse(
+            output=output,
+            tokens=tokens,
+            message=f"Failed to overwrite payload: {str(e)}",
+            code=500
+        )
@@ -0,0 +1,139 @@
+from typing import Literal, Optional, Union
+
+from loguru import logger
+from pydantic import BaseModel, Field
+from qdrant_client.models import Filter, RecommendStrategy
+
+from qdrant_rooms_pkg.configuration import CustomAddonConfig
+from qdrant_rooms_pkg.services.endpoints import pool_read
+from qdrant_rooms_pkg.services.tenancy import resolve_collection, restore_point, tenant_filter, tenant_point_id
+from qdrant_rooms_pkg.utils.vectors import preprocess, preprocessing_enabled
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+
+class ActionInput(BaseModel):
+    collection_name: str = Field(..., description="Name of the collection to search in")
+    positive: list = Field(..., description="Point IDs or vectors the results should be similar to")
+    negative: list = Field(default_factory=list, description="Point IDs or vectors the results should be dissimilar to")
+    strategy: Optional[Literal["average_vector", "best_score"]] = Field(None, description="How examples are combined, Qdrant defaults to 'average_vector'")
+    limit: int = Field(5, description="Maximum number of results to return")
+    score_threshold: Optional[float] = Field(None, description="Minimum score threshold for results")
+    query_filter: Optional[dict] = Field(None, description="Qdrant filter (must/should/must_not conditions) applied to the search")
+    shard_key: Optional[Union[str, int, list]] = Field(None, description="Shard key(s) to search in custom-sharded collections")
+
+
+class ActionOutput(OutputBase):
+    collection_name: str = Field(..., description="Name of the collection searched")
+    results: list = Field(..., description="List of recommended points with id, score, and payload")
+    results_count: int = Field(..., description="Number of results returned")
+    success: bool = Field(..., description="Whether the recommendation was successful")
+    message: str = Field(..., description="Status message")
+
+
+def _examples(config: CustomAddonConfig, tenant: Optional[str], examples: list) -> list:
+    # vectors are prepared like search queries, point ids are mapped to their id in the shared collection
+    prepared = []
+    for example in examples:
+        if isinstance(example, list):
+            if preprocessing_enabled(config):
+                example = preprocess(config, example, for_query=True)[0].tolist()
+        elif tenant is not None:
+            example = tenant_point_id(tenant, example)
+        prepared.append(example)
+    return prepared
+
+
+def recommend_points(
+    config: CustomAddonConfig,
+    collection_name: str,
+    positive: list,
+    negative: list = None,
+    strategy: str = None,
+    limit: int = 5,
+    score_threshold: float = None,
+    query_filter: dict = None,
+    shard_key: Union[str, int, list] = None
+) -> ActionResponse:
+    logger.debug("Recommending from collection: {} with {} positive examples", collection_name, len(positive or []))
+
+    try:
+        request = ActionInput(
+            collection_name=collection_name,
+            positive=positive,
+            negative=negative or [],
+            strategy=strategy,
+            limit=limit,
+            score_threshold=score_threshold,
+            query_filter=query_filter,
+            shard_key=shard_key
+        )
+
+        physical_name, tenant = resolve_collection(config, collection_name)
+        scoped_filter = tenant_filter(config, tenant, request.query_filter)
+
+        recommend_params = {
+            "collection_name": physical_name,
+            "positive": _examples(config, tenant, request.positive),
+            "negative": _examples(config, tenant, request.negative),
+            "limit": request.limit,
+            "with_payload": True
+        }
+
+        if request.strategy is not None:
+            recommend_params["strategy"] = RecommendStrategy(request.strategy)
+
+        if request.score_threshold is not None:
+            recommend_params["score_threshold"] = request.score_threshold
+
+        if scoped_filter:
+            recommend_params["query_filter"] = Filter(**scoped_filter)
+
+        if request.shard_key is not None:
+            recommend_params["shard_key_selector"] = request.shard_key
+
+        results = []
+        for result in pool_read(config, lambda client: client.recommend(**recommend_params)):
+            point_id, payload = restore_point(config, tenant, result.id, result.payload)
+            results.append({
+                "id": point_id,
+                "score": result.score,
+                "payload": payload
+            })
+
+        logger.debug("Recommended {} points from collection '{}'", len(results), collection_name)
+
+        tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
+        output = ActionOutput(
+            collection_name=collection_name,
+            results=results,
+            results_count=len(results),
+            success=True,
+            message=f"Found {len(results)} results"
+        )
+
+        return ActionResponse(
+            output=output,
+            tokens=tokens,
+            message="Recommendation completed successfully",
+            code=200
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to recommend points: {str(e)}")
+
+        tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
+        output = ActionOutput(
+            collection_name=collection_name,
+            results=[],
+            results_count=0,
+            success=False,
+            message=f"Error: {str(e)}"
+        )
+
+        return ActionResponse(
+            output=output,
+            tokens=tokens,
+            message=f"Failed to recommend points: {str(e)}",
+            code=500
+        )
@@ -0,0 +1,210 @@
+import heapq
+import itertools
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal, Optional
+
+from loguru import logger
+from pydantic import BaseModel, Field
+from qdrant_client.models import VectorParams
+
+from qdrant_rooms_pkg.configuration import CustomAddonConfig
+from qdrant_rooms_pkg.services.endpoints import pool_read
+from qdrant_rooms_pkg.services.tenancy import resolve_collection
+
+from .base import ActionResponse, OutputBase, TokensSchema
+from .search_points import search_points
+
+_FANOUT_WORKERS = 32
+# distances where a lower score is a better match
+_DISTANCE_METRICS = ("Euclid", "Manhattan")
+
+
+class ActionInput(BaseModel):
+    collection_names: list[str] = Field(..., min_length=1, description="Names of the collections to search")
+    query_vector: list = Field(..., description="Query vector to search for similar points")
+    limit: int = Field(5, description="Maximum number of merged results to return")
+    score_threshold: Optional[float] = Field(None, description="Minimum score threshold, applied to each collection's own scores")
+    query_filter: Optional[dict] = Field(None, description="Qdrant filter (must/should/must_not conditions) applied in every collection")
+    normalization: Literal["none", "min_max", "z_score"] = Field("none", description="Per-collection score normalization before merging")
+
+
+class ActionOutput(OutputBase):
+    results: list = Field(..., description="Merged results with collection_name, id, score, raw_score and payload, best first (lowest raw distance first for unnormalized Euclid/Manhattan)")
+    results_count: int = Field(..., description="Number of results returned")
+    sources: list = Field(..., description="Per-collection results_count, latency_ms, success and message")
+    success: bool = Field(..., description="Whether the search was successful")
+    message: str = Field(..., description="Status message")
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+# distance of each (endpoint, physical collection), cleared when the collection is created or deleted
+_distances: dict[tuple[str, str], str] = {}
+
+
+def _fanout_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=_FANOUT_WORKERS, thread_name_prefix="qdrant-fanout")
+    return _executor
+
+
+def _timed_search(config: CustomAddonConfig, collection_name: str, request: ActionInput) -> tuple:
+    started = time.perf_counter()
+    response = search_points(
+        config,
+        collection_name,
+        request.query_vector,
+        limit=request.limit,
+        score_threshold=request.score_threshold,
+        query_filter=request.query_filter
+    )
+    return response, time.perf_counter() - started
+
+
+def _distance(config: CustomAddonConfig, collection_name: str) -> str:
+    physical_name, _ = resolve_collection(config, collection_name)
+    key = (config.endpoint_key(), physical_name)
+    distance = _distances.get(key)
+    if distance is None:
+        vectors_config = pool_read(config, lambda client: client.get_collection(physical_name)).config.params.vectors
+        if not isinstance(vectors_config, VectorParams):
+            raise ValueError(f"Collection '{collection_name}' has named vectors")
+        distance = _distances[key] = vectors_config.distance.value
+    return distance
+
+
+def forget_distance(config: CustomAddonConfig, collection_name: str) -> None:
+    physical_name, _ = resolve_collection(config, collection_name)
+    _distances.pop((config.endpoint_key(), physical_name), None)
+
+
+def _normalize(results: list, normalization: str, lower_is_better: bool) -> list:
+    """
+    Map a collection's scores to a common scale on which higher is better; every
+    mapping keeps the order of the results. Without normalization scores are kept.
+    """
+    sign = -1.0 if lower_is_better else 1.0
+    scores = [sign * result["score"] for result in results]
+    if normalization == "none" or not scores:
+        scale = None
+    elif normalization == "min_max":
+        low, high = min(scores), max(scores)
+        scale = (lambda score: (score - low) / (high - low)) if high > low else (lambda score: 1.0)
+    else:
+        mean = statistics.fmean(scores)
+        deviation = statistics.pstdev(scores)
+        scale = (lambda score: (score - mean) / deviation) if deviation > 0 else (lambda score: 0.0)
+
+    return [
+        {**result, "raw_score": result["score"], "score": scale(sign * result["score"]) if scale else result["score"]}
+        for result in results
+    ]
+
+
+def search_collections(
+    config: CustomAddonConfig,
+    collection_names: list,
+    query_vector: list,
+    limit: int = 5,
+    score_threshold: float = None,
+    query_filter: dict = None,
+    normalization: str = "none"
+) -> ActionResponse:
+    logger.debug("Searching {} collections with limit: {}", len(collection_names or []), limit)
+
+    sources = []
+    try:
+        request = ActionInput(
+            collection_names=collection_names,
+            query_vector=query_vector,
+            limit=limit,
+            score_threshold=score_threshold,
+            query_filter=query_filter,
+            normalization=normalization
+        )
+
+        # every collection returns its own top `limit`, which always contains its share of the merged top `limit`
+        executor = _fanout_executor()
+        names = list(dict.fromkeys(request.collection_names))
+        futures = [
+            (executor.submit(_timed_search, config, name, request), executor.submit(_distance, config, name))
+            for name in names
+        ]
+
+        ranked = []
+        directions = set()
+        for name, (search_future, distance_future) in zip(names, futures):
+            response, elapsed = search_future.result()
+            success, message = response.code == 200, response.output.message
+            if success:
+                try:
+                    lower_is_better = distance_future.result() in _DISTANCE_METRICS
+                except Exception as e:
+                    success, message = False, f"Error: {str(e)}"
+            sources.append({
+                "collection_name": name,
+                "results_count": response.output.results_count if success else 0,
+                "latency_ms": round(elapsed * 1000, 3),
+                "success": success,
+                "message": message
+            })
+            if success:
+                hits = [{"collection_name": name, **result} for result in response.output.results]
+                ranked.append(_normalize(hits, request.normalization, lower_is_better))
+                directions.add(lower_is_better)
+
+        if not ranked:
+            raise RuntimeError("; ".join(f"{source['collection_name']}: {source['message']}" for source in sources))
+
+        # normalized scores are all higher-is-better, raw distances are lower-is-better
+        ascending = request.normalization == "none" and directions == {True}
+        if request.normalization == "none" and len(directions) > 1:
+            raise ValueError("Similarity and distance scores cannot be merged without normalization")
+
+        # k-way heap merge of the already sorted per-collection lists
+        merged = heapq.merge(*ranked, key=(lambda result: result["score"]) if ascending else (lambda result: -result["score"]))
+        results = list(itertools.islice(merged, request.limit))
+        failed = [source["collection_name"] for source in sources if not source["success"]]
+
+        logger.debug("Merged {} results from {} collections", len(results), len(ranked))
+
+        tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
+        output = ActionOutput(
+            results=results,
+            results_count=len(results),
+            sources=sources,
+            success=True,
+            message=f"Found {len(results)} results" + (f", {len(failed)} collections failed" if failed else "")
+        )
+
+        return ActionResponse(
+            output=output,
+            tokens=tokens,
+            message="Search completed successfully",
+            code=200
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to search collections: {str(e)}")
+
+        tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
+        output = ActionOutput(
+            results=[],
+            results_count=0,
+            sources=sources,
+            success=False,
+            message=f"Error: {str(e)}"
+        )
+
+        return ActionResponse(
+            output=output,
+            tokens=tokens,
+            message=f"Failed to search collections: {str(e)}",
+            code=500
+        )
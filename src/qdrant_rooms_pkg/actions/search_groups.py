@@ -0,0 +1,139 @@
+from typing import Optional, Union
+
+from loguru import logger
+from pydantic import BaseModel, Field
+from qdrant_client.models import Filter
+
+from qdrant_rooms_pkg.configuration import CustomAddonConfig
+from qdrant_rooms_pkg.services.endpoints import pool_read
+from qdrant_rooms_pkg.services.tenancy import ORIGINAL_ID_KEY, resolve_collection, restore_point, tenant_filter
+from qdrant_rooms_pkg.utils.vectors import preprocess, preprocessing_enabled
+
+from .base import ActionResponse, OutputBase, TokensSchema
+
+
+class ActionInput(BaseModel):
+    collection_name: str = Field(..., description="Name of the collection to search in")
+    query_vector: list = Field(..., description="Query vector to search for similar points")
+    group_by: str = Field(..., description="Payload key whose values group the points, e.g. a document id")
+    limit: int = Field(5, description="Maximum number of groups to return")
+    group_size: int = Field(1, description="Maximum number of points returned per group")
+    score_threshold: Optional[float] = Field(None, description="Minimum score threshold for points")
+    query_filter: Optional[dict] = Field(None, description="Qdrant filter (must/should/must_not conditions) applied to the search")
+    with_payload: Union[bool, list[str]] = Field(True, description="Return the payload of the points, or only the listed keys")
+    shard_key: Optional[Union[str, int, list]] = Field(None, description="Shard key(s) to search in custom-sharded collections")
+
+
+class ActionOutput(OutputBase):
+    collection_name: str = Field(..., description="Name of the collection searched")
+    groups: list = Field(..., description="Groups with their id (the group_by value) and best points, best group first")
+    groups_count: int = Field(..., description="Number of groups returned")
+    success: bool = Field(..., description="Whether the search was successful")
+    message: str = Field(..., description="Status message")
+
+
+def _payload_selector(tenant: Optional[str], with_payload: Union[bool, list]) -> Union[bool, list]:
+    # shared collections need the original id key to map points back to the room's ids
+    if tenant is None or with_payload is True:
+        return with_payload
+    return [*(with_payload or []), ORIGINAL_ID_KEY]
+
+
+def search_groups(
+    config: CustomAddonConfig,
+    collection_name: str,
+    query_vector: list,
+    group_by: str,
+    limit: int = 5,
+    group_size: int = 1,
+    score_threshold: float = None,
+    query_filter: dict = None,
+    with_payload: Union[bool, list] = True,
+    shard_key: Union[str, int, list] = None
+) -> ActionResponse:
+    logger.debug("Searching collection: {} grouped by '{}' with limit: {}", collection_name, group_by, limit)
+
+    try:
+        request = ActionInput(
+            collection_name=collection_name,
+            query_vector=query_vector,
+            group_by=group_by,
+            limit=limit,
+            group_size=group_size,
+            score_threshold=score_threshold,
+            query_filter=query_filter,
+            with_payload=with_payload,
+            shard_key=shard_key
+        )
+        if preprocessing_enabled(config):
+            request.query_vector = preprocess(config, request.query_vector, for_query=True)[0].tolist()
+
+        physical_name, tenant = resolve_collection(config, collection_name)
+        scoped_filter = tenant_filter(config, tenant, request.query_filter)
+
+        search_params = {
+            "collection_name": physical_name,
+            "query_vector": request.query_vector,
+            "group_by": request.group_by,
+            "limit": request.limit,
+            "group_size": request.group_size,
+            "with_payload": _payload_selector(tenant, request.with_payload)
+        }
+
+        if request.score_threshold is not None:
+            search_params["score_threshold"] = request.score_threshold
+
+        if scoped_filter:
+            search_params["query_filter"] = Filter(**scoped_filter)
+
+        if request.shard_key is not None:
+            search_params["shard_key_selector"] = request.shard_key
+
+        groups = []
+        for group in pool_read(config, lambda client: client.search_groups(**search_params)).groups:
+            hits = []
+            for hit in group.hits:
+                point_id, payload = restore_point(config, tenant, hit.id, hit.payload)
+                hits.append({
+                    "id": point_id,
+                    "score": hit.score,
+                    "payload": payload if request.with_payload is not False else None
+                })
+            groups.append({"id": group.id, "hits": hits})
+
+        logger.debug("Found {} groups in collection '{}'", len(groups), collection_name)
+
+        tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
+        output = ActionOutput(
+            collection_name=collection_name,
+            groups=groups,
+            groups_count=len(groups),
+            success=True,
+            message=f"Found {len(groups)} groups"
+        )
+
+        return ActionResponse(
+            output=output,
+            tokens=tokens,
+            message="Grouped search completed successfully",
+            code=200
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to search groups: {str(e)}")
+
+        tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
+        output = ActionOutput(
+            collection_name=collection_name,
+            groups=[],
+            groups_count=0,
+            success=False,
+            message=f"Error: {str(e)}"
+        )
+
+        return ActionResponse(
+            output=output,
+            tokens=tokens,
+            message=f"Failed to search groups: {str(e)}",
+            code=500
+        )
@@ -1,10 +1,23 @@
-from typing import Optional
+import base64
+import hashlib
+import json
+import time
+from typing import Optional, Union
 
 from loguru import logger
 from pydantic import BaseModel, Field
 from qdrant_client import QdrantClient
+from qdrant_client.models import Filter, QuantizationSearchParams, SearchParams, VectorParams
 
 from qdrant_rooms_pkg.configuration import CustomAddonConfig
+from qdrant_rooms_pkg.services.adaptive_ef import ef_controller
+from qdrant_rooms_pkg.services.endpoints import get_pool, pool_read
+from qdrant_rooms_pkg.services.semantic_cache import semantic_cache
+from qdrant_rooms_pkg.services.singleflight import SingleFlight
+from qdrant_rooms_pkg.services.tenancy import resolve_collection, restore_point, tenant_filter
+from qdrant_rooms_pkg.storage.hot_tier import SUPPORTED_DISTANCES, CollectionMirror, hot_tier
+from qdrant_rooms_pkg.utils.log import SampledLog
+from qdrant_rooms_pkg.utils.vectors import preprocess, preprocessing_enabled
 
 from .base import ActionResponse, OutputBase, TokensSchema
 
@@ -14,71 +27,271 @@ class ActionInput(BaseModel):
     query_vector: list = Field(..., description="Query vector to search for similar points")
     limit: int = Field(5, description="Maximum number of results to return")
     score_threshold: Optional[float] = Field(None, description="Minimum score threshold for results")
+    query_filter: Optional[dict] = Field(None, description="Qdrant filter (must/should/must_not conditions) applied to the search")
+    shard_key: Optional[Union[str, int, list]] = Field(None, description="Shard key(s) to search in custom-sharded collections")
+    hnsw_ef: Optional[int] = Field(None, description="Size of the HNSW candidate list, higher is more accurate and slower")
+    exact: Optional[bool] = Field(None, description="Search all vectors exactly instead of using the HNSW index")
+    indexed_only: Optional[bool] = Field(None, description="Skip segments whose index is still being built")
+    rescore: Optional[bool] = Field(None, description="Rescore quantized candidates with the original vectors")
+    oversampling: Optional[float] = Field(None, description="Fetch limit * oversampling quantized candidates before rescoring")
+    offset: int = Field(0, ge=0, description="Number of best results to skip")
+    cursor: Optional[str] = Field(None, description="next_cursor of the previous page, continues the same search")
 
 
 class ActionOutput(OutputBase):
     collection_name: str = Field(..., description="Name of the collection searched")
     results: list = Field(..., description="List of search results with id, score, and payload")
     results_count: int = Field(..., description="Number of results returned")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, absent on the last page")
     success: bool = Field(..., description="Whether the search was successful")
     message: str = Field(..., description="Status message")
 
 
+_search_flight = SingleFlight()
+_log_results = SampledLog("INFO", interval=1.0)
+
+
+def _signature(request: ActionInput) -> str:
+    return json.dumps(request.model_dump(exclude={"collection_name", "query_vector", "cursor"}), sort_keys=True, default=str)
+
+
+def _fingerprint(request: ActionInput) -> str:
+    # identifies the search a cursor belongs to, whatever page it points at
+    query = request.model_dump(exclude={"offset", "cursor"})
+    return hashlib.sha256(json.dumps(query, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def _encode_cursor(request: ActionInput, offset: int) -> str:
+    token = json.dumps({"offset": offset, "search": _fingerprint(request)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(token.encode()).decode()
+
+
+def _decode_cursor(request: ActionInput) -> int:
+    try:
+        token = json.loads(base64.urlsafe_b64decode(request.cursor.encode()))
+        offset, search = int(token["offset"]), token["search"]
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+    if search != _fingerprint(request):
+        raise ValueError("Cursor belongs to a different search")
+    return offset
+
+
+def _search(config: CustomAddonConfig, request: ActionInput) -> list:
+    physical_name, tenant = resolve_collection(config, request.collection_name)
+    query_filter = tenant_filter(config, tenant, request.query_filter)
+
+    search_params = {
+        "collection_name": physical_name,
+        "query_vector": request.query_vector,
+        "limit": request.limit
+    }
+
+    if request.offset:
+        search_params["offset"] = request.offset
+
+    if request.score_threshold is not None:
+        search_params["score_threshold"] = request.score_threshold
+
+    if query_filter:
+        search_params["query_filter"] = Filter(**query_filter)
+
+    if request.shard_key is not None:
+        search_params["shard_key_selector"] = request.shard_key
+
+    # the controller only steers searches that leave hnsw_ef to it
+    adaptive = config.adaptive_ef_enabled and request.hnsw_ef is None and not request.exact
+    hnsw_ef = request.hnsw_ef
+    if adaptive:
+        hnsw_ef = ef_controller.ef(config.endpoint_key(), request.collection_name,
+                                   config.adaptive_ef_min, config.adaptive_ef_max)
+
+    quantization = None
+    if request.rescore is not None or request.oversampling is not None:
+        quantization = QuantizationSearchParams(rescore=request.rescore, oversampling=request.oversampling)
+    if hnsw_ef is not None or request.exact is not None or request.indexed_only is not None or quantization:
+        search_params["search_params"] = SearchParams(
+            hnsw_ef=hnsw_ef,
+            exact=request.exact or False,
+            indexed_only=request.indexed_only or False,
+            quantization=quantization
+        )
+
+    results = []
+    started = time.perf_counter()
+    search_results = pool_read(config, lambda client: client.search(**search_params))
+    if adaptive:
+        ef_controller.observe(
+            config.endpoint_key(), request.collection_name, time.perf_counter() - started,
+            config.adaptive_ef_target_ms / 1000.0, config.adaptive_ef_min, config.adaptive_ef_max
+        )
+    for result in search_results:
+        point_id, payload = restore_point(config, tenant, result.id, result.payload)
+        results.append({
+            "id": point_id,
+            "score": result.score,
+            "payload": payload
+        })
+    return results
+
+
+def _load_hot_tier(config: CustomAddonConfig, endpoint: str, collection_name: str) -> Optional[CollectionMirror]:
+    return get_pool(config).read(lambda client: _mirror_collection(client, config, endpoint, collection_name))
+
+
+def _mirror_collection(client: QdrantClient, config: CustomAddonConfig, endpoint: str,
+                       collection_name: str) -> Optional[CollectionMirror]:
+    version = hot_tier.version(endpoint, collection_name)
+    physical_name, tenant = resolve_collection(config, collection_name)
+    room_filter = tenant_filter(config, tenant)
+    scroll_filter = Filter(**room_filter) if room_filter else None
+
+    info = client.get_collection(physical_name)
+    vectors_config = info.config.params.vectors
+    if tenant is None:
+        points_count = info.points_count or 0
+    else:
+        points_count = client.count(physical_name, count_filter=scroll_filter, exact=True).count
+
+    if (
+        not isinstance(vectors_config, VectorParams)
+        or vectors_config.distance.value not in SUPPORTED_DISTANCES
+        or points_count > config.hot_tier_max_points
+    ):
+        hot_tier.mark_oversized(endpoint, collection_name)
+        return None
+
+    records = []
+    offset = None
+    while True:
+        batch, offset = client.scroll(
+            collection_name=physical_name,
+            scroll_filter=scroll_filter,
+            limit=1000,
+            offset=offset,
+            with_payload=True,
+            with_vectors=True
+        )
+        for record in batch:
+            record.id, record.payload = restore_point(config, tenant, record.id, record.payload)
+        records.extend(batch)
+        if len(records) > config.hot_tier_max_points:
+            hot_tier.mark_oversized(endpoint, collection_name)
+            return None
+        if offset is None:
+            break
+
+    return hot_tier.load(endpoint, collection_name, vectors_config.size, vectors_config.distance.value, records, version)
+
+
+def _hot_tier_search(config: CustomAddonConfig, endpoint: str, request: ActionInput) -> Optional[list]:
+    if request.query_filter or request.shard_key is not None:
+        return None
+
+    collection_name = request.collection_name
+    known, mirror = hot_tier.get(endpoint, collection_name, config.hot_tier_ttl)
+    if not known:
+        try:
+            mirror = _search_flight.do(
+                ("hot_tier", endpoint, collection_name),
+                lambda: _load_hot_tier(config, endpoint, collection_name)
+            )
+        except Exception as e:
+            logger.warning(f"Could not mirror collection '{collection_name}' in the hot tier: {e}")
+            return None
+    if mirror is None:
+        return None
+    return mirror.search(request.query_vector, request.offset + request.limit, request.score_threshold)[request.offset:]
+
+
 def search_points(
     config: CustomAddonConfig,
     collection_name: str,
     query_vector: list,
     limit: int = 5,
-    score_threshold: float = None
+    score_threshold: float = None,
+    query_filter: dict = None,
+    shard_key: Union[str, int, list] = None,
+    hnsw_ef: int = None,
+    exact: bool = None,
+    indexed_only: bool = None,
+    rescore: bool = None,
+    oversampling: float = None,
+    offset: int = 0,
+    cursor: str = None
 ) -> ActionResponse:
-    logger.debug(f"Searching collection: {collection_name} with limit: {limit}")
+    logger.debug("Searching collection: {} with limit: {}", collection_name, limit)
 
     try:
-        client_params = {}
-
-        if config.url:
-            client_params["url"] = config.url
-        elif config.host:
-            client_params["host"] = config.host
-            client_params["port"] = config.port
-
-        if config.prefer_grpc and config.grpc_port:
-            client_params["grpc_port"] = config.grpc_port
-            client_params["prefer_grpc"] = True
+        request = ActionInput(
+            collection_name=collection_name,
+            query_vector=query_vector,
+            limit=limit,
+            score_threshold=score_threshold,
+            query_filter=query_filter,
+            shard_key=shard_key,
+            hnsw_ef=hnsw_ef,
+            exact=exact,
+            indexed_only=indexed_only,
+            rescore=rescore,
+            oversampling=oversampling,
+            offset=offset,
+            cursor=cursor
+        )
+        if preprocessing_enabled(config):
+            query_vector = preprocess(config, request.query_vector, for_query=True)[0].tolist()
+            request.query_vector = query_vector
+        if request.cursor is not None:
+            if request.offset:
+                raise ValueError("Use either offset or cursor, not both")
+            request.offset = _decode_cursor(request)
+        endpoint = config.endpoint_key()
+        signature = _signature(request)
 
-        if "qdrant_api_key" in config.secrets and config.secrets["qdrant_api_key"]:
-            client_params["api_key"] = config.secrets["qdrant_api_key"]
+        # every write bumps the generation, so searches started before a write are never joined after it
+        generation = semantic_cache.generation(endpoint, collection_name)
 
-        client_params["timeout"] = config.timeout
+        results = None
+        if config.semantic_cache_enabled:
+            results = semantic_cache.lookup(
+                endpoint, collection_name, query_vector, signature, config.semantic_cache_epsilon
+            )
+            if results is not None:
+                logger.debug("Semantic cache hit for collection '{}'", collection_name)
 
-        client = QdrantClient(**client_params)
+        if results is None and config.hot_tier_enabled:
+            results = _hot_tier_search(config, endpoint, request)
+            if results is not None:
+                logger.debug("Hot tier answered search in collection '{}'", collection_name)
 
-        search_params = {
-            "collection_name": collection_name,
-            "query_vector": query_vector,
-            "limit": limit
-        }
+        if results is None:
+            if config.search_singleflight:
+                key = (endpoint, collection_name, generation, tuple(query_vector), signature)
+                search_results = _search_flight.do(key, lambda: _search(config, request))
+            else:
+                search_results = _search(config, request)
 
-        if score_threshold is not None:
-            search_params["score_threshold"] = score_threshold
+            results = [dict(result) for result in search_results]
 
-        search_results = client.search(**search_params)
+            if config.semantic_cache_enabled:
+                semantic_cache.store(
+                    endpoint, collection_name, query_vector, signature, results,
+                    capacity=config.semantic_cache_size, generation=generation
+                )
 
-        results = []
-        for result in search_results:
-            results.append({
-                "id": result.id,
-                "score": result.score,
-                "payload": result.payload
-            })
+        _log_results("Found {} results in collection '{}'", len(results), collection_name)
 
-        logger.info(f"Found {len(results)} results in collection '{collection_name}'")
+        # a full page may be followed by more results, a short one is the last
+        next_cursor = None
+        if results and len(results) == request.limit:
+            next_cursor = _encode_cursor(request, request.offset + request.limit)
 
         tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
         output = ActionOutput(
             collection_name=collection_name,
             results=results,
             results_count=len(results),
+            next_cursor=next_cursor,
             success=True,
             message=f"Found {len(results)} results"
         )
@@ -1,10 +1,18 @@
+import uuid
+from typing import Optional, Union
 
 from loguru import logger
 from pydantic import BaseModel, Field
-from qdrant_client import QdrantClient
-from qdrant_client.models import PointStruct
+from qdrant_client.models import PointStruct, UpdateResult
 
 from qdrant_rooms_pkg.configuration import CustomAddonConfig
+from qdrant_rooms_pkg.services.endpoints import get_client
+from qdrant_rooms_pkg.services.operations import operation_tracker
+from qdrant_rooms_pkg.services.semantic_cache import semantic_cache
+from qdrant_rooms_pkg.services.tenancy import resolve_collection, stamp_point
+from qdrant_rooms_pkg.storage.hot_tier import hot_tier
+from qdrant_rooms_pkg.storage.spool import get_spool
+from qdrant_rooms_pkg.utils.vectors import preprocess_points
 
 from .base import ActionResponse, OutputBase, TokensSchema
 
@@ -12,62 +20,112 @@ from .base import ActionResponse, OutputBase, TokensSchema
 class ActionInput(BaseModel):
     collection_name: str = Field(..., description="Name of the collection to insert points into")
     points: list = Field(..., description="List of points with id, vector, and optional payload")
+    shard_key: Optional[Union[str, int, list]] = Field(None, description="Shard key(s) to write to in custom-sharded collections")
+    wait: bool = Field(True, description="Wait until the write is applied before returning; spooled writes return once they are on local disk")
 
 
 class ActionOutput(OutputBase):
     collection_name: str = Field(..., description="Name of the collection")
     points_count: int = Field(..., description="Number of points upserted")
+    operation_id: Optional[int] = Field(None, description="Qdrant operation id of the write")
+    status: Optional[str] = Field(None, description="'completed', 'acknowledged' when not waiting, or 'spooled' when written to the local spool")
     success: bool = Field(..., description="Whether the upsert was successful")
     message: str = Field(..., description="Status message")
 
 
-def upsert_points(
-    config: CustomAddonConfig,
-    collection_name: str,
-    points: list
-) -> ActionResponse:
-    logger.debug(f"Upserting {len(points)} points to collection: {collection_name}")
+def _point_structs(config: CustomAddonConfig, tenant: Optional[str], points: list) -> list:
+    point_structs = []
+    for point in points:
+        point = stamp_point(config, tenant, point)
+        point_struct = PointStruct(
+            id=point.get("id"),
+            vector=point.get("vector"),
+            payload=point.get("payload", {})
+        )
+        point_structs.append(point_struct)
+    return point_structs
 
-    try:
-        client_params = {}
 
-        if config.url:
-            client_params["url"] = config.url
-        elif config.host:
-            client_params["host"] = config.host
-            client_params["port"] = config.port
+def _spoolable_points(config: CustomAddonConfig, collection_name: str, points: list) -> list:
+    """
+    Points as they will be replayed, checked now: a spooled upsert that Qdrant
+    rejects could only be reported on replay, long after returning "spooled".
+    """
+    points = [point if point.get("id") is not None else {**point, "id": str(uuid.uuid4())} for point in points]
+    points = preprocess_points(config, points)
+    _, tenant = resolve_collection(config, collection_name)
+    _point_structs(config, tenant, points)
+    return points
 
-        if config.prefer_grpc and config.grpc_port:
-            client_params["grpc_port"] = config.grpc_port
-            client_params["prefer_grpc"] = True
 
-        if "qdrant_api_key" in config.secrets and config.secrets["qdrant_api_key"]:
-            client_params["api_key"] = config.secrets["qdrant_api_key"]
+def write_points(
+    config: CustomAddonConfig,
+    collection_name: str,
+    points: list,
+    shard_key: Union[str, int, list] = None,
+    wait: bool = True
+) -> UpdateResult:
+    """Upsert ``points`` straight into Qdrant, bypassing the write spool."""
+    client = get_client(config)
+    points = preprocess_points(config, points)
+
+    physical_name, tenant = resolve_collection(config, collection_name)
+    point_structs = _point_structs(config, tenant, points)
+
+    result = client.upsert(
+        collection_name=physical_name,
+        points=point_structs,
+        wait=wait,
+        shard_key_selector=shard_key
+    )
+    if not wait:
+        operation_tracker.track(config.endpoint_key(), physical_name, collection_name, result.operation_id)
+    semantic_cache.invalidate(config.endpoint_key(), collection_name)
+    hot_tier.upsert(config.endpoint_key(), collection_name, points, config.hot_tier_max_points)
+    return result
 
-        client_params["timeout"] = config.timeout
 
-        client = QdrantClient(**client_params)
+def upsert_points(
+    config: CustomAddonConfig,
+    collection_name: str,
+    points: list,
+    shard_key: Union[str, int, list] = None,
+    wait: bool = True
+) -> ActionResponse:
+    logger.debug("Upserting {} points to collection: {}", len(points), collection_name)
 
-        point_structs = []
-        for point in points:
-            point_struct = PointStruct(
-                id=point.get("id"),
-                vector=point.get("vector"),
-                payload=point.get("payload", {})
+    try:
+        if config.spool_enabled:
+            # `wait` does not apply: the write is acknowledged once it is in the spool
+            points = _spoolable_points(config, collection_name, points)
+            seq = get_spool(config).append(collection_name, points, shard_key)
+            logger.info("Spooled {} points for collection '{}' as write {}", len(points), collection_name, seq)
+
+            tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
+            output = ActionOutput(
+                collection_name=collection_name,
+                points_count=len(points),
+                status="spooled",
+                success=True,
+                message=f"Spooled {len(points)} points"
+            )
+            return ActionResponse(
+                output=output,
+                tokens=tokens,
+                message="Points spooled successfully",
+                code=200
             )
-            point_structs.append(point_struct)
 
-        client.upsert(
-            collection_name=collection_name,
-            points=point_structs
-        )
+        result = write_points(config, collection_name, points, shard_key, wait)
 
-        logger.info(f"Successfully upserted {len(points)} points to collection '{collection_name}'")
+        logger.info("Successfully upserted {} points to collection '{}'", len(points), collection_name)
 
         tokens = TokensSchema(stepAmount=0, totalCurrentAmount=0)
         output = ActionOutput(
             collection_name=collection_name,
             points_count=len(points),
+            operation_id=result.operation_id,
+            status=result.status.value,
             success=True,
             message=f"Successfully upserted {len(points)} points"
         )
@@ -1,13 +1,9 @@
 import importlib
+from functools import cached_property
 
-from loguru import logger
-
-from .actions.create_collection import create_collection
-from .actions.delete_collection import delete_collection
-from .actions.search_points import search_points
-from .actions.upsert_points import upsert_points
 from .services.credentials import CredentialsRegistry
 from .tools.base import ToolRegistry
+from .utils.log import AddonLogger
 
 
 class QdrantRoomsAddon:
@@ -27,35 +23,18 @@ class QdrantRoomsAddon:
         self.observer_callback = None
         self.addon_id = None
 
-    @property
-    def logger(self):
-        """Custom logger that prefixes all messages with addon type"""
-        class PrefixedLogger:
-            def __init__(self, addon_type):
-                self.addon_type = addon_type
-                self._logger = logger
-
-            def debug(self, message):
-                self._logger.debug(f"[TYPE: {self.addon_type.upper()}] {message}")
-
-            def info(self, message):
-                self._logger.info(f"[TYPE: {self.addon_type.upper()}] {message}")
-
-            def warning(self, message):
-                self._logger.warning(f"[TYPE: {self.addon_type.upper()}] {message}")
-
-            def error(self, message):
-                self._logger.error(f"[TYPE: {self.addon_type.upper()}] {message}")
-
-        return PrefixedLogger(self.type)
+    @cached_property
+    def logger(self) -> AddonLogger:
+        """Logger that prefixes all messages with the addon type, built once per addon"""
+        return AddonLogger(self.type)
 
     def loadTools(self, tool_functions, tool_descriptions=None, tool_max_retries=None):
-        self.logger.debug(f"Tool functions provided: {list(tool_functions.keys())}")
-        self.logger.debug(f"Tool descriptions provided: {tool_descriptions}")
-        self.logger.debug(f"Tool max retries provided: {tool_max_retries}")
+        self.logger.debug("Tool functions provided: {}", list(tool_functions))
+        self.logger.debug("Tool descriptions provided: {}", tool_descriptions)
+        self.logger.debug("Tool max retries provided: {}", tool_max_retries)
         self.tool_registry.register_tools(tool_functions, tool_descriptions, tool_max_retries)
         registered_tools = self.tool_registry.get_tools_for_action()
-        self.logger.info(f"Successfully registered {len(registered_tools)} tools: {list(registered_tools.keys())}")
+        self.logger.info("Successfully registered {} tools: {}", len(registered_tools), list(registered_tools))
 
     def getTools(self):
         return self.tool_registry.get_tools_for_action()
@@ -67,16 +46,79 @@ class QdrantRoomsAddon:
         self.observer_callback = callback
         self.addon_id = addon_id
 
-    def create_collection(self, collection_name: str, vector_size: int, distance: str = "Cosine", if_exists: str = "error") -> dict:
-        return create_collection(self.config, collection_name=collection_name, vector_size=vector_size, distance=distance, if_exists=if_exists)
-
-    def upsert_points(self, collection_name: str, points: list) -> dict:
-        return upsert_points(self.config, collection_name=collection_name, points=points)
-
-    def search_points(self, collection_name: str, query_vector: list, limit: int = 5, score_threshold: float = None) -> dict:
-        return search_points(self.config, collection_name=collection_name, query_vector=query_vector, limit=limit, score_threshold=score_threshold)
+    # actions, and qdrant_client with them, are imported on first use so that
+    # constructing the addon and registering tools stays cheap on cold start
+    def create_collection(self, collection_name: str, vector_size: int, distance: str = "Cosine", if_exists: str = "error",
+                          shard_number: int = None, replication_factor: int = None, write_consistency_factor: int = None,
+                          sharding_method: str = "auto", shard_keys: list = None, datatype: str = None) -> dict:
+        from .actions.create_collection import create_collection
+        return create_collection(self.config, collection_name=collection_name, vector_size=vector_size, distance=distance, if_exists=if_exists,
+                                 shard_number=shard_number, replication_factor=replication_factor, write_consistency_factor=write_consistency_factor,
+                                 sharding_method=sharding_method, shard_keys=shard_keys, datatype=datatype)
+
+    def upsert_points(self, collection_name: str, points: list, shard_key=None, wait: bool = True) -> dict:
+        from .actions.upsert_points import upsert_points
+        return upsert_points(self.config, collection_name=collection_name, points=points, shard_key=shard_key, wait=wait)
+
+    def search_points(self, collection_name: str, query_vector: list, limit: int = 5, score_threshold: float = None, query_filter: dict = None, shard_key=None,
+                      hnsw_ef: int = None, exact: bool = None, indexed_only: bool = None, rescore: bool = None, oversampling: float = None,
+                      offset: int = 0, cursor: str = None) -> dict:
+        from .actions.search_points import search_points
+        return search_points(self.config, collection_name=collection_name, query_vector=query_vector, limit=limit, score_threshold=score_threshold,
+                             query_filter=query_filter, shard_key=shard_key, hnsw_ef=hnsw_ef, exact=exact, indexed_only=indexed_only,
+                             rescore=rescore, oversampling=oversampling, offset=offset, cursor=cursor)
+
+    def search_groups(self, collection_name: str, query_vector: list, group_by: str, limit: int = 5, group_size: int = 1, score_threshold: float = None,
+                      query_filter: dict = None, with_payload=True, shard_key=None) -> dict:
+        from .actions.search_groups import search_groups
+        return search_groups(self.config, collection_name=collection_name, query_vector=query_vector, group_by=group_by, limit=limit,
+                             group_size=group_size, score_threshold=score_threshold, query_filter=query_filter, with_payload=with_payload,
+                             shard_key=shard_key)
+
+    def search_collections(self, collection_names: list, query_vector: list, limit: int = 5, score_threshold: float = None, query_filter: dict = None,
+                           normalization: str = "none") -> dict:
+        from .actions.search_collections import search_collections
+        return search_collections(self.config, collection_names=collection_names, query_vector=query_vector, limit=limit,
+                                  score_threshold=score_threshold, query_filter=query_filter, normalization=normalization)
+
+    def recommend_points(self, collection_name: str, positive: list, negative: list = None, strategy: str = None, limit: int = 5,
+                         score_threshold: float = None, query_filter: dict = None, shard_key=None) -> dict:
+        from .actions.recommend_points import recommend_points
+        return recommend_points(self.config, collection_name=collection_name, positive=positive, negative=negative, strategy=strategy,
+                                limit=limit, score_threshold=score_threshold, query_filter=query_filter, shard_key=shard_key)
+
+    def batch_update(self, collection_name: str, operations: list, wait: bool = True) -> dict:
+        from .actions.batch_update import batch_update
+        return batch_update(self.config, collection_name=collection_name, operations=operations, wait=wait)
+
+    def await_operations(self, collection_name: str, operation_ids: list = None) -> dict:
+        from .actions.await_operations import await_operations
+        return await_operations(self.config, collection_name=collection_name, operation_ids=operation_ids)
+
+    def delete_points(self, collection_name: str, ids: list = None, query_filter: dict = None, wait: bool = True, shard_key=None) -> dict:
+        from .actions.delete_points import delete_points
+        return delete_points(self.config, collection_name=collection_name, ids=ids, query_filter=query_filter, wait=wait, shard_key=shard_key)
+
+    def set_payload(self, collection_name: str, payload: dict, ids: list = None, query_filter: dict = None, key: str = None,
+                    wait: bool = True, shard_key=None) -> dict:
+        from .actions.set_payload import set_payload
+        return set_payload(self.config, collection_name=collection_name, payload=payload, ids=ids, query_filter=query_filter, key=key,
+                           wait=wait, shard_key=shard_key)
+
+    def overwrite_payload(self, collection_name: str, payload: dict, ids: list = None, query_filter: dict = None,
+                          wait: bool = True, shard_key=None) -> dict:
+        from .actions.overwrite_payload import overwrite_payload
+        return overwrite_payload(self.config, collection_name=collection_name, payload=payload, ids=ids, query_filter=query_filter,
+                                 wait=wait, shard_key=shard_key)
+
+    def delete_payload_keys(self, collection_name: str, keys: list, ids: list = None, query_filter: dict = None,
+                            wait: bool = True, shard_key=None) -> dict:
+        from .actions.delete_payload_keys import delete_payload_keys
+        return delete_payload_keys(self.config, collection_name=collection_name, keys=keys, ids=ids, query_filter=query_filter,
+                                   wait=wait, shard_key=shard_key)
 
     def delete_collection(self, collection_name: str) -> dict:
+        from .actions.delete_collection import delete_collection
         return delete_collection(self.config, collection_name=collection_name)
 
     def test(self) -> bool:
@@ -170,7 +212,8 @@ class QdrantRoomsAddon:
             bool: True if credentials are loaded successfully, False otherwise
         """
         self.logger.debug("Loading credentials...")
-        self.logger.debug(f"Received credentials: {kwargs}")
+        # names only, values are secrets
+        self.logger.debug("Received credentials: {}", sorted(kwargs))
         try:
             if self.config and hasattr(self.config, 'secrets'):
                 required_secrets = list(self.config.secrets.keys())
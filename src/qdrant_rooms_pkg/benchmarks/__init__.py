@@ -0,0 +1 @@
+# do not remove, required for package imports
@@ -0,0 +1,177 @@
+"""
+Replay a recorded workload of addon action calls and report how it performed::
+
+    python -m qdrant_rooms_pkg.benchmarks.replay workload.jsonl --location :memory: --speed 2 --concurrency 16
+
+The workload is JSON lines, one action call per line::
+
+    {"ts": 1718000000.25, "action": "search_points", "parameters": {"collection_name": "docs", "query_vector": [0.1, 0.2]}}
+
+``ts`` is in seconds; only the gaps between calls matter. Calls are issued at
+their recorded offsets divided by ``--speed`` (``--speed 0`` sends them as fast
+as the workers allow) on ``--concurrency`` worker threads of one
+``QdrantRoomsAddon``. Latency is measured from the time a call was scheduled,
+so queueing behind busy workers counts towards it instead of silently lowering
+the offered load.
+
+``--location :memory:`` (or a directory) runs against an embedded Qdrant, so a
+workload that creates its collections can be replayed without a server. The
+embedded engine is not thread-safe, so such runs use a single worker and are
+only good for checking a workload and its single-client latencies; ``--url``
+targets a local or test deployment for concurrent runs.
+"""
+import argparse
+import importlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+
+from qdrant_rooms_pkg.addon import QdrantRoomsAddon
+
+
+def load_workload(path) -> list[dict]:
+    """Recorded calls sorted by time, with ``ts`` rebased to start at 0."""
+    calls = []
+    with open(path) as workload:
+        for number, line in enumerate(workload, 1):
+            if not line.strip():
+                continue
+            call = json.loads(line)
+            if "action" not in call or "ts" not in call:
+                raise ValueError(f"Line {number}: a call needs 'ts' and 'action'")
+            calls.append({"ts": float(call["ts"]), "action": call["action"], "parameters": call.get("parameters", {})})
+
+    calls.sort(key=lambda call: call["ts"])
+    if calls:
+        start = calls[0]["ts"]
+        for call in calls:
+            call["ts"] -= start
+    return calls
+
+
+class _Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: dict[str, list] = {}
+        self.errors: dict[str, int] = {}
+
+    def record(self, action: str, latency: float, failed: bool) -> None:
+        with self._lock:
+            self.latencies.setdefault(action, []).append(latency)
+            self.errors[action] = self.errors.get(action, 0) + failed
+
+
+def _call(addon: QdrantRoomsAddon, call: dict, scheduled: float, recorder: _Recorder) -> None:
+    try:
+        response = getattr(addon, call["action"])(**call["parameters"])
+        failed = getattr(response, "code", 200) != 200
+    except Exception as e:
+        logger.warning("Replayed {} call raised: {}", call["action"], e)
+        failed = True
+    recorder.record(call["action"], time.perf_counter() - scheduled, failed)
+
+
+def replay(addon: QdrantRoomsAddon, calls: list[dict], speed: float = 1.0, concurrency: int = 8) -> dict:
+    """Issue ``calls`` against ``addon`` on their recorded schedule and return the report."""
+    # the addon imports actions on first use; doing it here keeps import time out of the
+    # latencies and keeps worker threads from importing the same modules concurrently
+    action_module = importlib.import_module("qdrant_rooms_pkg.actions")
+
+    # only actions are replayed, not other addon methods such as loadAddonConfig or test
+    unknown = sorted({call["action"] for call in calls if call["action"] not in action_module.__all__})
+    if unknown:
+        raise ValueError(f"Unknown actions: {', '.join(unknown)}")
+
+    recorder = _Recorder()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="qdrant-replay") as executor:
+        for call in calls:
+            scheduled = started + call["ts"] / speed if speed > 0 else time.perf_counter()
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(_call, addon, call, scheduled, recorder)
+    duration = time.perf_counter() - started
+
+    actions = {}
+    for action, latencies in sorted(recorder.latencies.items()):
+        samples = np.array(latencies) * 1000
+        errors = recorder.errors[action]
+        actions[action] = {
+            "calls": len(latencies),
+            "errors": errors,
+            "error_rate": errors / len(latencies),
+            "p50_ms": float(np.percentile(samples, 50)),
+            "p95_ms": float(np.percentile(samples, 95)),
+            "p99_ms": float(np.percentile(samples, 99)),
+            "max_ms": float(samples.max()),
+        }
+
+    total_errors = sum(recorder.errors.values())
+    return {
+        "calls": len(calls),
+        "duration_s": duration,
+        "throughput_per_s": len(calls) / duration if duration else 0.0,
+        "error_rate": total_errors / len(calls) if calls else 0.0,
+        "actions": actions,
+    }
+
+
+def main(argv: Optional[list] = None) -> dict:
+    parser = argparse.ArgumentParser(description="Replay a recorded addon workload and report throughput, latency and errors")
+    parser.add_argument("workload", type=Path)
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", default=None)
+    target.add_argument("--location", default=None, help="Embedded Qdrant: ':memory:' or a directory")
+    parser.add_argument("--api-key", default=None)
+    parser.add_argument("--prefer-grpc", action="store_true")
+    parser.add_argument("--speed", type=float, default=1.0, help="Rate multiplier, 0 for as fast as possible")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--config", type=Path, default=None, help="JSON file with extra addon configuration fields")
+    args = parser.parse_args(argv)
+
+    addon_config = {
+        "id": "workload-replay",
+        "type": "storage",
+        "name": "Workload replay",
+        "prefer_grpc": args.prefer_grpc,
+        "secrets": {"qdrant_api_key": args.api_key} if args.api_key else {},
+    }
+    if args.config is not None:
+        addon_config.update(json.loads(args.config.read_text()))
+    if args.url or args.location:
+        addon_config["url"] = args.url
+        addon_config["location"] = args.location
+    elif not any(addon_config.get(key) for key in ("url", "host", "location")):
+        addon_config["url"] = "http://localhost:6333"
+
+    concurrency = args.concurrency
+    if addon_config.get("location") and concurrency > 1:
+        logger.warning("Embedded Qdrant is not thread-safe, replaying with one worker")
+        concurrency = 1
+
+    addon = QdrantRoomsAddon()
+    if not addon.loadAddonConfig(addon_config):
+        raise SystemExit("Invalid addon configuration")
+
+    report = replay(addon, load_workload(args.workload), args.speed, concurrency)
+
+    print(f"{report['calls']} calls in {report['duration_s']:.2f}s: {report['throughput_per_s']:.1f} calls/s, "
+          f"{report['error_rate']:.2%} errors")
+    columns = ["calls", "error_rate", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+    print(f"{'action':<22}" + "".join(f"{column:>12}" for column in columns))
+    for action, stats in report["actions"].items():
+        print(f"{action:<22}" + "".join(
+            f"{stats[column]:>12}" if column == "calls" else f"{stats[column]:>12.2f}" for column in columns
+        ))
+    return report
+
+
+if __name__ == "__main__":
+    main()
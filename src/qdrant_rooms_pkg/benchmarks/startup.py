@@ -0,0 +1,78 @@
+"""
+Cold-start cost of the package, measured in fresh interpreters::
+
+    python -m qdrant_rooms_pkg.benchmarks.startup --runs 20
+
+Each run starts a new Python process, times ``import qdrant_rooms_pkg`` and
+then importing the addon module and constructing ``QdrantRoomsAddon``, and
+records which heavy dependencies were loaded along the way. None of them
+should be until an action runs.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+HEAVY_MODULES = ["qdrant_client", "grpc", "httpx", "numpy"]
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import qdrant_rooms_pkg
+imported = time.perf_counter()
+from qdrant_rooms_pkg.addon import QdrantRoomsAddon
+QdrantRoomsAddon()
+constructed = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "addon_ms": (constructed - imported) * 1000,
+    "loaded": [name for name in %r if name in sys.modules],
+}))
+"""
+
+
+def probe(python: str = sys.executable) -> dict:
+    """Run one cold start in a fresh interpreter."""
+    package_root = str(Path(__file__).resolve().parents[2])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+    output = subprocess.run(
+        [python, "-c", _PROBE % (HEAVY_MODULES,)],
+        capture_output=True, text=True, check=True, env=env
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure_startup(runs: int = 10, python: str = sys.executable) -> dict:
+    samples = [probe(python) for _ in range(runs)]
+    import_ms = [sample["import_ms"] for sample in samples]
+    addon_ms = [sample["addon_ms"] for sample in samples]
+    return {
+        "runs": runs,
+        "import_median_ms": statistics.median(import_ms),
+        "import_max_ms": max(import_ms),
+        "addon_median_ms": statistics.median(addon_ms),
+        "addon_max_ms": max(addon_ms),
+        "loaded": sorted({name for sample in samples for name in sample["loaded"]}),
+    }
+
+
+def main(argv: Optional[list] = None) -> dict:
+    parser = argparse.ArgumentParser(description="Measure cold-start import and addon construction time")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--python", default=sys.executable)
+    args = parser.parse_args(argv)
+
+    report = measure_startup(args.runs, args.python)
+    print(f"import qdrant_rooms_pkg     median {report['import_median_ms']:8.2f} ms   max {report['import_max_ms']:8.2f} ms")
+    print(f"QdrantRoomsAddon()          median {report['addon_median_ms']:8.2f} ms   max {report['addon_max_ms']:8.2f} ms")
+    print(f"heavy modules loaded        {', '.join(report['loaded']) or 'none'}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+REST vs gRPC comparison for an upsert/search workload.
+
+Runs the same workload once per transport against a Qdrant server, each in its
+own temporary collection, and reports throughput, search latency percentiles
+and payload bytes sent and received::
+
+    python -m qdrant_rooms_pkg.benchmarks.transport --url http://localhost:6333 --points 20000 --dim 384
+
+Byte counts are uncompressed message sizes: the HTTP bodies for REST and the
+serialized protobuf messages for gRPC, without framing and headers. They do not
+change with ``--grpc-compression``, which only shows in throughput and latency.
+gRPC messages are counted by a client interceptor on the channel qdrant_client
+opens.
+"""
+import argparse
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Optional
+
+import grpc
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from qdrant_rooms_pkg.configuration import CustomAddonConfig
+from qdrant_rooms_pkg.services.endpoints import build_client_params
+
+
+class WireCounter:
+    def __init__(self):
+        self.sent = 0
+        self.received = 0
+
+    def on_request(self, request) -> None:
+        self.sent += len(request.content)
+
+    def on_response(self, response) -> None:
+        # the decoded body, so a gzip-encoded response counts like the gRPC messages
+        response.read()
+        self.received += len(response.content)
+
+
+class _CountingInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """Adds up serialized request and response sizes of unary gRPC calls."""
+
+    def __init__(self, counter: WireCounter):
+        self._counter = counter
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        self._counter.sent += request.ByteSize()
+        outcome = continuation(client_call_details, request)
+        if outcome.exception() is None:
+            self._counter.received += outcome.result().ByteSize()
+        return outcome
+
+
+@contextmanager
+def counting_grpc_channels(counter: WireCounter):
+    """Intercept the gRPC channels qdrant_client opens while the context is active."""
+    from qdrant_client import qdrant_remote
+
+    # fails loudly, rather than counting nothing, if qdrant_client stops opening channels here
+    open_channel = qdrant_remote.get_channel
+
+    def get_channel(*args, **kwargs):
+        return grpc.intercept_channel(open_channel(*args, **kwargs), _CountingInterceptor(counter))
+
+    qdrant_remote.get_channel = get_channel
+    try:
+        yield
+    finally:
+        qdrant_remote.get_channel = open_channel
+
+
+def build_client(config: CustomAddonConfig, transport: str, counter: WireCounter) -> QdrantClient:
+    transport_config = config.model_copy(update={"prefer_grpc": transport == "grpc"})
+    params = build_client_params(transport_config, config.url)
+
+    if transport == "rest":
+        return QdrantClient(**params, event_hooks={"request": [counter.on_request], "response": [counter.on_response]})
+    # gRPC bytes are counted by the channel, see counting_grpc_channels
+    return QdrantClient(**params)
+
+
+def _percentile(samples: list, percentile: float) -> float:
+    return float(np.percentile(samples, percentile)) * 1000 if samples else 0.0
+
+
+def run_workload(client: QdrantClient, collection_name: str, vectors: np.ndarray, queries: np.ndarray,
+                 batch_size: int = 256, limit: int = 10) -> dict:
+    started = time.perf_counter()
+    for start in range(0, len(vectors), batch_size):
+        batch = vectors[start:start + batch_size]
+        client.upsert(
+            collection_name=collection_name,
+            points=[
+                PointStruct(id=start + offset, vector=vector.tolist(), payload={"position": start + offset})
+                for offset, vector in enumerate(batch)
+            ]
+        )
+    upsert_seconds = time.perf_counter() - started
+
+    latencies = []
+    started = time.perf_counter()
+    for query in queries:
+        query_started = time.perf_counter()
+        client.search(collection_name=collection_name, query_vector=query.tolist(), limit=limit)
+        latencies.append(time.perf_counter() - query_started)
+    search_seconds = time.perf_counter() - started
+
+    return {
+        "upsert_points_per_s": len(vectors) / upsert_seconds if upsert_seconds else 0.0,
+        "search_qps": len(queries) / search_seconds if search_seconds else 0.0,
+        "search_p50_ms": _percentile(latencies, 50),
+        "search_p95_ms": _percentile(latencies, 95),
+        "search_p99_ms": _percentile(latencies, 99),
+    }
+
+
+def benchmark_transport(config: CustomAddonConfig, transport: str, vectors: np.ndarray, queries: np.ndarray,
+                        batch_size: int, limit: int) -> dict:
+    counter = WireCounter()
+    with counting_grpc_channels(counter):
+        client = build_client(config, transport, counter)
+        collection_name = f"transport_bench_{transport}_{uuid.uuid4().hex[:8]}"
+        client.create_collection(
+            collection_name=collection_name,
+            vectors_config=VectorParams(size=vectors.shape[1], distance=Distance.COSINE)
+        )
+        try:
+            counter.sent = counter.received = 0
+            stats = run_workload(client, collection_name, vectors, queries, batch_size, limit)
+        finally:
+            client.delete_collection(collection_name=collection_name)
+            client.close()
+    if counter.sent == 0:
+        raise RuntimeError(f"No {transport} traffic was counted, the byte counts would be meaningless")
+
+    stats["sent_mb"] = counter.sent / 1024 / 1024
+    stats["received_mb"] = counter.received / 1024 / 1024
+    return stats
+
+
+def main(argv: Optional[list] = None) -> dict:
+    parser = argparse.ArgumentParser(description="Compare REST and gRPC throughput, latency and bytes on the wire")
+    parser.add_argument("--url", default="http://localhost:6333")
+    parser.add_argument("--grpc-port", type=int, default=6334)
+    parser.add_argument("--api-key", default=None)
+    parser.add_argument("--points", type=int, default=10000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--searches", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--grpc-compression", choices=["gzip", "none"], default=None)
+    parser.add_argument("--grpc-max-message-mb", type=int, default=None)
+    parser.add_argument("--grpc-keepalive-ms", type=int, default=None)
+    parser.add_argument("--transports", nargs="+", choices=["rest", "grpc"], default=["rest", "grpc"])
+    args = parser.parse_args(argv)
+
+    config = CustomAddonConfig(
+        id="transport-benchmark",
+        type="storage",
+        name="Transport benchmark",
+        url=args.url,
+        grpc_port=args.grpc_port,
+        grpc_compression=args.grpc_compression,
+        grpc_max_message_mb=args.grpc_max_message_mb,
+        grpc_keepalive_ms=args.grpc_keepalive_ms,
+        secrets={"qdrant_api_key": args.api_key} if args.api_key else {}
+    )
+
+    rng = np.random.default_rng(42)
+    vectors = rng.standard_normal((args.points, args.dim), dtype=np.float32)
+    queries = rng.standard_normal((args.searches, args.dim), dtype=np.float32)
+
+    report = {}
+    for transport in args.transports:
+        report[transport] = benchmark_transport(config, transport, vectors, queries, args.batch_size, args.limit)
+
+    columns = ["upsert_points_per_s", "search_qps", "search_p50_ms", "search_p95_ms", "search_p99_ms", "sent_mb", "received_mb"]
+    print(f"{'transport':<10}" + "".join(f"{column:>22}" for column in columns))
+    for transport, stats in report.items():
+        print(f"{transport:<10}" + "".join(f"{stats[column]:>22.2f}" for column in columns))
+    print("sent_mb and received_mb are uncompressed message sizes, --grpc-compression does not change them")
+    return report
+
+
+if __name__ == "__main__":
+    main()
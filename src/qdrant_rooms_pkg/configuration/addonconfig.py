@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import Field, model_validator
 
@@ -12,15 +12,103 @@ class CustomRequiredSecrets(RequiredSecretsBase):
 class CustomAddonConfig(BaseAddonConfig):
     url: Optional[str] = Field(None, description="Qdrant server URL (e.g., http://localhost:6333)")
     host: Optional[str] = Field(None, description="Qdrant server host (alternative to url)")
+    location: Optional[str] = Field(None, description="Embedded Qdrant instead of a server: ':memory:' or a local directory path")
     port: Optional[int] = Field(6333, description="Qdrant server port")
     grpc_port: Optional[int] = Field(6334, description="Qdrant gRPC port")
     prefer_grpc: bool = Field(False, description="Prefer gRPC for communication")
+    grpc_options: Optional[dict[str, Any]] = Field(None, description="Raw gRPC channel options, e.g. {'grpc.http2.max_pings_without_data': 0}")
+    grpc_compression: Optional[str] = Field(None, description="gRPC channel compression: 'gzip' or 'none'")
+    grpc_max_message_mb: Optional[int] = Field(None, description="Maximum gRPC send/receive message size in MB (unlimited by default)")
+    grpc_keepalive_ms: Optional[int] = Field(None, description="Interval between gRPC keepalive pings in milliseconds")
+    grpc_keepalive_timeout_ms: Optional[int] = Field(None, description="Time to wait for a gRPC keepalive ping acknowledgement in milliseconds")
     timeout: int = Field(60, description="Request timeout in seconds")
+    endpoints: Optional[list[str]] = Field(None, description="Additional Qdrant node URLs; reads are balanced across all nodes, writes go to the first")
+    read_routing: str = Field("round_robin", description="Read routing across endpoints: 'round_robin' or 'least_latency'")
+    endpoint_retry_after: float = Field(10.0, description="Seconds before an unhealthy endpoint is tried again")
+    hedge_enabled: bool = Field(False, description="Send a duplicate search to another endpoint when the first is slow")
+    hedge_delay_ms: Optional[float] = Field(None, description="Delay before hedging a search, defaults to the rolling p95 search latency")
+    hedge_budget: float = Field(0.05, description="Maximum fraction of searches that may be hedged")
+    search_singleflight: bool = Field(True, description="Collapse identical concurrent searches into a single Qdrant call")
+    adaptive_ef_enabled: bool = Field(False, description="Tune hnsw_ef per collection to keep search latency under adaptive_ef_target_ms")
+    adaptive_ef_target_ms: float = Field(50.0, description="Search latency target of the adaptive hnsw_ef controller in milliseconds")
+    adaptive_ef_min: int = Field(16, description="Lowest hnsw_ef the adaptive controller may use")
+    adaptive_ef_max: int = Field(256, description="Highest hnsw_ef the adaptive controller may use, and its starting value")
+    semantic_cache_enabled: bool = Field(False, description="Reuse search results for near-identical query vectors")
+    semantic_cache_epsilon: float = Field(0.01, description="Maximum cosine distance, and relative length difference, between query vectors for a semantic cache hit")
+    semantic_cache_size: int = Field(1024, description="Maximum number of cached queries per collection")
+    hot_tier_enabled: bool = Field(False, description="Answer searches on small collections from an in-process exact-search mirror")
+    hot_tier_max_points: int = Field(5000, description="Largest collection size mirrored in the hot tier")
+    hot_tier_ttl: float = Field(30.0, description="Seconds a hot tier mirror is trusted before it is reloaded from Qdrant")
+    tenancy_enabled: bool = Field(False, description="Store rooms as tenants of one shared collection instead of one collection per room")
+    tenancy_collection: str = Field("rooms", description="Shared collection holding all rooms when tenancy is enabled")
+    tenancy_key: str = Field("room_id", description="Tenant-indexed payload key identifying the room of a point")
+    vector_normalize: bool = Field(False, description="L2-normalize vectors before upserts and searches, so Cosine collections can use Dot distance")
+    vector_truncate_dim: Optional[int] = Field(None, description="Keep only the first N dimensions of Matryoshka embeddings before upserts and searches")
+    vector_dim: Optional[int] = Field(None, description="Expected vector dimension, checked before vectors are sent to Qdrant")
+    vector_datatype: str = Field("float32", description="Vector datatype of new collections and of vectors sent to Qdrant: 'float32', 'float16' or 'uint8'")
+    spool_enabled: bool = Field(False, description="Accept upserts into a local write-ahead spool and replay them to Qdrant in the background")
+    spool_dir: str = Field("qdrant_spool", description="Directory holding the write spool segments and checkpoint")
+    spool_fsync: str = Field("interval", description="When spooled writes are synced to disk: 'always', 'interval' or 'never'")
+    spool_fsync_interval: float = Field(1.0, description="Seconds between syncs with spool_fsync='interval'")
+    spool_segment_mb: int = Field(64, description="Size in MB at which the spool starts a new segment file")
+    spool_batch_size: int = Field(1024, description="Maximum number of points per replayed upsert")
+
+    def endpoint_urls(self) -> list[Optional[str]]:
+        urls = [self.url] if self.url or self.host else []
+        urls += [url for url in self.endpoints or [] if url not in urls]
+        return urls
+
+    def endpoint_key(self) -> str:
+        default = self.location or f"{self.host}:{self.port}"
+        return ",".join(url or default for url in self.endpoint_urls()) or default
 
     @classmethod
     def get_required_secrets(cls) -> CustomRequiredSecrets:
         return CustomRequiredSecrets()
 
+    def grpc_channel_options(self) -> dict[str, Any]:
+        options = dict(self.grpc_options or {})
+        if self.grpc_max_message_mb is not None:
+            max_bytes = self.grpc_max_message_mb * 1024 * 1024
+            options.setdefault("grpc.max_send_message_length", max_bytes)
+            options.setdefault("grpc.max_receive_message_length", max_bytes)
+        if self.grpc_keepalive_ms is not None:
+            options.setdefault("grpc.keepalive_time_ms", self.grpc_keepalive_ms)
+            options.setdefault("grpc.keepalive_permit_without_calls", 1)
+        if self.grpc_keepalive_timeout_ms is not None:
+            options.setdefault("grpc.keepalive_timeout_ms", self.grpc_keepalive_timeout_ms)
+        return options
+
     @model_validator(mode='after')
     def validate_qdrant_secrets(self):
         return self
+
+    @model_validator(mode='after')
+    def validate_grpc_transport(self):
+        if self.grpc_compression is not None and self.grpc_compression.lower() not in ("gzip", "none"):
+            raise ValueError("grpc_compression must be 'gzip' or 'none'")
+        if self.location and (self.url or self.host or self.endpoints):
+            raise ValueError("location cannot be combined with url, host or endpoints")
+        return self
+
+    @model_validator(mode='after')
+    def validate_read_routing(self):
+        if self.read_routing not in ("round_robin", "least_latency"):
+            raise ValueError("read_routing must be 'round_robin' or 'least_latency'")
+        if self.hedge_budget < 0:
+            raise ValueError("hedge_budget must not be negative")
+        return self
+
+    @model_validator(mode='after')
+    def validate_vector_preprocessing(self):
+        if self.vector_datatype not in ("float32", "float16", "uint8"):
+            raise ValueError("vector_datatype must be 'float32', 'float16' or 'uint8'")
+        if self.vector_datatype == "uint8" and self.vector_normalize:
+            raise ValueError("vector_normalize cannot be used with uint8 vectors")
+        return self
+
+    @model_validator(mode='after')
+    def validate_spool(self):
+        if self.spool_fsync not in ("always", "interval", "never"):
+            raise ValueError("spool_fsync must be 'always', 'interval' or 'never'")
+        return self
@@ -1,3 +1,4 @@
+from .conversation import ConversationMemory
 from .example import demo_memory
 
-__all__ = ["demo_memory"]
+__all__ = ["demo_memory", "ConversationMemory"]
@@ -0,0 +1,209 @@
+import threading
+import time
+import uuid
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+
+from qdrant_rooms_pkg.configuration import CustomAddonConfig
+
+
+class RecentWindow:
+    """Ring buffer of the latest turns, with their normalized vectors in one float32 matrix."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.vectors: Optional[np.ndarray] = None
+        self.turns: list = [None] * capacity
+        self.size = 0
+        self._next = 0
+
+    def add(self, turn: dict, vector: np.ndarray) -> None:
+        if self.vectors is None:
+            self.vectors = np.zeros((self.capacity, vector.shape[0]), dtype=np.float32)
+        self.vectors[self._next] = vector
+        self.turns[self._next] = turn
+        self._next = (self._next + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def search(self, query: np.ndarray, limit: int) -> list[tuple[dict, float]]:
+        if self.size == 0 or self.vectors.shape[1] != query.shape[0]:
+            return []
+        similarities = self.vectors[:self.size] @ query
+        top = np.argsort(-similarities, kind="stable")[:limit]
+        return [(self.turns[i], float(similarities[i])) for i in top]
+
+
+def _normalize(vector) -> np.ndarray:
+    row = np.asarray(vector, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(row))
+    return row / norm if norm > 0.0 else row
+
+
+class ConversationMemory:
+    """
+    Store and recall the turns of one room's conversation.
+
+    New turns go into an in-process window of the latest ``window`` turns, which
+    answers recall without a round trip, and are written to Qdrant by a
+    background thread in batches of up to ``batch_size`` turns, at least every
+    ``flush_interval`` seconds. Recall merges window hits with a Qdrant search
+    and ranks them by cosine similarity decayed with the turn's age, halving
+    every ``half_life`` seconds.
+
+    The collection must exist and use Cosine distance. Writes go through the
+    ``upsert_points`` action, so room tenancy and the search caches apply.
+    """
+
+    def __init__(self, config: CustomAddonConfig, collection_name: str, window: int = 256, batch_size: int = 64,
+                 flush_interval: float = 1.0, half_life: Optional[float] = 86400.0):
+        self.config = config
+        self.collection_name = collection_name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.half_life = half_life
+        self._window = RecentWindow(window)
+        self._pending: list = []
+        self._writing = 0
+        self._flushing = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._writer: Optional[threading.Thread] = None
+
+    def remember(self, text: str, vector: list, role: str = "user", metadata: Optional[dict] = None,
+                 turn_id=None, timestamp: Optional[float] = None) -> str:
+        turn_id = turn_id if turn_id is not None else str(uuid.uuid4())
+        turn = {
+            "id": turn_id,
+            "text": text,
+            "role": role,
+            "timestamp": timestamp if timestamp is not None else time.time(),
+            "metadata": metadata or {},
+        }
+        point = {
+            "id": turn_id,
+            "vector": list(vector),
+            "payload": {**turn["metadata"], "text": text, "role": role, "timestamp": turn["timestamp"]},
+        }
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Conversation memory is closed")
+            self._window.add(turn, _normalize(vector))
+            self._pending.append(point)
+            self._start_writer()
+            if len(self._pending) >= self.batch_size:
+                self._changed.notify_all()
+        return turn_id
+
+    def recall(self, query_vector: list, limit: int = 5, query_filter: Optional[dict] = None,
+               include_archive: bool = True, now: Optional[float] = None) -> list[dict]:
+        """Most relevant turns, newest window first, then Qdrant, ranked by decayed score."""
+        from qdrant_rooms_pkg.actions.search_points import search_points
+
+        now = now if now is not None else time.time()
+        query = _normalize(query_vector)
+
+        candidates = {}
+        if query_filter is None:
+            with self._lock:
+                for turn, similarity in self._window.search(query, limit):
+                    candidates[turn["id"]] = (turn, similarity)
+
+        if include_archive:
+            # over-fetch so that recent turns ranked lower by similarity can still win after decay
+            response = search_points(self.config, self.collection_name, list(query_vector), limit=limit * 2,
+                                     query_filter=query_filter)
+            if response.code != 200:
+                logger.warning("Conversation memory recall fell back to recent turns: {}", response.message)
+            for result in response.output.results:
+                if result["id"] in candidates:
+                    continue
+                payload = dict(result["payload"] or {})
+                turn = {
+                    "id": result["id"],
+                    "text": payload.pop("text", None),
+                    "role": payload.pop("role", None),
+                    "timestamp": payload.pop("timestamp", now),
+                    "metadata": payload,
+                }
+                candidates[result["id"]] = (turn, result["score"])
+
+        recalled = [
+            {**turn, "similarity": similarity, "score": similarity * self._decay(now - turn["timestamp"])}
+            for turn, similarity in candidates.values()
+        ]
+        recalled.sort(key=lambda turn: turn["score"], reverse=True)
+        return recalled[:limit]
+
+    def _decay(self, age: float) -> float:
+        if not self.half_life:
+            return 1.0
+        return 0.5 ** (max(age, 0.0) / self.half_life)
+
+    def _start_writer(self) -> None:
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="conversation-memory-writer", daemon=True)
+            self._writer.start()
+
+    def _write_loop(self) -> None:
+        from qdrant_rooms_pkg.actions.upsert_points import upsert_points
+
+        while True:
+            with self._lock:
+                if len(self._pending) < self.batch_size and not (self._closed or self._flushing):
+                    self._changed.wait(self.flush_interval)
+                if not self._pending:
+                    if self._closed:
+                        return
+                    continue
+                batch = self._pending[:self.batch_size]
+                del self._pending[:self.batch_size]
+                self._writing = len(batch)
+
+            response = upsert_points(self.config, self.collection_name, batch)
+
+            with self._lock:
+                self._writing = 0
+                if response.code == 200:
+                    self._changed.notify_all()
+                    continue
+
+                self._pending[:0] = batch
+                if self._closed:
+                    logger.error("Conversation memory closed with {} unwritten turns: {}", len(self._pending), response.message)
+                    return
+                logger.warning("Conversation memory write failed, retrying: {}", response.message)
+                retry_at = time.monotonic() + self.flush_interval
+                while not self._closed and time.monotonic() < retry_at:
+                    self._changed.wait(retry_at - time.monotonic())
+
+    def pending(self) -> int:
+        """Number of turns not written to Qdrant yet."""
+        with self._lock:
+            return len(self._pending) + self._writing
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write pending turns now and wait for them, ``False`` if ``timeout`` expired first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._flushing += 1
+            try:
+                self._changed.notify_all()
+                while self._pending or self._writing:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._changed.wait(remaining)
+            finally:
+                self._flushing -= 1
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        flushed = self.flush(timeout)
+        with self._lock:
+            self._closed = True
+            self._changed.notify_all()
+        return flushed
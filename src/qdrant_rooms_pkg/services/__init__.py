@@ -1,4 +1,28 @@
-from .credentials import CredentialsRegistry
-from .example import demo_service
+import importlib
 
-__all__ = ["demo_service", "CredentialsRegistry"]
+# exported names are resolved on first access so that importing the credentials
+# registry does not pull in qdrant_client and numpy
+_EXPORTS = {
+    "demo_service": ".example",
+    "CredentialsRegistry": ".credentials",
+    "SingleFlight": ".singleflight",
+    "SemanticCache": ".semantic_cache",
+    "EndpointPool": ".endpoints",
+    "OperationTracker": ".operations",
+    "EfController": ".adaptive_ef",
+}
+
+__all__ = ["demo_service", "CredentialsRegistry", "SingleFlight", "SemanticCache", "EndpointPool", "OperationTracker",
+           "EfController"]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,48 @@
+import threading
+
+
+class EfController:
+    """
+    Per-collection ``hnsw_ef`` steered by observed search latency.
+
+    A collection starts at ``ceiling``. Every ``window`` searches the mean
+    latency is compared with the target: above it, ``hnsw_ef`` is cut by a
+    quarter; below 80% of it, ``hnsw_ef`` grows by an eighth so recall comes
+    back once load drops. Cutting fast and growing slowly sheds load quickly
+    without oscillating around the target.
+    """
+
+    def __init__(self, window: int = 20):
+        self.window = window
+        self._lock = threading.Lock()
+        # (endpoint, collection) -> [current ef, latency sum, samples] of the current window
+        self._state: dict[tuple[str, str], list] = {}
+
+    def ef(self, endpoint: str, collection_name: str, floor: int, ceiling: int) -> int:
+        with self._lock:
+            state = self._state.get((endpoint, collection_name))
+            return ceiling if state is None else min(max(state[0], floor), ceiling)
+
+    def observe(self, endpoint: str, collection_name: str, elapsed: float, target: float,
+                floor: int, ceiling: int) -> int:
+        """Record the latency of a search that used the controlled ef, return the ef to use next."""
+        with self._lock:
+            state = self._state.setdefault((endpoint, collection_name), [ceiling, 0.0, 0])
+            state[1] += elapsed
+            state[2] += 1
+            if state[2] >= self.window:
+                mean = state[1] / state[2]
+                ef = min(max(state[0], floor), ceiling)
+                if mean > target:
+                    ef = max(floor, ef * 3 // 4)
+                elif mean < target * 0.8:
+                    ef = min(ceiling, ef + max(1, ef // 8))
+                state[:] = [ef, 0.0, 0]
+            return state[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._state.clear()
+
+
+ef_controller = EfController()
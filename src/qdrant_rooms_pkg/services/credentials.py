@@ -14,7 +14,7 @@ class CredentialsRegistry:
 
     def store(self, key: str, value: str) -> None:
         self._credentials[key] = value
-        logger.debug(f"Stored credential: {key}")
+        logger.debug("Stored credential: {}", key)
 
     def store_multiple(self, credentials: dict[str, str]) -> None:
         for key, value in credentials.items():
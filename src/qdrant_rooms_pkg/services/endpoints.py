@@ -0,0 +1,306 @@
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+
+from loguru import logger
+from qdrant_client import QdrantClient
+from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
+
+from qdrant_rooms_pkg.configuration import CustomAddonConfig
+
+_LATENCY_SMOOTHING = 0.2
+_LATENCY_WINDOW = 256
+_MIN_LATENCY_SAMPLES = 20
+_MAX_HEDGE_TOKENS = 10.0
+_HEDGE_WORKERS = 64
+
+
+def is_node_failure(error: BaseException) -> bool:
+    """Whether an error says the node is unreachable or broken, rather than the request being invalid."""
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code is None or error.status_code >= 500
+    if isinstance(error, (ResponseHandlingException, ConnectionError, TimeoutError)):
+        return True
+    code = getattr(error, "code", None)
+    if callable(code):
+        # grpc.RpcError, checked by name so grpc is not imported for REST-only setups
+        return getattr(code(), "name", "") in ("UNAVAILABLE", "DEADLINE_EXCEEDED")
+    return False
+
+
+class Endpoint:
+    def __init__(self, url: str, client_params: dict):
+        self.url = url
+        self.client_params = client_params
+        self.healthy = True
+        self.failed_at = 0.0
+        self.latency: Optional[float] = None
+        self._client: Optional[QdrantClient] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> QdrantClient:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = QdrantClient(**self.client_params)
+        return self._client
+
+    def record_success(self, elapsed: float) -> None:
+        if not self.healthy:
+            logger.info(f"Qdrant endpoint {self.url} re-admitted")
+        self.healthy = True
+        self.latency = elapsed if self.latency is None else (
+            _LATENCY_SMOOTHING * elapsed + (1 - _LATENCY_SMOOTHING) * self.latency
+        )
+
+    def record_failure(self, error: BaseException) -> None:
+        if self.healthy:
+            logger.warning(f"Qdrant endpoint {self.url} marked unhealthy: {error}")
+        self.healthy = False
+        self.failed_at = time.monotonic()
+
+
+class EndpointPool:
+    """
+    Long-lived clients for one or more Qdrant nodes.
+
+    Writes go to the primary (first) endpoint. Reads are spread across healthy
+    endpoints, round-robin or by lowest smoothed latency, and retried on the
+    next endpoint when a node fails. A failed node is taken out of rotation and
+    re-admitted on its first successful request once ``retry_after`` seconds
+    have passed.
+
+    Hedged reads send a duplicate to a second endpoint when the first has not
+    answered within a delay (by default the rolling p95 read latency). The first
+    response wins; the other request is cancelled if it has not started yet and
+    its response is otherwise discarded. Hedges draw from a token bucket refilled
+    by ``budget`` tokens per read, so at most that fraction of reads is doubled.
+
+    Both attempts run on hedge workers so the caller can take whichever answers
+    first. A read only gets a worker that is free right away, so no attempt waits
+    in a queue while its hedge delay runs: when all workers are busy, including
+    with losing attempts that cannot be cancelled, the read runs on the caller's
+    thread and a pending hedge is not sent.
+    """
+
+    def __init__(self, endpoints: list[Endpoint], routing: str = "round_robin", retry_after: float = 10.0):
+        if not endpoints:
+            raise ValueError("At least one Qdrant endpoint is required")
+        self.endpoints = endpoints
+        self.routing = routing
+        self.retry_after = retry_after
+        self._round_robin = itertools.count()
+        self._latencies: deque = deque(maxlen=_LATENCY_WINDOW)
+        self._hedge_tokens = 0.0
+        self._hedge_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._workers = threading.BoundedSemaphore(_HEDGE_WORKERS)
+
+    @property
+    def primary(self) -> Endpoint:
+        return self.endpoints[0]
+
+    def client(self) -> QdrantClient:
+        return self.primary.client
+
+    def _available(self) -> list[Endpoint]:
+        now = time.monotonic()
+        return [e for e in self.endpoints if e.healthy or now - e.failed_at >= self.retry_after]
+
+    def read_order(self) -> list[Endpoint]:
+        available = self._available() or list(self.endpoints)
+        if self.routing == "least_latency":
+            # unmeasured endpoints first so every node gets a latency estimate
+            return sorted(available, key=lambda e: -1.0 if e.latency is None else e.latency)
+        start = next(self._round_robin) % len(available)
+        return available[start:] + available[:start]
+
+    def call(self, endpoint: Endpoint, func: Callable[[QdrantClient], Any]) -> Any:
+        started = time.perf_counter()
+        try:
+            result = func(endpoint.client)
+        except Exception as e:
+            if is_node_failure(e):
+                endpoint.record_failure(e)
+            raise
+        endpoint.record_success(time.perf_counter() - started)
+        return result
+
+    def _timed_read(self, endpoint: Endpoint, func: Callable[[QdrantClient], Any]) -> Any:
+        started = time.perf_counter()
+        result = self.call(endpoint, func)
+        self._latencies.append(time.perf_counter() - started)
+        return result
+
+    def read(self, func: Callable[[QdrantClient], Any], endpoints: Optional[list[Endpoint]] = None) -> Any:
+        error = None
+        for endpoint in endpoints or self.read_order():
+            try:
+                return self._timed_read(endpoint, func)
+            except Exception as e:
+                if not is_node_failure(e):
+                    raise
+                error = e
+        raise error
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        samples = sorted(self._latencies)
+        if len(samples) < _MIN_LATENCY_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * percentile / 100))]
+
+    def _refill_hedge_tokens(self, budget: float) -> None:
+        with self._hedge_lock:
+            self._hedge_tokens = min(_MAX_HEDGE_TOKENS, self._hedge_tokens + budget)
+
+    def _take_hedge_token(self) -> bool:
+        with self._hedge_lock:
+            if self._hedge_tokens >= 1.0:
+                self._hedge_tokens -= 1.0
+                return True
+            return False
+
+    def _submit(self, endpoint: Endpoint, func: Callable[[QdrantClient], Any]) -> Optional[Future]:
+        """Start a read on a free hedge worker, or return None when every worker is busy."""
+        if not self._workers.acquire(blocking=False):
+            return None
+        if self._executor is None:
+            with self._hedge_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=_HEDGE_WORKERS, thread_name_prefix="qdrant-hedge")
+        future = self._executor.submit(self._timed_read, endpoint, func)
+        future.add_done_callback(lambda _: self._workers.release())
+        return future
+
+    def read_hedged(self, func: Callable[[QdrantClient], Any], delay: Optional[float] = None, budget: float = 0.05) -> Any:
+        order = self.read_order()
+        delay = delay if delay is not None else self.latency_percentile(95)
+        if len(order) < 2 or delay is None:
+            return self.read(func, order)
+
+        self._refill_hedge_tokens(budget)
+        first = self._submit(order[0], func)
+        if first is None:
+            return self.read(func, order)
+        done, _ = wait([first], timeout=delay)
+        hedge = None
+        if not done and self._take_hedge_token():
+            hedge = self._submit(order[1], func)
+            if hedge is None:
+                self._refill_hedge_tokens(1.0)
+        if hedge is None:
+            try:
+                return first.result()
+            except Exception as e:
+                if not is_node_failure(e):
+                    raise
+                return self.read(func, order[1:])
+
+        logger.debug("Hedging read to {} after {:.1f} ms", order[1].url, delay * 1000)
+        pending = {first, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    return future.result()
+                error = future.exception()
+                if not is_node_failure(error):
+                    raise error
+        if len(order) > 2:
+            return self.read(func, order[2:])
+        raise error
+
+    def write(self, func: Callable[[QdrantClient], Any]) -> Any:
+        return self.call(self.primary, func)
+
+
+def build_client_params(config: CustomAddonConfig, url: Optional[str]) -> dict:
+    client_params = {}
+
+    if url:
+        client_params["url"] = url
+    elif config.host:
+        client_params["host"] = config.host
+        client_params["port"] = config.port
+    elif config.location == ":memory:":
+        client_params["location"] = config.location
+    elif config.location:
+        client_params["path"] = config.location
+
+    if config.prefer_grpc and config.grpc_port:
+        client_params["grpc_port"] = config.grpc_port
+        client_params["prefer_grpc"] = True
+
+        grpc_options = config.grpc_channel_options()
+        if grpc_options:
+            client_params["grpc_options"] = grpc_options
+        if config.grpc_compression:
+            from grpc import Compression
+
+            compression = config.grpc_compression.lower()
+            client_params["grpc_compression"] = Compression.Gzip if compression == "gzip" else Compression.NoCompression
+
+    if "qdrant_api_key" in config.secrets and config.secrets["qdrant_api_key"]:
+        client_params["api_key"] = config.secrets["qdrant_api_key"]
+
+    client_params["timeout"] = config.timeout
+
+    return client_params
+
+
+def _pool_key(config: CustomAddonConfig) -> tuple:
+    return (
+        config.endpoint_key(),
+        config.prefer_grpc,
+        config.grpc_port,
+        json.dumps(config.grpc_channel_options(), sort_keys=True, default=str),
+        config.grpc_compression,
+        config.secrets.get("qdrant_api_key"),
+        config.timeout,
+        config.read_routing,
+        config.endpoint_retry_after,
+    )
+
+
+_pools: dict[tuple, EndpointPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(config: CustomAddonConfig) -> EndpointPool:
+    key = _pool_key(config)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                urls = config.endpoint_urls() or [None]
+                endpoints = [Endpoint(url or config.endpoint_key(), build_client_params(config, url)) for url in urls]
+                pool = EndpointPool(endpoints, config.read_routing, config.endpoint_retry_after)
+                _pools[key] = pool
+    return pool
+
+
+def get_client(config: CustomAddonConfig) -> QdrantClient:
+    return get_pool(config).client()
+
+
+def pool_read(config: CustomAddonConfig, func: Callable[[QdrantClient], Any]) -> Any:
+    """Run a read on the configured pool, hedged when ``hedge_enabled`` is set."""
+    pool = get_pool(config)
+    if config.hedge_enabled:
+        delay = config.hedge_delay_ms / 1000 if config.hedge_delay_ms is not None else None
+        return pool.read_hedged(func, delay, config.hedge_budget)
+    return pool.read(func)
+
+
+def clear_pools() -> None:
+    with _pools_lock:
+        _pools.clear()
@@ -0,0 +1,60 @@
+import threading
+from collections.abc import Iterable
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import Filter, FilterSelector, HasIdCondition, UpdateResult
+
+
+def write_barrier(client: QdrantClient, collection_name: str) -> UpdateResult:
+    """
+    Send a write that matches no point and wait for it to be applied.
+
+    Qdrant applies the updates of a collection in the order it received them,
+    so once the barrier is applied every write acknowledged before it is too.
+    """
+    return client.delete(
+        collection_name=collection_name,
+        points_selector=FilterSelector(filter=Filter(must=[HasIdCondition(has_id=[])])),
+        wait=True
+    )
+
+
+class OperationTracker:
+    """
+    Writes sent with ``wait=False`` that are not known to be applied yet.
+
+    Entries are ``(collection_name, operation_id)`` pairs kept per endpoint and
+    physical collection, since rooms sharing a collection share its update
+    queue. They are removed once a barrier write confirms them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: dict[tuple[str, str], dict[tuple[str, int], None]] = {}
+
+    def track(self, endpoint: str, physical_name: str, collection_name: str, operation_id) -> None:
+        if operation_id is None:
+            return
+        with self._lock:
+            self._pending.setdefault((endpoint, physical_name), {})[(collection_name, operation_id)] = None
+
+    def pending(self, endpoint: str, physical_name: str) -> list[tuple[str, int]]:
+        with self._lock:
+            return list(self._pending.get((endpoint, physical_name), ()))
+
+    def complete(self, endpoint: str, physical_name: str, entries: Iterable[tuple[str, int]]) -> None:
+        with self._lock:
+            pending = self._pending.get((endpoint, physical_name))
+            if pending is None:
+                return
+            for entry in entries:
+                pending.pop(entry, None)
+            if not pending:
+                del self._pending[(endpoint, physical_name)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+
+
+operation_tracker = OperationTracker()
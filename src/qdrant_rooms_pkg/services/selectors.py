@@ -0,0 +1,84 @@
+import re
+from typing import Optional, Union
+
+from qdrant_client.models import Filter, FilterSelector, PointIdsList
+
+from qdrant_rooms_pkg.configuration import CustomAddonConfig
+
+from .tenancy import ORIGINAL_ID_KEY, ROOM_MARKER_KEY, tenant_filter, tenant_point_id
+
+PointsSelector = Union[PointIdsList, FilterSelector]
+
+
+def points_selector(config: CustomAddonConfig, tenant: Optional[str], ids: Optional[list] = None,
+                    query_filter: Optional[dict] = None, shard_key=None) -> PointsSelector:
+    """Select points by id or by payload filter, scoped to the room under tenancy."""
+    if (ids is None) == (query_filter is None):
+        raise ValueError("Select points with either ids or a filter")
+
+    if ids is not None:
+        if tenant is not None:
+            ids = [tenant_point_id(tenant, point_id) for point_id in ids]
+        return PointIdsList(points=list(ids), shard_key=shard_key)
+    return FilterSelector(filter=Filter(**tenant_filter(config, tenant, query_filter)), shard_key=shard_key)
+
+
+def selector_fields(selector: PointsSelector) -> dict:
+    """``points=`` / ``filter=`` arguments of the payload operation models for a selector."""
+    if isinstance(selector, PointIdsList):
+        return {"points": selector.points, "shard_key": selector.shard_key}
+    return {"filter": selector.filter, "shard_key": selector.shard_key}
+
+
+def _reserved_keys(config: CustomAddonConfig, tenant: Optional[str]) -> tuple:
+    return () if tenant is None else (config.tenancy_key, ORIGINAL_ID_KEY, ROOM_MARKER_KEY)
+
+
+def _path_root(key: str) -> str:
+    # top-level key of a nested payload path such as 'a.b', 'a[0].b' or '"a.b".c'
+    match = re.match(r'"([^"]*)"|[^.\[]*', key)
+    return match.group(1) if match.group(1) is not None else match.group(0)
+
+
+def payload_update(config: CustomAddonConfig, tenant: Optional[str], payload: dict, key: Optional[str] = None) -> dict:
+    """
+    Payload to merge into points, without the keys that tie a point to its room.
+
+    A nested ``key`` under one of those keys would rewrite them wholesale, so it
+    is refused rather than filtered.
+    """
+    reserved = _reserved_keys(config, tenant)
+    if key is not None and _path_root(key) in reserved:
+        raise ValueError(f"Payload path '{key}' is reserved with room tenancy enabled")
+    return {name: value for name, value in payload.items() if name not in reserved}
+
+
+def payload_keys(config: CustomAddonConfig, tenant: Optional[str], keys: list) -> list:
+    """Payload keys to delete, without the keys that tie a point to its room or paths inside them."""
+    reserved = _reserved_keys(config, tenant)
+    return [key for key in keys if _path_root(key) not in reserved]
+
+
+def payload_overwrites(config: CustomAddonConfig, tenant: Optional[str], payload: dict, ids: Optional[list] = None,
+                       query_filter: Optional[dict] = None, shard_key=None) -> list[tuple[dict, PointsSelector]]:
+    """
+    ``(payload, selector)`` pairs that replace the payload of the selected points.
+
+    In a shared collection every point must keep its room and original id, so
+    the overwrite is split into one pair per point and selecting by filter is
+    refused.
+    """
+    selector = points_selector(config, tenant, ids, query_filter, shard_key)
+    if tenant is None:
+        return [(payload, selector)]
+    if ids is None:
+        raise ValueError("Payloads can only be overwritten by point ids with room tenancy enabled")
+
+    payload = payload_update(config, tenant, payload)
+    return [
+        (
+            {**payload, config.tenancy_key: tenant, ORIGINAL_ID_KEY: point_id},
+            points_selector(config, tenant, [point_id], shard_key=shard_key)
+        )
+        for point_id in ids
+    ]
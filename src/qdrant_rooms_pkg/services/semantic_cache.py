@@ -0,0 +1,129 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+
+
+class _Bucket:
+    """Recent query vectors of one collection, stored as a normalized float32 matrix."""
+
+    def __init__(self, dim: int, capacity: int):
+        self.dim = dim
+        self.capacity = capacity
+        self.vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self.norms = np.zeros(capacity, dtype=np.float32)
+        self.signature_hashes = np.zeros(capacity, dtype=np.int64)
+        self.signatures: list = [None] * capacity
+        self.last_used = np.zeros(capacity, dtype=np.int64)
+        self.results: list = [None] * capacity
+        self.size = 0
+
+    def slot(self) -> int:
+        if self.size < self.capacity:
+            self.size += 1
+            return self.size - 1
+        return int(np.argmin(self.last_used))
+
+
+class SemanticCache:
+    """
+    Approximate search result cache keyed by query vector similarity.
+
+    Each collection keeps its recent query vectors in a compact float32 matrix.
+    A lookup computes the cosine similarity of the new query against all cached
+    queries with the same search parameters in one matrix-vector product and
+    returns the stored results when the closest one lies within ``epsilon``
+    cosine distance. Dot and Euclid scores also scale with the length of the
+    query, so the lengths must differ by at most ``epsilon`` relative to the
+    longer one as well. Entries are evicted least-recently-used, collections too.
+    """
+
+    def __init__(self, max_collections: int = 64):
+        self.max_collections = max_collections
+        self._lock = threading.Lock()
+        self._buckets: OrderedDict[tuple[str, str], _Bucket] = OrderedDict()
+        self._generations: dict[tuple[str, str], int] = {}
+        self._clock = 0
+
+    @staticmethod
+    def _normalize(vector) -> tuple[Optional[np.ndarray], float]:
+        query = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return None, norm
+        return query / norm, norm
+
+    def generation(self, endpoint: str, collection_name: str) -> int:
+        with self._lock:
+            return self._generations.get((endpoint, collection_name), 0)
+
+    def lookup(self, endpoint: str, collection_name: str, vector, signature: Hashable, epsilon: float) -> Optional[list]:
+        query, norm = self._normalize(vector)
+        if query is None:
+            return None
+
+        with self._lock:
+            key = (endpoint, collection_name)
+            bucket = self._buckets.get(key)
+            if bucket is None or bucket.dim != query.shape[0] or bucket.size == 0:
+                return None
+
+            size = bucket.size
+            similarities = bucket.vectors[:size] @ query
+            similarities[bucket.signature_hashes[:size] != hash(signature)] = -np.inf
+            norms = bucket.norms[:size]
+            similarities[np.abs(norms - norm) > epsilon * np.maximum(norms, norm)] = -np.inf
+            best = int(np.argmax(similarities))
+            if 1.0 - float(similarities[best]) > epsilon or bucket.signatures[best] != signature:
+                return None
+
+            self._clock += 1
+            bucket.last_used[best] = self._clock
+            self._buckets.move_to_end(key)
+            return [dict(result) for result in bucket.results[best]]
+
+    def store(self, endpoint: str, collection_name: str, vector, signature: Hashable, results: list,
+              capacity: int, generation: int) -> None:
+        query, norm = self._normalize(vector)
+        if query is None or capacity <= 0:
+            return
+
+        with self._lock:
+            key = (endpoint, collection_name)
+            if self._generations.get(key, 0) != generation:
+                # the collection was written while this search was running
+                return
+
+            bucket = self._buckets.get(key)
+            if bucket is None or bucket.dim != query.shape[0] or bucket.capacity != capacity:
+                bucket = _Bucket(query.shape[0], capacity)
+                self._buckets[key] = bucket
+                while len(self._buckets) > self.max_collections:
+                    self._buckets.popitem(last=False)
+            self._buckets.move_to_end(key)
+
+            slot = bucket.slot()
+            self._clock += 1
+            bucket.vectors[slot] = query
+            bucket.norms[slot] = norm
+            bucket.signature_hashes[slot] = hash(signature)
+            bucket.signatures[slot] = signature
+            bucket.last_used[slot] = self._clock
+            bucket.results[slot] = [dict(result) for result in results]
+
+    def invalidate(self, endpoint: str, collection_name: str) -> None:
+        with self._lock:
+            key = (endpoint, collection_name)
+            self._generations[key] = self._generations.get(key, 0) + 1
+            if self._buckets.pop(key, None) is not None:
+                logger.debug("Invalidated semantic cache for collection '{}'", collection_name)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+semantic_cache = SemanticCache()
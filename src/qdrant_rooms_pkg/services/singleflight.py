@@ -0,0 +1,67 @@
+import threading
+from collections.abc import Hashable
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Collapses identical in-flight calls into a single execution.
+
+    The first caller for a key runs the function, every caller arriving with the
+    same key while it is still running waits for it and shares its result or
+    exception. The key is forgotten as soon as the call completes, nothing is
+    cached beyond the lifetime of the call.
+
+    Asyncio callers share calls through their executor threads
+    (``asyncio.to_thread`` / ``loop.run_in_executor``).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            logger.debug("Joining in-flight call for key {}", key)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def clear(self) -> None:
+        """Forget in-flight calls; their callers still get their results, later calls start afresh."""
+        with self._lock:
+            self._calls.clear()
@@ -0,0 +1,70 @@
+import uuid
+from typing import Optional
+
+from qdrant_rooms_pkg.configuration import CustomAddonConfig
+
+ORIGINAL_ID_KEY = "_room_point_id"
+ROOM_MARKER_KEY = "_room_marker"
+
+_TENANT_NAMESPACE = uuid.UUID("6f1c6a52-4b1e-4f57-9a53-2f1d3c0e7b90")
+_MARKER_NAMESPACE = uuid.UUID("0b6f3f0e-8d0b-4c3c-a1b4-5d7e2c9a4f13")
+
+
+def resolve_collection(config: CustomAddonConfig, collection_name: str) -> tuple[str, Optional[str]]:
+    """Map a caller-facing collection name to ``(physical_collection, tenant)``."""
+    if config.tenancy_enabled:
+        return config.tenancy_collection, collection_name
+    return collection_name, None
+
+
+def tenant_condition(config: CustomAddonConfig, tenant: str) -> dict:
+    return {"key": config.tenancy_key, "match": {"value": tenant}}
+
+
+def tenant_filter(config: CustomAddonConfig, tenant: Optional[str], query_filter: Optional[dict] = None) -> Optional[dict]:
+    if tenant is None:
+        return query_filter
+
+    scoped = dict(query_filter or {})
+    must = scoped.get("must") or []
+    if isinstance(must, dict):
+        must = [must]
+    scoped["must"] = [tenant_condition(config, tenant), *must]
+    return scoped
+
+
+def tenant_point_id(tenant: str, point_id) -> str:
+    # ids are only unique within a room, the shared collection needs them unique across rooms
+    return str(uuid.uuid5(_TENANT_NAMESPACE, f"{tenant}:{point_id}"))
+
+
+def room_marker_id(tenant: str) -> str:
+    # one point per room records that it was created, even while it holds no points;
+    # the marker has no tenancy key, so room filters never return it
+    return str(uuid.uuid5(_MARKER_NAMESPACE, tenant))
+
+
+def room_filter(config: CustomAddonConfig, tenant: str) -> dict:
+    """Matches every point of a room and its marker, for dropping the whole room."""
+    return {"should": [tenant_condition(config, tenant), {"key": ROOM_MARKER_KEY, "match": {"value": tenant}}]}
+
+
+def stamp_point(config: CustomAddonConfig, tenant: Optional[str], point: dict) -> dict:
+    if tenant is None:
+        return point
+
+    payload = dict(point.get("payload") or {})
+    payload[config.tenancy_key] = tenant
+    payload[ORIGINAL_ID_KEY] = point.get("id")
+    return {**point, "id": tenant_point_id(tenant, point.get("id")), "payload": payload}
+
+
+def restore_point(config: CustomAddonConfig, tenant: Optional[str], point_id, payload: Optional[dict]) -> tuple:
+    """Return the caller-facing ``(id, payload)`` of a point read from a shared collection."""
+    if tenant is None or payload is None or ORIGINAL_ID_KEY not in payload:
+        return point_id, payload
+
+    payload = dict(payload)
+    original_id = payload.pop(ORIGINAL_ID_KEY)
+    payload.pop(config.tenancy_key, None)
+    return original_id, payload
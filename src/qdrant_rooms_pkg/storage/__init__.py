@@ -1,3 +1,5 @@
 from .example import demo_storage
+from .hot_tier import HotTier
+from .spool import WriteSpool
 
-__all__ = ["demo_storage"]
+__all__ = ["demo_storage", "HotTier", "WriteSpool"]
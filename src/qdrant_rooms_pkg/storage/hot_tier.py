@@ -0,0 +1,206 @@
+import threading
+import time
+import uuid
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+
+SUPPORTED_DISTANCES = ("Cosine", "Dot", "Euclid")
+
+
+def _normalize_id(point_id):
+    if isinstance(point_id, str):
+        try:
+            return str(uuid.UUID(point_id))
+        except ValueError:
+            return point_id
+    return point_id
+
+
+class CollectionMirror:
+    """Contiguous float32 copy of a small collection, answered with exact top-k search."""
+
+    def __init__(self, dim: int, distance: str, capacity: int = 64):
+        self.dim = dim
+        self.distance = distance
+        self.vectors = np.zeros((max(capacity, 1), dim), dtype=np.float32)
+        self.ids: list = []
+        self.payloads: list = []
+        self.rows: dict = {}
+        self.loaded_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    def _prepare(self, vector) -> Optional[np.ndarray]:
+        row = np.asarray(vector, dtype=np.float32).ravel()
+        if row.shape[0] != self.dim:
+            return None
+        if self.distance == "Cosine":
+            norm = float(np.linalg.norm(row))
+            if norm > 0.0:
+                row = row / norm
+        return row
+
+    def upsert(self, point_id, vector, payload: Optional[dict]) -> bool:
+        row = self._prepare(vector)
+        if row is None:
+            return False
+
+        point_id = _normalize_id(point_id)
+        index = self.rows.get(point_id)
+        if index is None:
+            index = self.size
+            if index == self.vectors.shape[0]:
+                grown = np.zeros((self.vectors.shape[0] * 2, self.dim), dtype=np.float32)
+                grown[:index] = self.vectors[:index]
+                self.vectors = grown
+            self.rows[point_id] = index
+            self.ids.append(point_id)
+            self.payloads.append(payload or {})
+        else:
+            self.payloads[index] = payload or {}
+        self.vectors[index] = row
+        return True
+
+    def search(self, query_vector, limit: int, score_threshold: Optional[float] = None) -> list:
+        query = self._prepare(query_vector)
+        if query is None:
+            raise ValueError(f"Query vector dimension does not match collection dimension {self.dim}")
+
+        with self.lock:
+            return self._search(query, limit, score_threshold)
+
+    def _search(self, query: np.ndarray, limit: int, score_threshold: Optional[float]) -> list:
+        if self.size == 0 or limit <= 0:
+            return []
+
+        matrix = self.vectors[:self.size]
+        if self.distance == "Euclid":
+            diff = matrix - query
+            scores = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+            order_scores = -scores
+        else:
+            scores = matrix @ query
+            order_scores = scores
+
+        if score_threshold is not None:
+            keep = scores <= score_threshold if self.distance == "Euclid" else scores >= score_threshold
+            candidates = np.flatnonzero(keep)
+        else:
+            candidates = np.arange(self.size)
+
+        if candidates.shape[0] > limit:
+            top = np.argpartition(-order_scores[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        candidates = candidates[np.argsort(-order_scores[candidates], kind="stable")]
+
+        return [
+            {"id": self.ids[i], "score": float(scores[i]), "payload": dict(self.payloads[i])}
+            for i in candidates
+        ]
+
+
+class HotTier:
+    """
+    Registry of in-process mirrors for collections below a size threshold.
+
+    Mirrors are filled from a full scroll of the collection and kept in sync with
+    writes going through this package. Since other writers are invisible here,
+    a mirror is only trusted for ``ttl`` seconds after its last full load. A
+    collection found to be over the threshold is remembered as such for the same
+    period so it is not re-counted on every search.
+
+    Every write bumps a per-collection version, mirrored or not. A load that
+    started before a write only sees the scroll from before it, so it is
+    discarded instead of installed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._mirrors: dict[tuple[str, str], Optional[CollectionMirror]] = {}
+        self._checked_at: dict[tuple[str, str], float] = {}
+        self._versions: dict[tuple[str, str], int] = {}
+
+    def version(self, endpoint: str, collection_name: str) -> int:
+        with self._lock:
+            return self._versions.get((endpoint, collection_name), 0)
+
+    def get(self, endpoint: str, collection_name: str, ttl: float) -> tuple[bool, Optional[CollectionMirror]]:
+        """Return ``(known, mirror)``, ``known`` is False when the collection must be (re)checked."""
+        with self._lock:
+            key = (endpoint, collection_name)
+            if key not in self._checked_at or time.monotonic() - self._checked_at[key] > ttl:
+                return False, None
+            return True, self._mirrors.get(key)
+
+    def load(self, endpoint: str, collection_name: str, dim: int, distance: str, records: list,
+             version: Optional[int] = None) -> Optional[CollectionMirror]:
+        """Install a mirror of ``records``, unless the collection was written since ``version`` was taken."""
+        mirror = CollectionMirror(dim, distance, capacity=len(records))
+        for record in records:
+            if not mirror.upsert(record.id, record.vector, record.payload):
+                logger.debug("Collection '{}' has vectors the hot tier cannot mirror", collection_name)
+                self.mark_oversized(endpoint, collection_name)
+                return None
+        with self._lock:
+            key = (endpoint, collection_name)
+            if version is not None and self._versions.get(key, 0) != version:
+                logger.debug("Collection '{}' was written while it was mirrored, discarding the mirror", collection_name)
+                return None
+            self._mirrors[key] = mirror
+            self._checked_at[key] = mirror.loaded_at
+        logger.debug("Mirrored {} points of collection '{}' in the hot tier", mirror.size, collection_name)
+        return mirror
+
+    def create(self, endpoint: str, collection_name: str, dim: int, distance: str) -> None:
+        with self._lock:
+            key = (endpoint, collection_name)
+            self._bump(key)
+            version = self._versions[key]
+        self.load(endpoint, collection_name, dim, distance, [], version)
+
+    def mark_oversized(self, endpoint: str, collection_name: str) -> None:
+        with self._lock:
+            self._mirrors[(endpoint, collection_name)] = None
+            self._checked_at[(endpoint, collection_name)] = time.monotonic()
+
+    def upsert(self, endpoint: str, collection_name: str, points: list, max_points: int) -> None:
+        with self._lock:
+            key = (endpoint, collection_name)
+            self._bump(key)
+            mirror = self._mirrors.get(key)
+            if mirror is None:
+                return
+            with mirror.lock:
+                for point in points:
+                    if not mirror.upsert(point.get("id"), point.get("vector"), point.get("payload")):
+                        self._drop(key)
+                        return
+            if mirror.size > max_points:
+                logger.debug("Collection '{}' outgrew the hot tier", collection_name)
+                self._mirrors[key] = None
+
+    def drop(self, endpoint: str, collection_name: str) -> None:
+        with self._lock:
+            self._bump((endpoint, collection_name))
+            self._drop((endpoint, collection_name))
+
+    def _bump(self, key: tuple[str, str]) -> None:
+        self._versions[key] = self._versions.get(key, 0) + 1
+
+    def _drop(self, key: tuple[str, str]) -> None:
+        self._mirrors.pop(key, None)
+        self._checked_at.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mirrors.clear()
+            self._checked_at.clear()
+            self._versions.clear()
+
+
+hot_tier = HotTier()
@@ -0,0 +1,375 @@
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Optional
+
+from loguru import logger
+
+FSYNC_POLICIES = ("always", "interval", "never")
+
+_CHECKPOINT = "checkpoint"
+_DEAD_LETTER = "dead-letter.jsonl"
+_SUFFIX = ".log"
+
+
+def _json_default(value):
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class WriteSpool:
+    """
+    Append-only, segmented log of upserts replayed to Qdrant in the background.
+
+    ``append`` writes one JSON line to the active segment file and returns at
+    local disk speed; with ``fsync="always"`` the line is synced before
+    returning, with ``"interval"`` at most ``fsync_interval`` seconds later, with
+    ``"never"`` whenever the OS flushes it. Segments roll over at
+    ``segment_bytes`` and are named after their first sequence number.
+
+    A replay thread reads lines past the checkpoint, groups consecutive writes to
+    the same collection into batches of up to ``batch_size`` points and hands
+    them to ``write``. The checkpoint only advances once ``write`` returns, and
+    fully replayed segments are deleted. Points without an id get one when they
+    are appended, so a batch replayed twice after a crash overwrites itself
+    instead of duplicating points.
+
+    A batch whose ``write`` fails with an error ``retryable`` accepts is retried
+    until it succeeds. Any other error means the batch can never be written: its
+    writes are retried one by one, those that still fail are moved to
+    ``dead-letter.jsonl`` with the error, and the checkpoint moves past them
+    instead of holding back every later write.
+    """
+
+    def __init__(self, directory, write: Callable[[str, list, object], None], fsync: str = "interval",
+                 fsync_interval: float = 1.0, segment_bytes: int = 64 * 1024 * 1024, batch_size: int = 1024,
+                 replay_interval: float = 0.5, retryable: Callable[[Exception], bool] = lambda error: True):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {', '.join(FSYNC_POLICIES)}")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.write = write
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.segment_bytes = segment_bytes
+        self.batch_size = batch_size
+        self.replay_interval = replay_interval
+        self.retryable = retryable
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._replay_lock = threading.Lock()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._last_fsync = time.monotonic()
+        self._dirty = False
+
+        self.checkpoint = self._read_checkpoint()
+        self._recover()
+        self._cursor: Optional[tuple[Path, int]] = None
+
+    # -- segments ---------------------------------------------------------
+
+    def _segments(self) -> list[Path]:
+        return sorted(self.directory.glob(f"*{_SUFFIX}"), key=lambda path: int(path.stem))
+
+    def _segment_path(self, first_seq: int) -> Path:
+        return self.directory / f"{first_seq:020d}{_SUFFIX}"
+
+    def _recover(self) -> None:
+        segments = self._segments()
+        self._next_seq = self.checkpoint + 1
+        if not segments:
+            self._open_segment(self._segment_path(self._next_seq))
+            return
+
+        last = segments[-1]
+        data = last.read_bytes()
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            logger.warning("Truncating {} bytes of an incomplete write at the end of spool segment {}",
+                           len(data) - complete, last.name)
+            with open(last, "r+b") as segment:
+                segment.truncate(complete)
+                os.fsync(segment.fileno())
+
+        lines = data[:complete].splitlines()
+        if lines:
+            self._next_seq = json.loads(lines[-1])["seq"] + 1
+        else:
+            self._next_seq = max(self._next_seq, int(last.stem))
+        self._open_segment(last)
+
+    def _open_segment(self, path: Path) -> None:
+        self._file = open(path, "ab", buffering=0)
+        self._size = self._file.tell()
+
+    def _roll(self) -> None:
+        self._sync()
+        self._file.close()
+        self._open_segment(self._segment_path(self._next_seq))
+
+    def _sync(self) -> None:
+        if self._dirty:
+            os.fsync(self._file.fileno())
+            self._dirty = False
+        self._last_fsync = time.monotonic()
+
+    # -- checkpoint -------------------------------------------------------
+
+    def _read_checkpoint(self) -> int:
+        try:
+            return int((self.directory / _CHECKPOINT).read_text().strip() or 0)
+        except FileNotFoundError:
+            return 0
+
+    def _write_checkpoint(self, seq: int) -> None:
+        temporary = self.directory / f"{_CHECKPOINT}.tmp"
+        with open(temporary, "w") as checkpoint:
+            checkpoint.write(str(seq))
+            checkpoint.flush()
+            os.fsync(checkpoint.fileno())
+        os.replace(temporary, self.directory / _CHECKPOINT)
+
+    # -- writing ----------------------------------------------------------
+
+    def append(self, collection_name: str, points: list, shard_key=None) -> int:
+        """Append an upsert to the spool and return its sequence number."""
+        points = [point if point.get("id") is not None else {**point, "id": str(uuid.uuid4())} for point in points]
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Write spool is closed")
+            seq = self._next_seq
+            line = json.dumps(
+                {"seq": seq, "collection": collection_name, "shard_key": shard_key, "points": points},
+                separators=(",", ":"), default=_json_default
+            ).encode() + b"\n"
+
+            if self._size and self._size + len(line) > self.segment_bytes:
+                self._roll()
+            self._file.write(line)
+            self._size += len(line)
+            self._next_seq += 1
+            self._dirty = True
+
+            if self.fsync == "always" or (
+                self.fsync == "interval" and time.monotonic() - self._last_fsync >= self.fsync_interval
+            ):
+                self._sync()
+            if self._next_seq - 1 - self.checkpoint >= self.batch_size:
+                # enough for a full batch, no need to wait for the next replay round
+                self._changed.notify_all()
+        return seq
+
+    def pending(self) -> int:
+        """Number of appended writes not replayed to Qdrant yet."""
+        with self._lock:
+            return self._next_seq - 1 - self.checkpoint
+
+    # -- replay -----------------------------------------------------------
+
+    def _read_batch(self) -> tuple[list[dict], Optional[tuple[Path, int]]]:
+        segments = self._segments()
+        if self._cursor is None or not self._cursor[0].exists():
+            position = (segments[0], 0) if segments else None
+        else:
+            position = self._cursor
+
+        records: list[dict] = []
+        key = None
+        points = 0
+        while position is not None:
+            path, offset = position
+            with open(path, "rb") as segment:
+                segment.seek(offset)
+                for line in segment:
+                    if not line.endswith(b"\n"):
+                        # still being written
+                        break
+                    record = json.loads(line)
+                    if record["seq"] <= self.checkpoint:
+                        offset += len(line)
+                        continue
+                    record_key = (record["collection"], json.dumps(record["shard_key"]))
+                    if records and (record_key != key or points + len(record["points"]) > self.batch_size):
+                        return records, (path, offset)
+                    key = record_key
+                    points += len(record["points"])
+                    records.append(record)
+                    offset += len(line)
+
+            index = segments.index(path) if path in segments else -1
+            if 0 <= index < len(segments) - 1 and offset >= path.stat().st_size:
+                position = (segments[index + 1], 0)
+            else:
+                return records, (path, offset)
+        return records, position
+
+    def replay_once(self) -> int:
+        """Replay one batch, return the number of writes replayed."""
+        with self._replay_lock:
+            records, cursor = self._read_batch()
+            if not records:
+                self._cursor = cursor
+                return 0
+
+            first = records[0]
+            try:
+                self.write(first["collection"], [point for record in records for point in record["points"]], first["shard_key"])
+            except Exception as e:
+                if self.retryable(e):
+                    raise
+                # find the writes that cannot be applied instead of discarding the merged batch
+                for record in records:
+                    try:
+                        self.write(record["collection"], record["points"], record["shard_key"])
+                    except Exception as record_error:
+                        if self.retryable(record_error):
+                            raise
+                        self._dead_letter(record, record_error)
+
+            last_seq = records[-1]["seq"]
+            self._write_checkpoint(last_seq)
+            with self._lock:
+                self.checkpoint = last_seq
+                self._cursor = cursor
+                self._changed.notify_all()
+            self._drop_replayed_segments()
+            return len(records)
+
+    def _dead_letter(self, record: dict, error: Exception) -> None:
+        logger.error("Moving spooled write {} to collection '{}' to the dead-letter file: {}",
+                     record["seq"], record["collection"], error)
+        line = json.dumps({**record, "error": str(error)}, separators=(",", ":")).encode() + b"\n"
+        with open(self.directory / _DEAD_LETTER, "ab") as dead_letter:
+            dead_letter.write(line)
+            dead_letter.flush()
+            os.fsync(dead_letter.fileno())
+
+    def _drop_replayed_segments(self) -> None:
+        segments = self._segments()
+        with self._lock:
+            active = Path(self._file.name)
+        for segment, following in zip(segments, segments[1:]):
+            if segment != active and int(following.stem) <= self.checkpoint + 1:
+                segment.unlink(missing_ok=True)
+
+    def _replay_loop(self) -> None:
+        while True:
+            failed = False
+            try:
+                replayed = self.replay_once()
+            except Exception as e:
+                logger.warning("Spool replay failed, retrying in {}s: {}", self.replay_interval, e)
+                replayed, failed = 0, True
+
+            with self._lock:
+                if self._dirty and self.fsync == "interval" and time.monotonic() - self._last_fsync >= self.fsync_interval:
+                    self._sync()
+                if self._closed:
+                    return
+                if failed:
+                    retry_at = time.monotonic() + self.replay_interval
+                    while not self._closed and time.monotonic() < retry_at:
+                        self._changed.wait(retry_at - time.monotonic())
+                elif not replayed:
+                    self._changed.wait(self.replay_interval)
+
+    def start(self) -> "WriteSpool":
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._replay_loop, name="qdrant-spool-replay", daemon=True)
+                self._thread.start()
+        return self
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything appended so far is replayed, ``False`` if ``timeout`` expired first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            target = self._next_seq - 1
+            while self.checkpoint < target:
+                if self._thread is None:
+                    self._lock.release()
+                    try:
+                        replayed = self.replay_once()
+                    finally:
+                        self._lock.acquire()
+                    if not replayed:
+                        return False
+                    continue
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._changed.notify_all()
+                self._changed.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        flushed = self.flush(timeout) if self._thread is not None else True
+        with self._lock:
+            self._closed = True
+            self._changed.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        with self._lock:
+            self._sync()
+            self._file.close()
+        return flushed
+
+
+_spools: dict[str, WriteSpool] = {}
+_spools_lock = threading.Lock()
+
+
+def get_spool(config) -> WriteSpool:
+    """The running spool of ``config.spool_dir``, recovering and replaying what a previous process left."""
+    directory = os.path.abspath(config.spool_dir)
+    spool = _spools.get(directory)
+    if spool is None:
+        with _spools_lock:
+            spool = _spools.get(directory)
+            if spool is None:
+                def write(collection_name: str, points: list, shard_key) -> None:
+                    from qdrant_rooms_pkg.actions.upsert_points import write_points
+
+                    write_points(config, collection_name, points, shard_key)
+
+                from qdrant_rooms_pkg.services.endpoints import is_node_failure
+
+                spool = WriteSpool(
+                    directory,
+                    write,
+                    fsync=config.spool_fsync,
+                    fsync_interval=config.spool_fsync_interval,
+                    segment_bytes=config.spool_segment_mb * 1024 * 1024,
+                    batch_size=config.spool_batch_size,
+                    retryable=is_node_failure
+                ).start()
+                _spools[directory] = spool
+    return spool
+
+
+def drain_spool(config) -> None:
+    """
+    Replay every spooled upsert before a write that bypasses the spool.
+
+    Deletes and payload updates go straight to Qdrant; without draining, an
+    older spooled upsert could be replayed after them and undo them.
+    """
+    if config.spool_enabled and not get_spool(config).flush(config.timeout):
+        raise RuntimeError("Spooled upserts are not replayed yet, retry once Qdrant is reachable")
+
+
+def close_spools(timeout: Optional[float] = None) -> None:
+    with _spools_lock:
+        spools = list(_spools.values())
+        _spools.clear()
+    for spool in spools:
+        spool.close(timeout)
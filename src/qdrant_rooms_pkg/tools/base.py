@@ -1,11 +1,28 @@
-from typing import Any, Callable
+import copy
+import inspect
+import weakref
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Callable, Optional
 
 
 class ToolRegistry:
+    """
+    Tool definitions and dispatch for agent loops.
+
+    Schemas and argument validators are compiled once per function and reused
+    across registrations, ``invoke`` validates and calls through the cached
+    validator, and the tool listing is a read-only snapshot of deep-copied
+    definitions, rebuilt only when the set of registered tools changes.
+    """
+
     def __init__(self):
         self.functions: dict[str, Callable] = {}
         self.tool_definitions: dict[str, dict[str, Any]] = {}
         self.tool_max_retries: dict[str, int] = {}
+        self._validators: dict[str, Optional[type]] = {}
+        self._compiled: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._snapshot: Optional[Mapping[str, dict[str, Any]]] = None
 
     def register_tools(self, tool_functions: dict[str, Callable], tool_descriptions: dict[str, str] = None, tool_max_retries: dict[str, int] = None):
         tool_descriptions = tool_descriptions or {}
@@ -26,23 +43,41 @@ class ToolRegistry:
             self._register_single_tool(action_name, func, custom_description)
 
     def _register_single_tool(self, action_name: str, func: Callable, context: str):
+        schema, validator = self._compile(func)
         self.functions[action_name] = func
+        self._validators[action_name] = validator
+        self._snapshot = None
 
         self.tool_definitions[action_name] = {
             "name": action_name,
             "description": context or f"Execute {action_name} action",
-            "input_schema": self._convert_annotations_to_schema(func)
+            "input_schema": schema
         }
 
-    def _convert_annotations_to_schema(self, func: Callable) -> dict[str, Any]:
+    def _compile(self, func: Callable) -> tuple[dict[str, Any], Optional[type]]:
         try:
-            import inspect
+            compiled = self._compiled.get(func)
+        except TypeError:
+            # callables that cannot be weakly referenced are compiled on every registration
+            return self._build_schema(func)
+
+        if compiled is None:
+            compiled = self._build_schema(func)
+            self._compiled[func] = compiled
+        schema, validator = compiled
+        return copy.deepcopy(schema), validator
 
+    def _convert_annotations_to_schema(self, func: Callable) -> dict[str, Any]:
+        return self._build_schema(func)[0]
+
+    def _build_schema(self, func: Callable) -> tuple[dict[str, Any], Optional[type]]:
+        """Return the JSON schema of ``func`` and the pydantic model validating its arguments, if any."""
+        try:
             from pydantic import create_model
 
             sig = inspect.signature(func)
             if not sig.parameters:
-                return {"type": "object", "properties": {}, "required": []}
+                return {"type": "object", "properties": {}, "required": []}, None
 
             fields = {}
             for param_name, param in sig.parameters.items():
@@ -64,13 +99,13 @@ class ToolRegistry:
             if "type" not in schema:
                 schema["type"] = "object"
 
-            return schema
+            return schema, DynamicModel
 
         except Exception as e:
             from loguru import logger
             logger.warning(f"Pydantic schema generation failed for function '{func.__name__}': {str(e)}")
             logger.warning(f"Falling back to basic type converter for function '{func.__name__}'")
-            return self._basic_type_converter(func)
+            return self._basic_type_converter(func), None
 
     def _basic_type_converter(self, func: Callable) -> dict[str, Any]:
 
@@ -107,8 +142,39 @@ class ToolRegistry:
 
         return schema
 
-    def get_tools_for_action(self) -> dict[str, Any]:
-        return self.tool_definitions.copy()
+    def get_tools_for_action(self) -> Mapping[str, dict[str, Any]]:
+        if self._snapshot is None:
+            self._snapshot = MappingProxyType(copy.deepcopy(self.tool_definitions))
+        return self._snapshot
+
+    def invoke(self, action_name: str, args: Optional[dict[str, Any]] = None) -> Any:
+        """
+        Validate ``args`` against the tool's cached argument model and call it.
+
+        Invalid arguments raise ``pydantic.ValidationError`` without calling the
+        tool. Errors raised by the tool itself are retried up to the tool's
+        ``tool_max_retries`` before the last one is re-raised.
+        """
+        func = self.functions.get(action_name)
+        if func is None:
+            raise KeyError(f"Tool '{action_name}' is not registered")
+
+        args = args or {}
+        validator = self._validators.get(action_name)
+        if validator is not None:
+            validated = validator.model_validate(args)
+            # only the arguments the caller passed, so the function's own defaults still apply
+            args = {name: getattr(validated, name) for name in validated.model_fields_set}
+
+        max_retries = self.tool_max_retries.get(action_name, 0)
+        for attempt in range(max_retries + 1):
+            try:
+                return func(**args)
+            except Exception as e:
+                if attempt == max_retries:
+                    raise
+                from loguru import logger
+                logger.warning(f"Tool '{action_name}' failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
 
     def get_function(self, action_name: str) -> Callable:
         return self.functions.get(action_name)
@@ -120,3 +186,5 @@ class ToolRegistry:
         self.functions.clear()
         self.tool_definitions.clear()
         self.tool_max_retries.clear()
+        self._validators.clear()
+        self._snapshot = None
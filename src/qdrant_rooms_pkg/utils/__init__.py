@@ -1,3 +1,39 @@
+import importlib
+
 from .example import demo_util
+from .log import AddonLogger, SampledLog
+
+# the vector helpers are resolved on first access so that importing the addon
+# logger does not pull in numpy
+_EXPORTS = {
+    "as_float32": ".vectors",
+    "convert_datatype": ".vectors",
+    "l2_normalize": ".vectors",
+    "prepare_vectors": ".vectors",
+    "truncate": ".vectors",
+    "validate_dimension": ".vectors",
+}
+
+__all__ = [
+    "demo_util",
+    "AddonLogger",
+    "SampledLog",
+    "as_float32",
+    "convert_datatype",
+    "l2_normalize",
+    "prepare_vectors",
+    "truncate",
+    "validate_dimension",
+]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["demo_util"]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
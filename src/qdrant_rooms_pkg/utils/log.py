@@ -0,0 +1,62 @@
+import threading
+import time
+
+from loguru import logger
+
+
+class AddonLogger:
+    """
+    Loguru wrapper that prefixes every message with the addon type.
+
+    Extra positional and keyword arguments are handed to loguru, which formats
+    them into the message only when a sink accepts the level, so debug lines
+    cost next to nothing when debug logging is off.
+    """
+
+    def __init__(self, addon_type: str):
+        self.addon_type = addon_type
+        self._prefix = f"[TYPE: {addon_type.upper()}] "
+        self._logger = logger.opt(depth=1)
+
+    def debug(self, message: str, *args, **kwargs) -> None:
+        self._logger.debug(self._prefix + message, *args, **kwargs)
+
+    def info(self, message: str, *args, **kwargs) -> None:
+        self._logger.info(self._prefix + message, *args, **kwargs)
+
+    def warning(self, message: str, *args, **kwargs) -> None:
+        self._logger.warning(self._prefix + message, *args, **kwargs)
+
+    def error(self, message: str, *args, **kwargs) -> None:
+        self._logger.error(self._prefix + message, *args, **kwargs)
+
+
+class SampledLog:
+    """
+    Log line emitted at most once per ``interval`` seconds.
+
+    Meant for per-call lines on hot paths. Calls in between are only counted,
+    and the count is appended to the next line that goes out.
+    """
+
+    def __init__(self, level: str = "INFO", interval: float = 1.0):
+        self.level = level
+        self.interval = interval
+        self.suppressed = 0
+        self._last = float("-inf")
+        self._lock = threading.Lock()
+        self._logger = logger.opt(depth=1)
+
+    def __call__(self, message: str, *args, **kwargs) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last < self.interval:
+                self.suppressed += 1
+                return False
+            self._last = now
+            suppressed, self.suppressed = self.suppressed, 0
+
+        if suppressed:
+            message = f"{message} ({suppressed} similar messages suppressed)"
+        self._logger.log(self.level, message, *args, **kwargs)
+        return True
@@ -0,0 +1,140 @@
+from typing import Optional
+
+import numpy as np
+
+DATATYPES = ("float32", "float16", "uint8")
+
+_FLOAT16_MAX = float(np.finfo(np.float16).max)
+
+
+def as_float32(vectors) -> np.ndarray:
+    """
+    Vectors as a C-contiguous float32 matrix, one row per vector.
+
+    A single vector becomes a one-row matrix. Arrays that already are
+    contiguous float32 are returned as is, without a copy.
+    """
+    try:
+        matrix = np.asarray(vectors, dtype=np.float32)
+    except ValueError as e:
+        raise ValueError("Vectors must all have the same dimension") from e
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    if matrix.ndim != 2:
+        raise ValueError("Vectors must be a list of vectors of numbers")
+    return np.ascontiguousarray(matrix)
+
+
+def validate_dimension(matrix: np.ndarray, dim: int) -> np.ndarray:
+    if matrix.shape[1] != dim:
+        raise ValueError(f"Expected vectors of dimension {dim}, got {matrix.shape[1]}")
+    return matrix
+
+
+def l2_normalize(matrix: np.ndarray) -> np.ndarray:
+    """
+    Scale every row to unit length, in place when ``matrix`` is a writable
+    contiguous float32 array. Zero rows are left as they are.
+
+    Unit vectors have the same ranking under Dot as under Cosine, and Dot skips
+    the normalization Qdrant does on every Cosine comparison.
+    """
+    if matrix.dtype != np.float32 or not matrix.flags.c_contiguous or not matrix.flags.writeable:
+        matrix = np.array(matrix, dtype=np.float32, order="C")
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def truncate(matrix: np.ndarray, dim: int) -> np.ndarray:
+    """Keep the first ``dim`` dimensions of Matryoshka embeddings."""
+    if dim > matrix.shape[1]:
+        raise ValueError(f"Cannot truncate vectors of dimension {matrix.shape[1]} to {dim}")
+    if dim == matrix.shape[1]:
+        return matrix
+    return np.ascontiguousarray(matrix[:, :dim])
+
+
+def convert_datatype(matrix: np.ndarray, datatype: str) -> np.ndarray:
+    """
+    Round a float32 matrix to the vector datatype of a collection.
+
+    float16 values must fit in half precision, uint8 values are rounded to the
+    nearest integer and must lie in 0..255; out-of-range values raise instead of
+    being clipped silently.
+    """
+    if datatype == "float32":
+        return matrix
+    if datatype == "float16":
+        if not np.isfinite(matrix).all() or np.abs(matrix).max(initial=0.0) > _FLOAT16_MAX:
+            raise ValueError("float16 vectors must be finite and within +/-65504")
+        return matrix.astype(np.float16)
+    if datatype == "uint8":
+        rounded = np.rint(matrix)
+        if rounded.size and (rounded.min() < 0 or rounded.max() > 255):
+            raise ValueError("uint8 vectors must have values between 0 and 255")
+        return rounded.astype(np.uint8)
+    raise ValueError(f"Unknown vector datatype: {datatype}")
+
+
+def prepare_vectors(vectors, dim: Optional[int] = None, normalize: bool = False,
+                    truncate_dim: Optional[int] = None, inplace: bool = False,
+                    datatype: str = "float32") -> np.ndarray:
+    """
+    Convert, truncate, check and normalize ``vectors`` as one float32 matrix,
+    then round it to ``datatype``.
+
+    When ``vectors`` already is a contiguous float32 array it is only
+    normalized in place with ``inplace=True``, otherwise a copy is normalized.
+    """
+    matrix = as_float32(vectors)
+    if truncate_dim is not None:
+        matrix = truncate(matrix, truncate_dim)
+    if dim is not None:
+        validate_dimension(matrix, dim)
+    if normalize:
+        if not inplace and isinstance(vectors, np.ndarray) and np.may_share_memory(matrix, vectors):
+            matrix = matrix.copy()
+        matrix = l2_normalize(matrix)
+    return convert_datatype(matrix, datatype)
+
+
+def preprocessing_enabled(config) -> bool:
+    return (
+        config.vector_normalize
+        or config.vector_truncate_dim is not None
+        or config.vector_dim is not None
+        or config.vector_datatype != "float32"
+    )
+
+
+def preprocess(config, vectors, for_query: bool = False) -> np.ndarray:
+    """
+    ``prepare_vectors`` with the stages enabled in the addon configuration.
+
+    Query vectors are truncated, checked and normalized like stored vectors but
+    stay float32: Qdrant scores them against any datatype, and rounding them
+    to ``uint8`` would only lose precision.
+    """
+    return prepare_vectors(
+        vectors,
+        dim=config.vector_dim,
+        normalize=config.vector_normalize,
+        truncate_dim=config.vector_truncate_dim,
+        datatype="float32" if for_query else config.vector_datatype
+    )
+
+
+def preprocess_points(config, points: list) -> list:
+    """
+    Copies of ``points`` with their unnamed dense vectors preprocessed in one
+    matrix; points with named or no vectors are returned as they are.
+    """
+    dense = [i for i, point in enumerate(points) if point.get("vector") is not None and not isinstance(point["vector"], dict)]
+    if not dense or not preprocessing_enabled(config):
+        return points
+    rows = preprocess(config, [points[i]["vector"] for i in dense]).tolist()
+    points = list(points)
+    for i, row in zip(dense, rows):
+        points[i] = {**points[i], "vector": row}
+    return points
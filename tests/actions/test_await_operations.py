@@ -0,0 +1,92 @@
+from unittest.mock import Mock, patch
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointStruct, UpdateResult, UpdateStatus, VectorParams
+
+from qdrant_rooms_pkg.actions.await_operations import await_operations
+from qdrant_rooms_pkg.actions.delete_points import delete_points
+from qdrant_rooms_pkg.actions.search_points import search_points
+from qdrant_rooms_pkg.actions.upsert_points import upsert_points
+
+
+def _acknowledged(operation_id):
+    return Mock(operation_id=operation_id, status=UpdateStatus.ACKNOWLEDGED)
+
+
+class TestAwaitOperations:
+    def test_fire_and_forget_then_await(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            client = MockClient.return_value
+            client.upsert.return_value = _acknowledged(5)
+            client.delete.side_effect = [_acknowledged(6), Mock(operation_id=7, status=UpdateStatus.COMPLETED)]
+
+            upserted = upsert_points(qdrant_config, "docs", [{"id": 1, "vector": [0.1, 0.2]}], wait=False)
+            deleted = delete_points(qdrant_config, "docs", ids=[2], wait=False)
+
+            assert upserted.output.operation_id == 5
+            assert upserted.output.status == "acknowledged"
+            assert client.upsert.call_args.kwargs["wait"] is False
+            assert deleted.output.operation_id == 6
+
+            response = await_operations(qdrant_config, "docs")
+
+            assert response.code == 200
+            assert response.output.completed == [5, 6]
+            assert client.delete.call_args.kwargs["wait"] is True
+
+            again = await_operations(qdrant_config, "docs")
+
+            assert again.output.completed == []
+            assert client.delete.call_count == 2
+
+    def test_await_selected_ids_only(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            client = MockClient.return_value
+            client.upsert.return_value = _acknowledged(3)
+            upsert_points(qdrant_config, "docs", [{"id": 1, "vector": [0.1, 0.2]}], wait=False)
+
+            response = await_operations(qdrant_config, "docs", operation_ids=[99])
+
+            assert response.output.completed == []
+            client.delete.assert_not_called()
+
+    def test_waited_writes_are_not_tracked(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            client = MockClient.return_value
+            client.upsert.return_value = Mock(operation_id=1, status=UpdateStatus.COMPLETED)
+            upsert_points(qdrant_config, "docs", [{"id": 1, "vector": [0.1, 0.2]}])
+
+            assert await_operations(qdrant_config, "docs").output.completed == []
+            client.delete.assert_not_called()
+
+    def test_await_drops_stale_hot_tier_mirror(self, qdrant_config):
+        qdrant_config.hot_tier_enabled = True
+        client = QdrantClient(":memory:")
+        client.create_collection("await_hot", vectors_config=VectorParams(size=2, distance=Distance.COSINE))
+        client.upsert("await_hot", points=[
+            PointStruct(id=1, vector=[1.0, 0.0]), PointStruct(id=2, vector=[0.0, 1.0])
+        ])
+
+        # a wait=False delete is only applied once the next waited write reaches Qdrant
+        apply_delete = client.delete
+        deferred = []
+
+        def delete(**kwargs):
+            if not kwargs["wait"]:
+                deferred.append(kwargs)
+                return UpdateResult(operation_id=len(deferred), status=UpdateStatus.ACKNOWLEDGED)
+            for pending in deferred:
+                apply_delete(**{**pending, "wait": True})
+            deferred.clear()
+            return apply_delete(**kwargs)
+
+        client.delete = delete
+
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient", return_value=client):
+            delete_points(qdrant_config, "await_hot", ids=[1], wait=False)
+            stale = search_points(qdrant_config, "await_hot", [1.0, 0.0], limit=2)
+            await_operations(qdrant_config, "await_hot")
+            fresh = search_points(qdrant_config, "await_hot", [1.0, 0.0], limit=2)
+
+        assert [result["id"] for result in stale.output.results] == [1, 2]
+        assert [result["id"] for result in fresh.output.results] == [2]
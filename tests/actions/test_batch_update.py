@@ -0,0 +1,105 @@
+from unittest.mock import patch
+
+import pytest
+from qdrant_client import QdrantClient
+
+from qdrant_rooms_pkg.actions.batch_update import batch_update
+from qdrant_rooms_pkg.actions.create_collection import create_collection
+from qdrant_rooms_pkg.actions.upsert_points import upsert_points
+
+
+def _payloads(client, collection_name):
+    records, _ = client.scroll(collection_name, limit=100, with_payload=True)
+    return {record.id: record.payload for record in records}
+
+
+class TestBatchUpdate:
+    def test_mixed_operations_in_order(self, qdrant_config, local_client):
+        create_collection(qdrant_config, "memories", vector_size=2)
+        upsert_points(qdrant_config, "memories", [
+            {"id": 1, "vector": [1.0, 0.0], "payload": {"tag": "old", "draft": True}},
+            {"id": 2, "vector": [0.0, 1.0], "payload": {"tag": "old"}},
+        ])
+
+        response = batch_update(qdrant_config, "memories", [
+            {"type": "upsert", "points": [{"id": 3, "vector": [0.5, 0.5], "payload": {"tag": "new"}}]},
+            {"type": "delete", "ids": [2]},
+            {"type": "set_payload", "ids": [1], "payload": {"tag": "kept"}},
+            {"type": "delete_payload", "filter": {"must": [{"key": "tag", "match": {"value": "kept"}}]}, "keys": ["draft"]},
+        ])
+
+        assert response.code == 200
+        assert [result["type"] for result in response.output.results] == ["upsert", "delete", "set_payload", "delete_payload"]
+        assert all(result["status"] == "completed" for result in response.output.results)
+        assert _payloads(local_client, "memories") == {1: {"tag": "kept"}, 3: {"tag": "new"}}
+
+    def test_overwrite_and_clear_keep_room(self, qdrant_config, local_client):
+        qdrant_config.tenancy_enabled = True
+        create_collection(qdrant_config, "lobby", vector_size=2)
+        upsert_points(qdrant_config, "lobby", [
+            {"id": 1, "vector": [1.0, 0.0], "payload": {"tag": "a"}},
+            {"id": 2, "vector": [0.0, 1.0], "payload": {"tag": "b"}},
+        ])
+
+        response = batch_update(qdrant_config, "lobby", [
+            {"type": "overwrite_payload", "ids": [1], "payload": {"text": "fresh", "room_id": "kitchen"}},
+            {"type": "clear_payload", "ids": [2]},
+        ])
+
+        assert response.code == 200
+        points = [payload for payload in _payloads(local_client, "rooms").values() if "_room_marker" not in payload]
+        payloads = sorted(points, key=lambda payload: payload["_room_point_id"])
+        assert payloads == [
+            {"text": "fresh", "room_id": "lobby", "_room_point_id": 1},
+            {"room_id": "lobby", "_room_point_id": 2},
+        ]
+
+    def test_overwrite_by_filter_refused_with_tenancy(self, qdrant_config, local_client):
+        qdrant_config.tenancy_enabled = True
+        create_collection(qdrant_config, "lobby", vector_size=2)
+
+        response = batch_update(qdrant_config, "lobby", [
+            {"type": "overwrite_payload", "filter": {"must": []}, "payload": {"text": "x"}},
+        ])
+
+        assert response.code == 500
+        assert "Operation 0 (overwrite_payload)" in response.message
+
+    def test_set_payload_under_reserved_path_refused_with_tenancy(self, qdrant_config, local_client):
+        qdrant_config.tenancy_enabled = True
+        create_collection(qdrant_config, "lobby", vector_size=2)
+
+        response = batch_update(qdrant_config, "lobby", [
+            {"type": "set_payload", "ids": [1], "payload": {"x": 1}, "key": "room_id.inner"},
+        ])
+
+        assert response.code == 500
+        assert "Operation 0 (set_payload)" in response.message
+
+    def test_upserted_vectors_are_preprocessed(self, qdrant_config, local_client):
+        create_collection(qdrant_config, "normalized", vector_size=2, distance="Dot")
+        qdrant_config.vector_normalize = True
+        qdrant_config.vector_dim = 2
+
+        response = batch_update(qdrant_config, "normalized", [
+            {"type": "upsert", "points": [{"id": 1, "vector": [3.0, 4.0]}]}
+        ])
+        mismatch = batch_update(qdrant_config, "normalized", [
+            {"type": "upsert", "points": [{"id": 2, "vector": [1.0, 0.0, 0.0]}]}
+        ])
+
+        assert response.code == 200
+        assert local_client.retrieve("normalized", [1], with_vectors=True)[0].vector == pytest.approx([0.6, 0.8])
+        assert mismatch.code == 500
+        assert "Operation 0 (upsert): Expected vectors of dimension 2" in mismatch.message
+
+    def test_invalid_operation_sends_nothing(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            response = batch_update(qdrant_config, "memories", [
+                {"type": "delete", "ids": [1]},
+                {"type": "set_payload", "ids": [1]},
+            ])
+
+            assert response.code == 500
+            assert "'payload' is required" in response.message
+            MockClient.return_value.batch_update_points.assert_not_called()
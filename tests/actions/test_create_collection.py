@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+from qdrant_client.models import Datatype, ShardingMethod
+
+from qdrant_rooms_pkg.actions.create_collection import create_collection
+
+
+class TestCreateCollection:
+    def test_create_success(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.get_collections.return_value.collections = []
+
+            response = create_collection(qdrant_config, "docs", vector_size=4)
+
+            assert response.code == 200
+            kwargs = MockClient.return_value.create_collection.call_args.kwargs
+            assert kwargs["vectors_config"].size == 4
+            assert kwargs["vectors_config"].datatype == Datatype.FLOAT32
+            assert "shard_number" not in kwargs
+
+    def test_create_with_datatype(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.get_collections.return_value.collections = []
+
+            response = create_collection(qdrant_config, "docs", vector_size=4, datatype="float16")
+            assert response.code == 200
+            assert MockClient.return_value.create_collection.call_args.kwargs["vectors_config"].datatype == Datatype.FLOAT16
+
+            qdrant_config.vector_datatype = "uint8"
+            create_collection(qdrant_config, "docs", vector_size=4)
+            assert MockClient.return_value.create_collection.call_args.kwargs["vectors_config"].datatype == Datatype.UINT8
+
+            response = create_collection(qdrant_config, "docs", vector_size=4, datatype="int4")
+            assert response.code == 500
+            assert "Unknown vector datatype" in response.message
+
+            response = create_collection(qdrant_config, "docs", vector_size=4, datatype="float32")
+            assert response.code == 500
+            assert "vector_datatype 'uint8'" in response.message
+
+    def test_create_with_sharding_and_replication(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            client = MockClient.return_value
+            client.get_collections.return_value.collections = []
+
+            response = create_collection(
+                qdrant_config, "docs", vector_size=4,
+                shard_number=2, replication_factor=3, write_consistency_factor=2,
+                sharding_method="custom", shard_keys=["eu", "us"]
+            )
+
+            assert response.code == 200
+            kwargs = client.create_collection.call_args.kwargs
+            assert kwargs["shard_number"] == 2
+            assert kwargs["replication_factor"] == 3
+            assert kwargs["write_consistency_factor"] == 2
+            assert kwargs["sharding_method"] == ShardingMethod.CUSTOM
+            assert [c.kwargs["shard_key"] for c in client.create_shard_key.call_args_list] == ["eu", "us"]
+
+    def test_shard_keys_require_custom_sharding(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.get_collections.return_value.collections = []
+
+            response = create_collection(qdrant_config, "docs", vector_size=4, shard_keys=["eu"])
+
+            assert response.code == 500
+            MockClient.return_value.create_collection.assert_not_called()
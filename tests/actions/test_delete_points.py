@@ -0,0 +1,67 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import PointIdsList, UpdateStatus
+
+from qdrant_rooms_pkg.actions.create_collection import create_collection
+from qdrant_rooms_pkg.actions.delete_points import delete_points
+from qdrant_rooms_pkg.actions.search_points import search_points
+from qdrant_rooms_pkg.actions.upsert_points import upsert_points
+
+
+def _seed(config, collection_name):
+    create_collection(config, collection_name, vector_size=2)
+    upsert_points(config, collection_name, [
+        {"id": 1, "vector": [1.0, 0.0], "payload": {"ts": 100}},
+        {"id": 2, "vector": [0.0, 1.0], "payload": {"ts": 200}},
+        {"id": 3, "vector": [0.5, 0.5], "payload": {"ts": 300}},
+    ])
+
+
+def _ids(config, collection_name):
+    results = search_points(config, collection_name, [1.0, 1.0], limit=10).output.results
+    return sorted(result["id"] for result in results)
+
+
+class TestDeletePoints:
+    def test_delete_by_ids(self, qdrant_config, local_client):
+        qdrant_config.search_singleflight = False
+        _seed(qdrant_config, "memories")
+
+        response = delete_points(qdrant_config, "memories", ids=[1, 3])
+
+        assert response.code == 200
+        assert response.output.status == "completed"
+        assert _ids(qdrant_config, "memories") == [2]
+
+    def test_delete_by_filter_in_room(self, qdrant_config, local_client):
+        qdrant_config.tenancy_enabled = True
+        qdrant_config.search_singleflight = False
+        _seed(qdrant_config, "lobby")
+        _seed(qdrant_config, "kitchen")
+
+        response = delete_points(qdrant_config, "lobby", query_filter={"must": [{"key": "ts", "range": {"lt": 250}}]})
+
+        assert response.code == 200
+        assert _ids(qdrant_config, "lobby") == [3]
+        assert _ids(qdrant_config, "kitchen") == [1, 2, 3]
+
+    def test_delete_without_waiting(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.delete.return_value = Mock(operation_id=17, status=UpdateStatus.ACKNOWLEDGED)
+
+            response = delete_points(qdrant_config, "memories", ids=[1], wait=False)
+
+            assert response.output.operation_id == 17
+            assert response.output.status == "acknowledged"
+            kwargs = MockClient.return_value.delete.call_args.kwargs
+            assert kwargs["wait"] is False
+            assert kwargs["points_selector"] == PointIdsList(points=[1])
+
+    def test_delete_requires_ids_or_filter(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            response = delete_points(qdrant_config, "memories")
+
+            assert response.code == 500
+            MockClient.return_value.delete.assert_not_called()
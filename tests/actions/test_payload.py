@@ -0,0 +1,111 @@
+from unittest.mock import patch
+
+import pytest
+from qdrant_client import QdrantClient
+
+from qdrant_rooms_pkg.actions.create_collection import create_collection
+from qdrant_rooms_pkg.actions.delete_payload_keys import delete_payload_keys
+from qdrant_rooms_pkg.actions.overwrite_payload import overwrite_payload
+from qdrant_rooms_pkg.actions.search_points import search_points
+from qdrant_rooms_pkg.actions.set_payload import set_payload
+from qdrant_rooms_pkg.actions.upsert_points import upsert_points
+
+
+@pytest.fixture
+def config(qdrant_config):
+    qdrant_config.search_singleflight = False
+    return qdrant_config
+
+
+def _seed(config, collection_name):
+    create_collection(config, collection_name, vector_size=2)
+    upsert_points(config, collection_name, [
+        {"id": 1, "vector": [1.0, 0.0], "payload": {"tag": "a", "ts": 1}},
+        {"id": 2, "vector": [0.0, 1.0], "payload": {"tag": "b", "ts": 2}},
+    ])
+
+
+def _payloads(config, collection_name):
+    results = search_points(config, collection_name, [1.0, 1.0], limit=10).output.results
+    return {result["id"]: result["payload"] for result in results}
+
+
+class TestPayloadActions:
+    def test_set_payload_by_ids(self, config, local_client):
+        _seed(config, "memories")
+
+        response = set_payload(config, "memories", {"tag": "pinned"}, ids=[1])
+
+        assert response.code == 200
+        assert response.output.status == "completed"
+        assert _payloads(config, "memories") == {1: {"tag": "pinned", "ts": 1}, 2: {"tag": "b", "ts": 2}}
+
+    def test_set_payload_by_filter_sends_no_vectors(self, config, local_client):
+        _seed(config, "memories")
+
+        with patch.object(local_client, "upsert") as upsert:
+            set_payload(config, "memories", {"seen": True}, query_filter={"must": [{"key": "ts", "range": {"gte": 2}}]})
+
+        upsert.assert_not_called()
+        assert _payloads(config, "memories")[2] == {"tag": "b", "ts": 2, "seen": True}
+
+    def test_overwrite_payload(self, config, local_client):
+        _seed(config, "memories")
+
+        response = overwrite_payload(config, "memories", {"text": "only"}, ids=[2])
+
+        assert response.code == 200
+        assert _payloads(config, "memories")[2] == {"text": "only"}
+
+    def test_delete_payload_keys(self, config, local_client):
+        _seed(config, "memories")
+
+        response = delete_payload_keys(config, "memories", ["ts"], ids=[1, 2])
+
+        assert response.code == 200
+        assert _payloads(config, "memories") == {1: {"tag": "a"}, 2: {"tag": "b"}}
+
+    def test_payload_actions_keep_points_in_room(self, config, local_client):
+        config.tenancy_enabled = True
+        _seed(config, "lobby")
+        _seed(config, "kitchen")
+
+        set_payload(config, "lobby", {"room_id": "kitchen", "tag": "moved"}, ids=[1])
+        overwrite_payload(config, "lobby", {"text": "fresh"}, ids=[1, 2])
+        delete_payload_keys(config, "lobby", ["room_id", "_room_point_id", "text"], ids=[2])
+
+        assert _payloads(config, "lobby") == {1: {"text": "fresh"}, 2: {}}
+        assert _payloads(config, "kitchen") == {1: {"tag": "a", "ts": 1}, 2: {"tag": "b", "ts": 2}}
+
+    def test_set_payload_under_reserved_path_refused_with_tenancy(self, config, local_client):
+        config.tenancy_enabled = True
+        _seed(config, "lobby")
+
+        for key in ("room_id", "room_id.inner", "_room_point_id[0]", '"_room_marker".x'):
+            response = set_payload(config, "lobby", {"x": 1}, ids=[1], key=key)
+            assert response.code == 500
+            assert "reserved" in response.message
+
+        assert set_payload(config, "lobby", {"x": 1}, ids=[1], key="room_idea").code == 200
+        assert _payloads(config, "lobby")[1] == {"tag": "a", "ts": 1, "room_idea": {"x": 1}}
+
+    def test_delete_payload_paths_inside_room_keys_ignored(self, config, local_client):
+        config.tenancy_enabled = True
+        _seed(config, "lobby")
+
+        keys = ["room_id.x", "_room_point_id[0]", '"_room_marker".x', "room_idea", "ts"]
+        with patch.object(local_client, "delete_payload", wraps=local_client.delete_payload) as delete_payload:
+            response = delete_payload_keys(config, "lobby", keys, ids=[1])
+
+        assert response.code == 200
+        assert delete_payload.call_args.kwargs["keys"] == ["room_idea", "ts"]
+        assert _payloads(config, "lobby")[1] == {"tag": "a"}
+
+    def test_overwrite_by_filter_refused_with_tenancy(self, config, local_client):
+        config.tenancy_enabled = True
+        _seed(config, "lobby")
+
+        response = overwrite_payload(config, "lobby", {"text": "x"}, query_filter={"must": []})
+
+        assert response.code == 500
+        assert _payloads(config, "lobby")[1] == {"tag": "a", "ts": 1}
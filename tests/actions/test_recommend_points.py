@@ -0,0 +1,76 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import RecommendStrategy
+
+from qdrant_rooms_pkg.actions.create_collection import create_collection
+from qdrant_rooms_pkg.actions.recommend_points import recommend_points
+from qdrant_rooms_pkg.actions.upsert_points import upsert_points
+
+
+def _seed(config):
+    create_collection(config, "memories", vector_size=2)
+    upsert_points(config, "memories", [
+        {"id": 1, "vector": [1.0, 0.0], "payload": {"text": "cat"}},
+        {"id": 2, "vector": [0.9, 0.1], "payload": {"text": "kitten"}},
+        {"id": 3, "vector": [0.0, 1.0], "payload": {"text": "car"}},
+    ])
+
+
+class TestRecommendPoints:
+    def test_recommend_by_point_id(self, qdrant_config, local_client):
+        _seed(qdrant_config)
+
+        response = recommend_points(qdrant_config, "memories", positive=[1], limit=1)
+
+        assert response.code == 200
+        assert response.output.results[0]["id"] == 2
+        assert response.output.results[0]["payload"] == {"text": "kitten"}
+
+    def test_recommend_in_room(self, qdrant_config, local_client):
+        qdrant_config.tenancy_enabled = True
+        _seed(qdrant_config)
+
+        response = recommend_points(qdrant_config, "memories", positive=[1], negative=[3], strategy="best_score", limit=5)
+
+        assert response.code == 200
+        assert [result["id"] for result in response.output.results][0] == 2
+        assert all("room_id" not in result["payload"] for result in response.output.results)
+
+    def test_vector_examples_are_preprocessed(self, qdrant_config):
+        qdrant_config.vector_normalize = True
+        qdrant_config.vector_truncate_dim = 2
+
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.recommend.return_value = []
+
+            response = recommend_points(qdrant_config, "memories", positive=[1, [3.0, 4.0, 5.0]])
+
+            assert response.code == 200
+            positive = MockClient.return_value.recommend.call_args.kwargs["positive"]
+            assert positive[0] == 1
+            assert positive[1] == pytest.approx([0.6, 0.8])
+
+    def test_recommend_params(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.recommend.return_value = [Mock(id=5, score=0.8, payload={})]
+
+            response = recommend_points(
+                qdrant_config, "memories", positive=[1, [0.1, 0.2]], negative=[2], strategy="best_score",
+                query_filter={"must": [{"key": "room", "match": {"value": "lobby"}}]}, shard_key="eu"
+            )
+
+            assert response.code == 200
+            kwargs = MockClient.return_value.recommend.call_args.kwargs
+            assert kwargs["positive"] == [1, [0.1, 0.2]]
+            assert kwargs["negative"] == [2]
+            assert kwargs["strategy"] == RecommendStrategy.BEST_SCORE
+            assert kwargs["query_filter"].must[0].key == "room"
+            assert kwargs["shard_key_selector"] == "eu"
+
+    def test_recommend_invalid_strategy(self, qdrant_config):
+        response = recommend_points(qdrant_config, "memories", positive=[1], strategy="nearest")
+
+        assert response.code == 500
+        assert response.output.success is False
@@ -0,0 +1,123 @@
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from qdrant_rooms_pkg.actions.create_collection import create_collection
+from qdrant_rooms_pkg.actions.delete_collection import delete_collection
+from qdrant_rooms_pkg.actions.search_collections import search_collections
+
+
+@pytest.fixture
+def seeded_client(local_client):
+    client = local_client
+    client.create_collection("lobby", vectors_config=VectorParams(size=2, distance=Distance.DOT))
+    client.create_collection("kitchen", vectors_config=VectorParams(size=2, distance=Distance.DOT))
+    client.upsert("lobby", [
+        PointStruct(id=1, vector=[1.0, 0.0], payload={"text": "hello"}),
+        PointStruct(id=2, vector=[0.5, 0.0], payload={"text": "hi"}),
+    ])
+    client.upsert("kitchen", [
+        PointStruct(id=1, vector=[10.0, 0.0], payload={"text": "soup"}),
+        PointStruct(id=2, vector=[8.0, 0.0], payload={"text": "bread"}),
+        PointStruct(id=3, vector=[1.0, 0.0], payload={"text": "salt"}),
+    ])
+    return client
+
+
+class TestSearchCollections:
+    def test_merges_top_k(self, qdrant_config, seeded_client):
+        response = search_collections(qdrant_config, ["lobby", "kitchen"], [1.0, 0.0], limit=3)
+
+        assert response.code == 200
+        assert [(r["collection_name"], r["id"]) for r in response.output.results] == [
+            ("kitchen", 1), ("kitchen", 2), ("lobby", 1)
+        ]
+        assert response.output.results[0]["raw_score"] == pytest.approx(10.0)
+        assert [source["collection_name"] for source in response.output.sources] == ["lobby", "kitchen"]
+        assert all(source["success"] and source["latency_ms"] >= 0 for source in response.output.sources)
+
+    def test_min_max_normalization(self, qdrant_config, seeded_client):
+        response = search_collections(qdrant_config, ["lobby", "kitchen"], [1.0, 0.0], limit=5, normalization="min_max")
+
+        results = response.output.results
+        assert [result["score"] for result in results[:2]] == [1.0, 1.0]
+        assert {results[0]["collection_name"], results[1]["collection_name"]} == {"lobby", "kitchen"}
+        assert results[-1]["score"] == 0.0
+
+    def test_distance_collections_merge_lowest_first(self, qdrant_config, seeded_client):
+        for name, vectors in (("e1", [[1.0, 0.0], [30.0, 0.0]]), ("e2", [[1.1, 0.0], [21.0, 20.0]])):
+            seeded_client.create_collection(name, vectors_config=VectorParams(size=2, distance=Distance.EUCLID))
+            seeded_client.upsert(name, [PointStruct(id=i, vector=vector) for i, vector in enumerate(vectors)])
+
+        response = search_collections(qdrant_config, ["e1", "e2"], [1.0, 0.0], limit=2)
+        normalized = search_collections(qdrant_config, ["e1", "e2"], [1.0, 0.0], limit=2, normalization="min_max")
+
+        assert [(r["collection_name"], r["score"]) for r in response.output.results] == [
+            ("e1", pytest.approx(0.0)), ("e2", pytest.approx(0.1))
+        ]
+        assert [(r["collection_name"], r["score"]) for r in normalized.output.results] == [
+            ("e1", pytest.approx(1.0)), ("e2", pytest.approx(1.0))
+        ]
+        assert normalized.output.results[0]["raw_score"] == pytest.approx(0.0)
+
+    def test_distance_looked_up_once_per_collection(self, qdrant_config, seeded_client):
+        with patch.object(seeded_client, "get_collection", wraps=seeded_client.get_collection) as get_collection:
+            search_collections(qdrant_config, ["lobby", "kitchen"], [1.0, 0.0])
+            search_collections(qdrant_config, ["lobby", "kitchen"], [1.0, 0.0])
+            assert get_collection.call_count == 2
+
+            create_collection(qdrant_config, "lobby", vector_size=2, distance="Euclid", if_exists="recreate")
+            seeded_client.upsert("lobby", [PointStruct(id=1, vector=[1.0, 0.0])])
+            delete_collection(qdrant_config, "kitchen")
+            seeded_client.create_collection("kitchen", vectors_config=VectorParams(size=2, distance=Distance.EUCLID))
+            seeded_client.upsert("kitchen", [PointStruct(id=1, vector=[3.0, 0.0])])
+            response = search_collections(qdrant_config, ["lobby", "kitchen"], [1.0, 0.0])
+
+        assert get_collection.call_count == 4
+        assert [r["collection_name"] for r in response.output.results] == ["lobby", "kitchen"]
+
+    def test_mixed_metrics_need_normalization(self, qdrant_config, seeded_client):
+        seeded_client.create_collection("e3", vectors_config=VectorParams(size=2, distance=Distance.EUCLID))
+        seeded_client.upsert("e3", [PointStruct(id=1, vector=[1.0, 0.0])])
+
+        response = search_collections(qdrant_config, ["lobby", "e3"], [1.0, 0.0])
+
+        assert response.code == 500
+        assert "without normalization" in response.message
+        assert search_collections(qdrant_config, ["lobby", "e3"], [1.0, 0.0], normalization="z_score").code == 200
+
+    def test_searches_run_concurrently(self, qdrant_config):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def search(**kwargs):
+            barrier.wait()
+            return [Mock(id=1, score=0.5, payload={})]
+
+        qdrant_config.search_singleflight = False
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.search.side_effect = search
+            MockClient.return_value.get_collection.return_value.config.params.vectors = VectorParams(
+                size=2, distance=Distance.DOT
+            )
+
+            response = search_collections(qdrant_config, ["a", "b", "c"], [1.0, 0.0])
+
+        assert response.code == 200
+        assert response.output.results_count == 3
+
+    def test_partial_failure(self, qdrant_config, seeded_client):
+        response = search_collections(qdrant_config, ["lobby", "missing"], [1.0, 0.0])
+
+        assert response.code == 200
+        assert [result["collection_name"] for result in response.output.results] == ["lobby", "lobby"]
+        assert response.output.sources[1]["success"] is False
+        assert "1 collections failed" in response.output.message
+
+    def test_all_failed(self, qdrant_config, seeded_client):
+        response = search_collections(qdrant_config, ["missing"], [1.0, 0.0])
+
+        assert response.code == 500
+        assert response.output.sources[0]["collection_name"] == "missing"
@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+import pytest
+from qdrant_client import QdrantClient
+
+from qdrant_rooms_pkg.actions.create_collection import create_collection
+from qdrant_rooms_pkg.actions.search_groups import search_groups
+from qdrant_rooms_pkg.actions.upsert_points import upsert_points
+
+
+def _seed(config):
+    create_collection(config, "chunks", vector_size=2)
+    upsert_points(config, "chunks", [
+        {"id": 1, "vector": [1.0, 0.0], "payload": {"doc": "a", "text": "a1"}},
+        {"id": 2, "vector": [0.99, 0.05], "payload": {"doc": "a", "text": "a2"}},
+        {"id": 3, "vector": [0.98, 0.1], "payload": {"doc": "a", "text": "a3"}},
+        {"id": 4, "vector": [0.9, 0.3], "payload": {"doc": "b", "text": "b1"}},
+        {"id": 5, "vector": [0.0, 1.0], "payload": {"doc": "c", "text": "c1"}},
+    ])
+
+
+class TestSearchGroups:
+    def test_top_hit_per_document(self, qdrant_config, local_client):
+        _seed(qdrant_config)
+
+        response = search_groups(qdrant_config, "chunks", [1.0, 0.0], group_by="doc", limit=2)
+
+        assert response.code == 200
+        assert response.output.groups_count == 2
+        assert [group["id"] for group in response.output.groups] == ["a", "b"]
+        assert [hit["id"] for hit in response.output.groups[0]["hits"]] == [1]
+        assert response.output.groups[1]["hits"][0]["payload"] == {"doc": "b", "text": "b1"}
+
+    def test_group_size_and_payload_keys(self, qdrant_config, local_client):
+        _seed(qdrant_config)
+
+        response = search_groups(qdrant_config, "chunks", [1.0, 0.0], group_by="doc", limit=1, group_size=2,
+                                 with_payload=["text"])
+
+        assert [hit["id"] for hit in response.output.groups[0]["hits"]] == [1, 2]
+        assert response.output.groups[0]["hits"][0]["payload"] == {"text": "a1"}
+
+    def test_groups_in_room(self, qdrant_config, local_client):
+        qdrant_config.tenancy_enabled = True
+        _seed(qdrant_config)
+
+        response = search_groups(qdrant_config, "chunks", [1.0, 0.0], group_by="doc", limit=3, with_payload=False)
+
+        assert response.code == 200
+        assert [group["id"] for group in response.output.groups] == ["a", "b", "c"]
+        assert response.output.groups[0]["hits"] == [{"id": 1, "score": pytest.approx(1.0), "payload": None}]
+
+    def test_search_groups_error(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.search_groups.side_effect = Exception("unavailable")
+
+            response = search_groups(qdrant_config, "chunks", [1.0, 0.0], group_by="doc")
+
+            assert response.code == 500
+            assert response.output.groups == []
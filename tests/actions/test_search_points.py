@@ -0,0 +1,270 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from qdrant_rooms_pkg.actions.search_points import search_points
+from qdrant_rooms_pkg.services.adaptive_ef import ef_controller
+from qdrant_rooms_pkg.services.semantic_cache import semantic_cache
+
+
+def _scored(point_id, score, payload=None):
+    return Mock(id=point_id, score=score, payload=payload or {})
+
+
+def _first_cursor(config):
+    return search_points(config, "docs", [1.0, 0.0], limit=2).output.next_cursor
+
+
+class TestSearchPoints:
+    def test_search_success(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.search.return_value = [_scored(1, 0.9, {"text": "a"})]
+
+            response = search_points(qdrant_config, "docs", [0.1, 0.2], limit=3)
+
+            assert response.code == 200
+            assert response.output.results == [{"id": 1, "score": 0.9, "payload": {"text": "a"}}]
+            kwargs = MockClient.return_value.search.call_args.kwargs
+            assert kwargs["limit"] == 3
+            assert "query_filter" not in kwargs
+
+    def test_search_with_filter(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.search.return_value = []
+            query_filter = {"must": [{"key": "room", "match": {"value": "lobby"}}]}
+
+            response = search_points(qdrant_config, "docs", [0.1, 0.2], query_filter=query_filter)
+
+            assert response.code == 200
+            sent_filter = MockClient.return_value.search.call_args.kwargs["query_filter"]
+            assert sent_filter.must[0].key == "room"
+
+    def test_search_error(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.search.side_effect = Exception("unavailable")
+
+            response = search_points(qdrant_config, "docs", [0.1, 0.2])
+
+            assert response.code == 500
+            assert response.output.success is False
+
+    def test_concurrent_identical_searches_are_collapsed(self, qdrant_config):
+        def slow_search(**kwargs):
+            time.sleep(0.2)
+            return [_scored(1, 0.9)]
+
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.search.side_effect = slow_search
+
+            responses = []
+            threads = [
+                threading.Thread(target=lambda: responses.append(search_points(qdrant_config, "docs", [0.1, 0.2])))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert MockClient.return_value.search.call_count == 1
+            assert [r.output.results_count for r in responses] == [1] * 4
+
+    def test_search_started_before_a_write_is_not_joined(self, qdrant_config):
+        qdrant_config.semantic_cache_enabled = True
+        entered, release = threading.Event(), threading.Event()
+        answers = iter([{"v": "old"}, {"v": "new"}])
+
+        def search(**kwargs):
+            payload = next(answers)
+            if payload["v"] == "old":
+                entered.set()
+                release.wait(5)
+            return [_scored(1, 0.9, payload)]
+
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.search.side_effect = search
+
+            first = []
+            searching = threading.Thread(target=lambda: first.append(search_points(qdrant_config, "docs", [0.1, 0.2])))
+            searching.start()
+            assert entered.wait(5)
+            semantic_cache.invalidate(qdrant_config.endpoint_key(), "docs")
+
+            second = []
+            joining = threading.Thread(target=lambda: second.append(search_points(qdrant_config, "docs", [0.1, 0.2])))
+            joining.start()
+            joining.join(1)
+            release.set()
+            joining.join()
+            searching.join()
+            third = search_points(qdrant_config, "docs", [0.1, 0.2])
+
+            assert first[0].output.results[0]["payload"] == {"v": "old"}
+            assert second[0].output.results[0]["payload"] == {"v": "new"}
+            assert third.output.results[0]["payload"] == {"v": "new"}
+            assert MockClient.return_value.search.call_count == 2
+
+    def test_singleflight_disabled(self, qdrant_config):
+        qdrant_config.search_singleflight = False
+
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.search.return_value = []
+
+            search_points(qdrant_config, "docs", [0.1, 0.2])
+            search_points(qdrant_config, "docs", [0.1, 0.2])
+
+            assert MockClient.return_value.search.call_count == 2
+
+    def test_semantic_cache_skips_qdrant_for_similar_query(self, qdrant_config):
+        qdrant_config.semantic_cache_enabled = True
+
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.search.return_value = [_scored(1, 0.9)]
+
+            first = search_points(qdrant_config, "cached", [0.5, 0.5])
+            second = search_points(qdrant_config, "cached", [0.5, 0.5001])
+
+            assert MockClient.return_value.search.call_count == 1
+            assert second.output.results == first.output.results
+
+    def test_hot_tier_answers_small_collection_locally(self, qdrant_config):
+        from qdrant_client.models import Distance, VectorParams
+
+        qdrant_config.hot_tier_enabled = True
+
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            client = MockClient.return_value
+            client.get_collection.return_value = Mock(
+                points_count=2,
+                config=Mock(params=Mock(vectors=VectorParams(size=2, distance=Distance.DOT)))
+            )
+            client.scroll.return_value = (
+                [Mock(id=1, vector=[1.0, 0.0], payload={}), Mock(id=2, vector=[0.0, 1.0], payload={})],
+                None
+            )
+
+            first = search_points(qdrant_config, "hot", [0.0, 2.0], limit=1)
+            second = search_points(qdrant_config, "hot", [2.0, 0.0], limit=1)
+
+            client.search.assert_not_called()
+            assert client.scroll.call_count == 1
+            assert first.output.results[0]["id"] == 2
+            assert second.output.results[0]["id"] == 1
+
+    def test_search_with_shard_key(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.search.return_value = []
+
+            search_points(qdrant_config, "docs", [0.1, 0.2], shard_key="eu")
+
+            assert MockClient.return_value.search.call_args.kwargs["shard_key_selector"] == "eu"
+
+    def test_search_params(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.search.return_value = []
+
+            search_points(qdrant_config, "docs", [0.1, 0.2])
+            assert "search_params" not in MockClient.return_value.search.call_args.kwargs
+
+            search_points(qdrant_config, "docs", [0.1, 0.2], hnsw_ef=128, indexed_only=True, rescore=True, oversampling=2.0)
+            params = MockClient.return_value.search.call_args.kwargs["search_params"]
+            assert params.hnsw_ef == 128
+            assert params.exact is False
+            assert params.indexed_only is True
+            assert params.quantization.rescore is True
+            assert params.quantization.oversampling == 2.0
+
+    def test_adaptive_ef_lowers_ef_when_slow(self, qdrant_config):
+        qdrant_config.adaptive_ef_enabled = True
+        qdrant_config.adaptive_ef_target_ms = 1.0
+        qdrant_config.search_singleflight = False
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            def slow_search(**kwargs):
+                time.sleep(0.002)
+                return []
+
+            MockClient.return_value.search.side_effect = slow_search
+
+            for _ in range(ef_controller.window):
+                search_points(qdrant_config, "docs", [0.1, 0.2])
+            assert MockClient.return_value.search.call_args.kwargs["search_params"].hnsw_ef == 256
+
+            search_points(qdrant_config, "docs", [0.1, 0.2])
+            assert MockClient.return_value.search.call_args.kwargs["search_params"].hnsw_ef == 192
+
+            search_points(qdrant_config, "docs", [0.1, 0.2], hnsw_ef=64)
+            assert MockClient.return_value.search.call_args.kwargs["search_params"].hnsw_ef == 64
+
+    def test_offset_is_sent_and_part_of_the_cache_key(self, qdrant_config):
+        qdrant_config.semantic_cache_enabled = True
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            MockClient.return_value.search.side_effect = [[_scored(1, 0.9)], [_scored(2, 0.8)]]
+
+            first = search_points(qdrant_config, "paged", [0.1, 0.2], limit=1)
+            second = search_points(qdrant_config, "paged", [0.1, 0.2], limit=1, offset=1)
+
+            assert "offset" not in MockClient.return_value.search.call_args_list[0].kwargs
+            assert MockClient.return_value.search.call_args.kwargs["offset"] == 1
+            assert first.output.results[0]["id"] == 1
+            assert second.output.results[0]["id"] == 2
+
+    def test_cursor_pages_through_results(self, qdrant_config):
+        client = QdrantClient(":memory:")
+        client.create_collection("docs", vectors_config=VectorParams(size=2, distance=Distance.COSINE))
+        client.upsert("docs", [PointStruct(id=i, vector=[1.0, i / 10]) for i in range(5)])
+
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient", return_value=client):
+            pages = []
+            cursor = None
+            while True:
+                response = search_points(qdrant_config, "docs", [1.0, 0.0], limit=2, cursor=cursor)
+                assert response.code == 200
+                pages.append([result["id"] for result in response.output.results])
+                cursor = response.output.next_cursor
+                if cursor is None:
+                    break
+
+            other = search_points(qdrant_config, "docs", [0.0, 1.0], limit=2, cursor=_first_cursor(qdrant_config))
+            both = search_points(qdrant_config, "docs", [1.0, 0.0], limit=2, offset=2, cursor=_first_cursor(qdrant_config))
+
+        assert pages == [[0, 1], [2, 3], [4]]
+        assert other.code == 500
+        assert "different search" in other.message
+        assert both.code == 500
+
+    def test_hot_tier_pages(self, qdrant_config):
+        qdrant_config.hot_tier_enabled = True
+        client = QdrantClient(":memory:")
+        client.create_collection("hot_pages", vectors_config=VectorParams(size=2, distance=Distance.COSINE))
+        client.upsert("hot_pages", [PointStruct(id=i, vector=[1.0, i / 10]) for i in range(3)])
+
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient", return_value=client):
+            response = search_points(qdrant_config, "hot_pages", [1.0, 0.0], limit=2, offset=1)
+
+        assert [result["id"] for result in response.output.results] == [1, 2]
+
+    def test_hot_tier_discards_mirror_loaded_across_a_write(self, qdrant_config, local_client):
+        from qdrant_rooms_pkg.actions.upsert_points import upsert_points
+
+        qdrant_config.hot_tier_enabled = True
+        local_client.create_collection("racy", vectors_config=VectorParams(size=2, distance=Distance.DOT))
+        local_client.upsert("racy", [PointStruct(id=1, vector=[1.0, 0.0])])
+        scroll = local_client.scroll
+
+        def scroll_then_write(**kwargs):
+            page = scroll(**kwargs)
+            if not upserted:
+                upserted.append(upsert_points(qdrant_config, "racy", [{"id": 2, "vector": [0.0, 1.0]}]))
+            return page
+
+        upserted = []
+        with patch.object(local_client, "scroll", side_effect=scroll_then_write):
+            during = search_points(qdrant_config, "racy", [1.0, 1.0], limit=5)
+            after = search_points(qdrant_config, "racy", [1.0, 1.0], limit=5)
+
+        assert upserted[0].code == 200
+        assert sorted(result["id"] for result in during.output.results) == [1, 2]
+        assert sorted(result["id"] for result in after.output.results) == [1, 2]
@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+import pytest
+from qdrant_client import QdrantClient
+
+from qdrant_rooms_pkg.actions.create_collection import create_collection
+from qdrant_rooms_pkg.actions.delete_collection import delete_collection
+from qdrant_rooms_pkg.actions.search_points import search_points
+from qdrant_rooms_pkg.actions.upsert_points import upsert_points
+
+
+@pytest.fixture
+def tenancy_config(qdrant_config):
+    qdrant_config.tenancy_enabled = True
+    qdrant_config.search_singleflight = False
+    return qdrant_config
+
+
+class TestRoomTenancy:
+    def test_rooms_share_one_collection(self, tenancy_config, local_client):
+        assert create_collection(tenancy_config, "lobby", vector_size=2).code == 200
+        assert create_collection(tenancy_config, "kitchen", vector_size=2).code == 200
+
+        assert [c.name for c in local_client.get_collections().collections] == ["rooms"]
+
+    def test_points_are_isolated_per_room(self, tenancy_config, local_client):
+        create_collection(tenancy_config, "lobby", vector_size=2)
+        upsert_points(tenancy_config, "lobby", [{"id": 1, "vector": [1.0, 0.0], "payload": {"text": "hello"}}])
+        upsert_points(tenancy_config, "kitchen", [{"id": 1, "vector": [1.0, 0.0], "payload": {"text": "soup"}}])
+
+        response = search_points(tenancy_config, "lobby", [1.0, 0.0], limit=10)
+
+        assert response.output.results_count == 1
+        assert response.output.results[0]["id"] == 1
+        assert response.output.results[0]["payload"] == {"text": "hello"}
+
+    def test_existing_room_detection(self, tenancy_config, local_client):
+        create_collection(tenancy_config, "lobby", vector_size=2)
+        upsert_points(tenancy_config, "lobby", [{"id": 1, "vector": [1.0, 0.0]}])
+
+        assert create_collection(tenancy_config, "lobby", vector_size=2).code == 409
+        assert create_collection(tenancy_config, "lobby", vector_size=2, if_exists="recreate").code == 200
+        assert search_points(tenancy_config, "lobby", [1.0, 0.0]).output.results_count == 0
+
+    def test_empty_room_is_recorded(self, tenancy_config, local_client):
+        assert create_collection(tenancy_config, "hall", vector_size=2).code == 200
+
+        assert create_collection(tenancy_config, "hall", vector_size=2).code == 409
+        assert create_collection(tenancy_config, "hall", vector_size=2, if_exists="skip").output.message.endswith("(skipped)")
+        assert search_points(tenancy_config, "hall", [1.0, 0.0]).output.results_count == 0
+
+        assert delete_collection(tenancy_config, "hall").code == 200
+        assert create_collection(tenancy_config, "hall", vector_size=2).code == 200
+
+    def test_vector_size_mismatch(self, tenancy_config, local_client):
+        create_collection(tenancy_config, "lobby", vector_size=2)
+
+        assert create_collection(tenancy_config, "kitchen", vector_size=3).code == 500
+
+    def test_distance_mismatch(self, tenancy_config, local_client):
+        create_collection(tenancy_config, "lobby", vector_size=2)
+
+        response = create_collection(tenancy_config, "kitchen", vector_size=2, distance="Dot")
+
+        assert response.code == 500
+        assert "uses Cosine distance, not Dot" in response.message
+
+    def test_mismatched_recreate_keeps_room(self, tenancy_config, local_client):
+        create_collection(tenancy_config, "lobby", vector_size=2)
+        upsert_points(tenancy_config, "lobby", [{"id": 1, "vector": [1.0, 0.0]}])
+
+        assert create_collection(tenancy_config, "lobby", vector_size=3, if_exists="recreate").code == 500
+        assert create_collection(tenancy_config, "lobby", vector_size=2, distance="Dot", if_exists="recreate").code == 500
+        assert search_points(tenancy_config, "lobby", [1.0, 0.0]).output.results_count == 1
+
+    def test_delete_room_keeps_other_rooms(self, tenancy_config, local_client):
+        create_collection(tenancy_config, "lobby", vector_size=2)
+        upsert_points(tenancy_config, "lobby", [{"id": 1, "vector": [1.0, 0.0]}])
+        upsert_points(tenancy_config, "kitchen", [{"id": 2, "vector": [1.0, 0.0]}])
+
+        assert delete_collection(tenancy_config, "lobby").code == 200
+
+        assert search_points(tenancy_config, "lobby", [1.0, 0.0]).output.results_count == 0
+        assert search_points(tenancy_config, "kitchen", [1.0, 0.0]).output.results_count == 1
@@ -1,10 +1,34 @@
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+def _reset_shared_state():
+    from qdrant_rooms_pkg.actions.search_collections import _distances
+    from qdrant_rooms_pkg.actions.search_points import _search_flight
+    from qdrant_rooms_pkg.services.adaptive_ef import ef_controller
+    from qdrant_rooms_pkg.services.endpoints import clear_pools
+    from qdrant_rooms_pkg.services.operations import operation_tracker
+    from qdrant_rooms_pkg.services.semantic_cache import semantic_cache
+    from qdrant_rooms_pkg.storage.hot_tier import hot_tier
+
+    clear_pools()
+    operation_tracker.clear()
+    ef_controller.clear()
+    semantic_cache.clear()
+    hot_tier.clear()
+    _search_flight.clear()
+    _distances.clear()
+
+@pytest.fixture(autouse=True)
+def reset_shared_state():
+    _reset_shared_state()
+    yield
+    _reset_shared_state()
+
 @pytest.fixture
 def sample_config():
     return {
@@ -39,3 +63,23 @@ def sample_tool_descriptions():
         "test_tool": "A test tool for testing purposes",
         "another_tool": "Another test tool"
     }
+
+@pytest.fixture
+def local_client():
+    from qdrant_client import QdrantClient
+
+    client = QdrantClient(":memory:")
+    with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient", return_value=client):
+        yield client
+
+@pytest.fixture
+def qdrant_config():
+    from qdrant_rooms_pkg.configuration import CustomAddonConfig
+
+    return CustomAddonConfig(
+        id="test_qdrant_addon_id",
+        type="storage",
+        name="test_qdrant_addon",
+        url="http://localhost:6333",
+        secrets={}
+    )
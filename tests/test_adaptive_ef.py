@@ -0,0 +1,41 @@
+from qdrant_rooms_pkg.services.adaptive_ef import EfController
+
+
+class TestEfController:
+    def test_starts_at_ceiling(self):
+        controller = EfController(window=2)
+
+        assert controller.ef("node", "docs", 16, 256) == 256
+
+    def test_cuts_ef_when_over_target(self):
+        controller = EfController(window=2)
+
+        controller.observe("node", "docs", 0.1, 0.05, 16, 256)
+        assert controller.observe("node", "docs", 0.1, 0.05, 16, 256) == 192
+        assert controller.ef("node", "docs", 16, 256) == 192
+        assert controller.ef("node", "other", 16, 256) == 256
+
+    def test_never_goes_below_floor(self):
+        controller = EfController(window=1)
+
+        for _ in range(20):
+            controller.observe("node", "docs", 1.0, 0.05, 16, 256)
+
+        assert controller.ef("node", "docs", 16, 256) == 16
+
+    def test_recovers_when_under_target(self):
+        controller = EfController(window=1)
+        for _ in range(4):
+            controller.observe("node", "docs", 1.0, 0.05, 16, 256)
+        lowered = controller.ef("node", "docs", 16, 256)
+
+        assert controller.observe("node", "docs", 0.01, 0.05, 16, 256) == lowered + lowered // 8
+
+        for _ in range(50):
+            controller.observe("node", "docs", 0.01, 0.05, 16, 256)
+        assert controller.ef("node", "docs", 16, 256) == 256
+
+    def test_holds_near_target(self):
+        controller = EfController(window=1)
+
+        assert controller.observe("node", "docs", 0.045, 0.05, 16, 256) == 256
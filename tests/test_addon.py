@@ -26,6 +26,7 @@ class TestQdrantRoomsAddon:
         assert hasattr(logger, 'warning')
         assert hasattr(logger, 'error')
         assert logger.addon_type == "storage"
+        assert addon.logger is logger
 
 
     def test_load_tools(self, sample_tools, sample_tool_descriptions):
@@ -95,6 +96,21 @@ class TestQdrantRoomsAddon:
             mock_store.assert_called_once_with(sample_credentials)
             assert result is True
 
+    def test_load_credentials_logs_names_only(self):
+        from loguru import logger
+
+        addon = QdrantRoomsAddon()
+        messages = []
+        handler_id = logger.add(lambda message: messages.append(message.record["message"]), level="DEBUG")
+        try:
+            with patch.object(addon.credentials, 'store_multiple'):
+                addon.loadCredentials(qdrant_api_key="super-secret-value")
+        finally:
+            logger.remove(handler_id)
+
+        assert any("qdrant_api_key" in message for message in messages)
+        assert not any("super-secret-value" in message for message in messages)
+
     def test_load_credentials_with_config_validation(self, sample_credentials):
         addon = QdrantRoomsAddon()
         mock_config = Mock()
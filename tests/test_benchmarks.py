@@ -0,0 +1,117 @@
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from qdrant_rooms_pkg.addon import QdrantRoomsAddon
+from qdrant_rooms_pkg.benchmarks.replay import load_workload, main, replay
+from qdrant_rooms_pkg.benchmarks.transport import (
+    WireCounter,
+    _CountingInterceptor,
+    counting_grpc_channels,
+    run_workload,
+)
+
+
+class TestTransportBenchmark:
+    def test_run_workload_reports_stats(self):
+        client = QdrantClient(":memory:")
+        client.create_collection("bench", vectors_config=VectorParams(size=4, distance=Distance.COSINE))
+        rng = np.random.default_rng(0)
+
+        stats = run_workload(client, "bench", rng.random((50, 4)), rng.random((5, 4)), batch_size=16)
+
+        assert client.count("bench").count == 50
+        assert stats["upsert_points_per_s"] > 0
+        assert stats["search_qps"] > 0
+        assert stats["search_p50_ms"] <= stats["search_p99_ms"]
+
+    def test_wire_counter_rest_hooks(self):
+        counter = WireCounter()
+
+        counter.on_request(SimpleNamespace(content=b"12345"))
+        counter.on_response(SimpleNamespace(headers={"content-length": "10"}, read=lambda: None, content=b"x" * 42))
+
+        assert counter.sent == 5
+        assert counter.received == 42
+
+    def test_counting_interceptor(self):
+        counter = WireCounter()
+        request = SimpleNamespace(ByteSize=lambda: 7)
+        outcome = SimpleNamespace(exception=lambda: None, result=lambda: SimpleNamespace(ByteSize=lambda: 30))
+        failed = SimpleNamespace(exception=lambda: RuntimeError("unavailable"))
+        interceptor = _CountingInterceptor(counter)
+
+        assert interceptor.intercept_unary_unary(lambda details, message: outcome, None, request) is outcome
+        assert interceptor.intercept_unary_unary(lambda details, message: failed, None, request) is failed
+        assert counter.sent == 14
+        assert counter.received == 30
+
+    def test_grpc_channels_are_intercepted_while_counting(self):
+        import grpc
+        import qdrant_client.qdrant_remote
+
+        opened = qdrant_client.qdrant_remote.get_channel
+        with counting_grpc_channels(WireCounter()):
+            assert qdrant_client.qdrant_remote.get_channel is not opened
+            channel = qdrant_client.qdrant_remote.get_channel("localhost", 6334, False)
+
+        assert isinstance(channel, grpc.Channel)
+        assert qdrant_client.qdrant_remote.get_channel is opened
+        channel.close()
+
+
+class TestStartupBenchmark:
+    def test_addon_startup_does_not_load_qdrant_client(self):
+        from qdrant_rooms_pkg.benchmarks.startup import measure_startup
+
+        report = measure_startup(runs=1)
+
+        assert report["loaded"] == []
+        assert report["import_median_ms"] >= 0
+        assert report["addon_median_ms"] > 0
+
+
+class TestReplayBenchmark:
+    def _workload(self, tmp_path):
+        calls = [
+            {"ts": 100.0, "action": "create_collection", "parameters": {"collection_name": "docs", "vector_size": 2}},
+            {"ts": 100.01, "action": "upsert_points", "parameters": {
+                "collection_name": "docs", "points": [{"id": 1, "vector": [1.0, 0.0]}, {"id": 2, "vector": [0.0, 1.0]}]
+            }},
+            {"ts": 100.02, "action": "search_points", "parameters": {"collection_name": "docs", "query_vector": [1.0, 0.0]}},
+            {"ts": 100.03, "action": "search_points", "parameters": {"collection_name": "missing", "query_vector": [1.0, 0.0]}},
+        ]
+        path = tmp_path / "workload.jsonl"
+        path.write_text("\n".join(json.dumps(call) for call in reversed(calls)) + "\n\n")
+        return path
+
+    def test_load_workload_rebases_and_sorts(self, tmp_path):
+        calls = load_workload(self._workload(tmp_path))
+
+        assert [call["action"] for call in calls][:2] == ["create_collection", "upsert_points"]
+        assert calls[0]["ts"] == 0.0
+        assert calls[-1]["ts"] == pytest.approx(0.03)
+
+    def test_replay_against_embedded_qdrant(self, tmp_path):
+        report = main([str(self._workload(tmp_path)), "--location", ":memory:", "--concurrency", "1", "--speed", "2"])
+
+        assert report["calls"] == 4
+        assert report["duration_s"] >= 0.015
+        assert report["actions"]["search_points"]["calls"] == 2
+        assert report["actions"]["search_points"]["error_rate"] == 0.5
+        assert report["actions"]["upsert_points"]["errors"] == 0
+        assert report["error_rate"] == 0.25
+        assert report["actions"]["search_points"]["p50_ms"] <= report["actions"]["search_points"]["max_ms"]
+
+    def test_unknown_action(self, tmp_path):
+        path = tmp_path / "workload.jsonl"
+        path.write_text("".join(
+            json.dumps({"ts": 0, "action": action}) + "\n" for action in ("drop_everything", "loadAddonConfig", "test")
+        ))
+
+        with pytest.raises(ValueError, match="drop_everything, loadAddonConfig, test"):
+            replay(QdrantRoomsAddon(), load_workload(path))
@@ -108,3 +108,67 @@ class TestCustomAddonConfig:
         assert config.grpc_port == 6334
         assert config.prefer_grpc is False
         assert config.timeout == 60
+
+    def test_custom_config_grpc_transport_options(self):
+        config = CustomAddonConfig(
+            id="test_qdrant_addon_id",
+            type="storage",
+            name="test_qdrant_addon",
+            host="localhost",
+            prefer_grpc=True,
+            grpc_compression="gzip",
+            grpc_max_message_mb=64,
+            grpc_keepalive_ms=30000,
+            grpc_options={"grpc.http2.max_pings_without_data": 0},
+            secrets={}
+        )
+
+        options = config.grpc_channel_options()
+
+        assert options["grpc.max_send_message_length"] == 64 * 1024 * 1024
+        assert options["grpc.max_receive_message_length"] == 64 * 1024 * 1024
+        assert options["grpc.keepalive_time_ms"] == 30000
+        assert options["grpc.http2.max_pings_without_data"] == 0
+
+    def test_custom_config_invalid_grpc_compression(self):
+        with pytest.raises(ValidationError):
+            CustomAddonConfig(
+                id="test_qdrant_addon_id",
+                type="storage",
+                name="test_qdrant_addon",
+                grpc_compression="deflate",
+                secrets={}
+            )
+
+    def test_custom_config_embedded_location(self):
+        config = CustomAddonConfig(
+            id="test_qdrant_addon_id",
+            type="storage",
+            name="test_qdrant_addon",
+            location=":memory:",
+            secrets={}
+        )
+
+        assert config.endpoint_key() == ":memory:"
+
+    def test_custom_config_location_excludes_server(self):
+        with pytest.raises(ValidationError):
+            CustomAddonConfig(
+                id="test_qdrant_addon_id",
+                type="storage",
+                name="test_qdrant_addon",
+                url="http://localhost:6333",
+                location=":memory:",
+                secrets={}
+            )
+
+    def test_custom_config_invalid_read_routing(self):
+        for fields in ({"read_routing": "random"}, {"hedge_budget": -0.1}):
+            with pytest.raises(ValidationError):
+                CustomAddonConfig(
+                    id="test_qdrant_addon_id",
+                    type="storage",
+                    name="test_qdrant_addon",
+                    secrets={},
+                    **fields
+                )
@@ -0,0 +1,105 @@
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+
+from qdrant_rooms_pkg.actions.create_collection import create_collection
+from qdrant_rooms_pkg.memory.conversation import ConversationMemory, RecentWindow
+
+
+@pytest.fixture
+def memory_config(qdrant_config, local_client):
+    qdrant_config.search_singleflight = False
+    create_collection(qdrant_config, "chat", vector_size=2)
+    return qdrant_config
+
+
+class TestRecentWindow:
+    def test_ring_buffer_keeps_latest(self):
+        window = RecentWindow(2)
+        for i, vector in enumerate([[1.0, 0.0], [0.0, 1.0], [0.6, 0.8]]):
+            window.add({"id": i}, np.asarray(vector, dtype=np.float32))
+
+        hits = window.search(np.asarray([1.0, 0.0], dtype=np.float32), limit=5)
+
+        assert [turn["id"] for turn, _ in hits] == [2, 1]
+
+
+class TestConversationMemory:
+    def test_recall_before_write_reaches_qdrant(self, memory_config, local_client):
+        memory = ConversationMemory(memory_config, "chat", batch_size=100, flush_interval=60.0)
+        memory.remember("the cat sleeps", [1.0, 0.0])
+
+        recalled = memory.recall([1.0, 0.1], limit=1, include_archive=False)
+
+        assert recalled[0]["text"] == "the cat sleeps"
+        assert memory.pending() == 1
+        assert local_client.count("chat").count == 0
+        memory.close(timeout=5)
+
+    def test_background_batches_and_archive_recall(self, memory_config, local_client):
+        memory = ConversationMemory(memory_config, "chat", batch_size=2, flush_interval=60.0)
+        memory.remember("hello", [1.0, 0.0], role="user", metadata={"lang": "en"})
+        memory.remember("hi there", [0.0, 1.0], role="assistant")
+
+        assert memory.flush(timeout=5)
+        assert local_client.count("chat").count == 2
+
+        fresh = ConversationMemory(memory_config, "chat")
+        recalled = fresh.recall([1.0, 0.0], limit=1)
+
+        assert recalled[0]["text"] == "hello"
+        assert recalled[0]["role"] == "user"
+        assert recalled[0]["metadata"] == {"lang": "en"}
+        memory.close(timeout=5)
+
+    def test_recent_turns_win_after_decay(self, memory_config):
+        now = time.time()
+        memory = ConversationMemory(memory_config, "chat", half_life=3600.0)
+        memory.remember("old", [1.0, 0.0], timestamp=now - 7200)
+        memory.remember("new", [0.9, 0.1], timestamp=now)
+
+        recalled = memory.recall([1.0, 0.0], limit=2, now=now)
+
+        assert [turn["text"] for turn in recalled] == ["new", "old"]
+        assert recalled[1]["score"] == pytest.approx(recalled[1]["similarity"] / 4, rel=1e-3)
+        memory.close(timeout=5)
+
+    def test_merges_window_and_archive_without_duplicates(self, memory_config):
+        memory = ConversationMemory(memory_config, "chat", batch_size=1)
+        memory.remember("only once", [1.0, 0.0])
+        memory.flush(timeout=5)
+
+        recalled = memory.recall([1.0, 0.0], limit=5)
+
+        assert [turn["text"] for turn in recalled] == ["only once"]
+        memory.close(timeout=5)
+
+    def test_failed_writes_are_retried(self, memory_config, local_client):
+        memory = ConversationMemory(memory_config, "chat", batch_size=1, flush_interval=0.05)
+        upsert = local_client.upsert
+        attempts = []
+
+        def flaky_upsert(*args, **kwargs):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise Exception("restarting")
+            return upsert(*args, **kwargs)
+
+        with patch.object(local_client, "upsert", side_effect=flaky_upsert):
+            memory.remember("survives", [1.0, 0.0])
+
+            assert memory.flush(timeout=5)
+
+        assert len(attempts) == 2
+        assert local_client.count("chat").count == 1
+        memory.close(timeout=5)
+
+    def test_remember_after_close(self, memory_config):
+        memory = ConversationMemory(memory_config, "chat")
+        memory.close()
+
+        with pytest.raises(RuntimeError):
+            memory.remember("late", [1.0, 0.0])
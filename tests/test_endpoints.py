@@ -0,0 +1,207 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
+
+from qdrant_rooms_pkg.services.endpoints import (
+    _HEDGE_WORKERS,
+    Endpoint,
+    EndpointPool,
+    build_client_params,
+    get_pool,
+    is_node_failure,
+)
+
+
+def _endpoint(url):
+    endpoint = Endpoint(url, {"url": url})
+    endpoint._client = Mock(name=url)
+    endpoint._client.url = url
+    return endpoint
+
+
+def _http_error(status_code):
+    return UnexpectedResponse(status_code=status_code, reason_phrase="", content=b"", headers={})
+
+
+class TestIsNodeFailure:
+    def test_server_errors_are_node_failures(self):
+        assert is_node_failure(_http_error(503)) is True
+        assert is_node_failure(ResponseHandlingException(ConnectionError("refused"))) is True
+
+    def test_client_errors_are_not_node_failures(self):
+        assert is_node_failure(_http_error(404)) is False
+        assert is_node_failure(ValueError("bad vector")) is False
+
+
+class TestEndpointPool:
+    def test_round_robin_reads(self):
+        pool = EndpointPool([_endpoint("a"), _endpoint("b"), _endpoint("c")])
+
+        urls = [pool.read(lambda client: client.url) for _ in range(6)]
+
+        assert urls == ["a", "b", "c", "a", "b", "c"]
+
+    def test_writes_go_to_primary(self):
+        pool = EndpointPool([_endpoint("a"), _endpoint("b")])
+
+        assert [pool.write(lambda client: client.url) for _ in range(3)] == ["a", "a", "a"]
+
+    def test_least_latency_prefers_fastest(self):
+        a, b = _endpoint("a"), _endpoint("b")
+        a.latency, b.latency = 0.5, 0.01
+        pool = EndpointPool([a, b], routing="least_latency")
+
+        assert pool.read(lambda client: client.url) == "b"
+
+    def test_failed_node_is_skipped_and_removed(self):
+        a, b = _endpoint("a"), _endpoint("b")
+        pool = EndpointPool([a, b], retry_after=60)
+
+        def read(client):
+            if client.url == "a":
+                raise _http_error(503)
+            return client.url
+
+        assert [pool.read(read) for _ in range(3)] == ["b", "b", "b"]
+        assert a.healthy is False
+        assert pool.read_order() == [b]
+
+    def test_request_errors_are_not_retried(self):
+        a, b = _endpoint("a"), _endpoint("b")
+        pool = EndpointPool([a, b])
+        read = Mock(side_effect=_http_error(404))
+
+        with pytest.raises(UnexpectedResponse):
+            pool.read(read)
+
+        assert read.call_count == 1
+        assert a.healthy is True
+
+    def test_unhealthy_node_is_readmitted(self):
+        a, b = _endpoint("a"), _endpoint("b")
+        a.record_failure(ConnectionError("down"))
+        pool = EndpointPool([a, b], retry_after=0)
+
+        assert a in pool.read_order()
+        pool.call(a, lambda client: None)
+        assert a.healthy is True
+
+
+class TestGetPool:
+    def test_pool_reused_per_configuration(self, qdrant_config):
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            pool = get_pool(qdrant_config)
+            pool.client()
+            get_pool(qdrant_config).client()
+
+            assert get_pool(qdrant_config) is pool
+            MockClient.assert_called_once()
+
+    def test_multiple_endpoints(self, qdrant_config):
+        qdrant_config.endpoints = ["http://node-2:6333", "http://node-3:6333"]
+
+        pool = get_pool(qdrant_config)
+
+        assert [e.url for e in pool.endpoints] == ["http://localhost:6333", "http://node-2:6333", "http://node-3:6333"]
+        assert pool.primary.client_params["url"] == "http://localhost:6333"
+
+
+class TestHedgedReads:
+    def _slow_pool(self):
+        a, b = _endpoint("a"), _endpoint("b")
+        pool = EndpointPool([a, b])
+
+        def read(client):
+            if client.url == "a":
+                time.sleep(0.3)
+            return client.url
+
+        return pool, read
+
+    def test_slow_read_is_hedged(self):
+        pool, read = self._slow_pool()
+        pool._hedge_tokens = 1.0
+
+        started = time.perf_counter()
+        result = pool.read_hedged(read, delay=0.02, budget=0.0)
+
+        assert result == "b"
+        assert time.perf_counter() - started < 0.25
+
+    def test_hedges_are_capped_by_budget(self):
+        pool, read = self._slow_pool()
+
+        assert pool.read_hedged(read, delay=0.02, budget=0.0) == "a"
+
+    def test_fast_read_is_not_hedged(self):
+        a, b = _endpoint("a"), _endpoint("b")
+        pool = EndpointPool([a, b])
+        pool._hedge_tokens = 5.0
+        read = Mock(side_effect=lambda client: client.url)
+
+        assert pool.read_hedged(read, delay=1.0) == "a"
+        assert read.call_count == 1
+
+    def test_no_hedge_without_latency_history(self):
+        pool, read = self._slow_pool()
+        pool._hedge_tokens = 5.0
+
+        assert pool.read_hedged(read) == "a"
+
+    def test_read_runs_on_caller_thread_when_workers_are_busy(self):
+        pool, read = self._slow_pool()
+        pool._hedge_tokens = 5.0
+        threads = []
+        while pool._workers.acquire(blocking=False):
+            pass
+
+        result = pool.read_hedged(lambda client: threads.append(threading.current_thread()) or read(client), delay=0.02)
+
+        assert result == "a"
+        assert threads == [threading.current_thread()]
+        assert pool._executor is None
+
+    def test_hedge_skipped_when_no_worker_is_free(self):
+        pool, read = self._slow_pool()
+        pool._hedge_tokens = 1.0
+        for _ in range(_HEDGE_WORKERS - 1):
+            pool._workers.acquire(blocking=False)
+
+        with patch.object(pool, "_submit", wraps=pool._submit) as submit:
+            assert pool.read_hedged(read, delay=0.02, budget=0.0) == "a"
+
+        assert submit.call_count == 2
+        assert pool._hedge_tokens == pytest.approx(1.0)
+
+    def test_latency_percentile(self):
+        pool = EndpointPool([_endpoint("a")])
+        pool._latencies.extend(i / 100 for i in range(100))
+
+        assert pool.latency_percentile(95) == pytest.approx(0.95)
+
+
+class TestBuildClientParams:
+    def test_grpc_transport_options_passed_to_client(self, qdrant_config):
+        from grpc import Compression
+
+        qdrant_config.prefer_grpc = True
+        qdrant_config.grpc_compression = "gzip"
+        qdrant_config.grpc_keepalive_ms = 10000
+
+        params = build_client_params(qdrant_config, qdrant_config.url)
+
+        assert params["prefer_grpc"] is True
+        assert params["grpc_compression"] == Compression.Gzip
+        assert params["grpc_options"]["grpc.keepalive_time_ms"] == 10000
+
+    def test_embedded_location(self, qdrant_config):
+        qdrant_config.url = None
+        qdrant_config.location = "/tmp/qdrant-data"
+
+        params = build_client_params(qdrant_config, None)
+
+        assert params["path"] == "/tmp/qdrant-data"
+        assert "url" not in params
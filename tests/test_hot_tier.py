@@ -0,0 +1,105 @@
+from types import SimpleNamespace
+
+import pytest
+
+from qdrant_rooms_pkg.storage.hot_tier import CollectionMirror, HotTier
+
+
+def _record(point_id, vector, payload=None):
+    return SimpleNamespace(id=point_id, vector=vector, payload=payload or {})
+
+
+class TestCollectionMirror:
+    def test_cosine_top_k(self):
+        mirror = CollectionMirror(2, "Cosine")
+        mirror.upsert(1, [1.0, 0.0], {"name": "x"})
+        mirror.upsert(2, [0.0, 2.0], {"name": "y"})
+        mirror.upsert(3, [1.0, 1.0], {"name": "xy"})
+
+        results = mirror.search([3.0, 0.0], limit=2)
+
+        assert [r["id"] for r in results] == [1, 3]
+        assert results[0]["score"] == pytest.approx(1.0)
+        assert results[0]["payload"] == {"name": "x"}
+
+    def test_dot_scores_are_raw(self):
+        mirror = CollectionMirror(2, "Dot")
+        mirror.upsert(1, [2.0, 0.0], None)
+
+        assert mirror.search([3.0, 0.0], limit=1)[0]["score"] == pytest.approx(6.0)
+
+    def test_euclid_orders_by_distance_and_threshold(self):
+        mirror = CollectionMirror(2, "Euclid")
+        mirror.upsert(1, [0.0, 0.0], None)
+        mirror.upsert(2, [3.0, 4.0], None)
+
+        results = mirror.search([0.0, 0.0], limit=5, score_threshold=1.0)
+
+        assert [r["id"] for r in results] == [1]
+        assert results[0]["score"] == pytest.approx(0.0)
+
+    def test_upsert_replaces_existing_point_and_grows(self):
+        mirror = CollectionMirror(2, "Dot", capacity=1)
+        mirror.upsert(1, [1.0, 0.0], None)
+        mirror.upsert(2, [0.0, 1.0], None)
+        mirror.upsert(1, [0.0, 5.0], {"v": 2})
+
+        assert mirror.size == 2
+        assert mirror.search([0.0, 1.0], limit=1)[0]["id"] == 1
+
+    def test_dimension_mismatch(self):
+        mirror = CollectionMirror(2, "Dot")
+
+        assert mirror.upsert(1, [1.0, 0.0, 0.0], None) is False
+        with pytest.raises(ValueError):
+            mirror.search([1.0], limit=1)
+
+
+class TestHotTier:
+    def test_unknown_collection_must_be_checked(self):
+        tier = HotTier()
+
+        assert tier.get("local", "docs", ttl=30) == (False, None)
+
+    def test_load_and_sync_upserts(self):
+        tier = HotTier()
+        tier.load("local", "docs", 2, "Dot", [_record(1, [1.0, 0.0])])
+        tier.upsert("local", "docs", [{"id": 2, "vector": [0.0, 1.0]}], max_points=10)
+
+        known, mirror = tier.get("local", "docs", ttl=30)
+
+        assert known is True
+        assert mirror.size == 2
+
+    def test_outgrown_collection_falls_back(self):
+        tier = HotTier()
+        tier.create("local", "docs", 2, "Dot")
+        tier.upsert("local", "docs", [{"id": i, "vector": [1.0, 0.0]} for i in range(3)], max_points=2)
+
+        assert tier.get("local", "docs", ttl=30) == (True, None)
+
+    def test_stale_mirror_is_rechecked(self):
+        tier = HotTier()
+        tier.create("local", "docs", 2, "Dot")
+
+        assert tier.get("local", "docs", ttl=-1) == (False, None)
+
+    def test_drop(self):
+        tier = HotTier()
+        tier.create("local", "docs", 2, "Dot")
+        tier.drop("local", "docs")
+
+        assert tier.get("local", "docs", ttl=30) == (False, None)
+
+    def test_load_discarded_after_concurrent_write(self):
+        tier = HotTier()
+        version = tier.version("local", "docs")
+        tier.upsert("local", "docs", [{"id": 2, "vector": [0.0, 1.0]}], max_points=10)
+
+        assert tier.load("local", "docs", 2, "Dot", [_record(1, [1.0, 0.0])], version) is None
+        assert tier.get("local", "docs", ttl=30) == (False, None)
+
+        version = tier.version("local", "docs")
+        tier.drop("local", "docs")
+        assert tier.load("local", "docs", 2, "Dot", [], version) is None
+        assert tier.load("local", "docs", 2, "Dot", [], tier.version("local", "docs")) is not None
@@ -0,0 +1,48 @@
+from unittest.mock import patch
+
+from loguru import logger
+
+from qdrant_rooms_pkg.utils.log import AddonLogger, SampledLog
+
+
+def _capture(level="DEBUG"):
+    messages = []
+    handler_id = logger.add(lambda message: messages.append(message.record["message"]), level=level)
+    return messages, handler_id
+
+
+class TestAddonLogger:
+    def test_prefix_and_deferred_arguments(self):
+        messages, handler_id = _capture()
+        try:
+            AddonLogger("storage").info("Found {} results in '{}'", 3, "docs")
+        finally:
+            logger.remove(handler_id)
+
+        assert messages == ["[TYPE: STORAGE] Found 3 results in 'docs'"]
+
+    def test_message_without_arguments_is_not_formatted(self):
+        messages, handler_id = _capture()
+        try:
+            AddonLogger("storage").debug("payload {'a': 1}")
+        finally:
+            logger.remove(handler_id)
+
+        assert messages == ["[TYPE: STORAGE] payload {'a': 1}"]
+
+
+class TestSampledLog:
+    def test_rate_limited_with_suppressed_count(self):
+        sampled = SampledLog("INFO", interval=10.0)
+        messages, handler_id = _capture()
+        try:
+            with patch("qdrant_rooms_pkg.utils.log.time.monotonic", side_effect=[100.0, 101.0, 102.0, 111.0]):
+                assert sampled("Found {} results", 1) is True
+                assert sampled("Found {} results", 2) is False
+                assert sampled("Found {} results", 3) is False
+                assert sampled("Found {} results", 4) is True
+        finally:
+            logger.remove(handler_id)
+
+        assert messages == ["Found 1 results", "Found 4 results (2 similar messages suppressed)"]
+        assert sampled.suppressed == 0
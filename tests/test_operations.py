@@ -0,0 +1,42 @@
+from unittest.mock import Mock
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointStruct, UpdateStatus, VectorParams
+
+from qdrant_rooms_pkg.services.operations import OperationTracker, write_barrier
+
+
+class TestOperationTracker:
+    def test_track_and_complete(self):
+        tracker = OperationTracker()
+        tracker.track("node", "rooms", "lobby", 1)
+        tracker.track("node", "rooms", "kitchen", 2)
+        tracker.track("node", "rooms", "lobby", None)
+
+        assert tracker.pending("node", "rooms") == [("lobby", 1), ("kitchen", 2)]
+        assert tracker.pending("other", "rooms") == []
+
+        tracker.complete("node", "rooms", [("lobby", 1)])
+        assert tracker.pending("node", "rooms") == [("kitchen", 2)]
+
+        tracker.complete("node", "rooms", [("kitchen", 2)])
+        assert tracker.pending("node", "rooms") == []
+
+
+class TestWriteBarrier:
+    def test_barrier_matches_no_point(self):
+        client = QdrantClient(":memory:")
+        client.create_collection("docs", vectors_config=VectorParams(size=2, distance=Distance.COSINE))
+        client.upsert("docs", [PointStruct(id=1, vector=[1.0, 0.0])])
+
+        result = write_barrier(client, "docs")
+
+        assert result.status == UpdateStatus.COMPLETED
+        assert client.count("docs").count == 1
+
+    def test_barrier_waits(self):
+        client = Mock()
+
+        write_barrier(client, "docs")
+
+        assert client.delete.call_args.kwargs["wait"] is True
@@ -0,0 +1,65 @@
+from qdrant_rooms_pkg.services.semantic_cache import SemanticCache
+
+SIGNATURE = (5, None, None)
+RESULTS = [{"id": 1, "score": 0.9, "payload": {}}]
+
+
+class TestSemanticCache:
+    def test_miss_on_empty_cache(self):
+        cache = SemanticCache()
+
+        assert cache.lookup("local", "docs", [1.0, 0.0], SIGNATURE, 0.01) is None
+
+    def test_hit_for_near_identical_vector(self):
+        cache = SemanticCache()
+        cache.store("local", "docs", [1.0, 0.0], SIGNATURE, RESULTS, capacity=8, generation=0)
+
+        assert cache.lookup("local", "docs", [1.0, 0.001], SIGNATURE, 0.01) == RESULTS
+
+    def test_miss_for_distant_vector(self):
+        cache = SemanticCache()
+        cache.store("local", "docs", [1.0, 0.0], SIGNATURE, RESULTS, capacity=8, generation=0)
+
+        assert cache.lookup("local", "docs", [0.0, 1.0], SIGNATURE, 0.01) is None
+
+    def test_miss_for_scaled_vector(self):
+        cache = SemanticCache()
+        cache.store("local", "docs", [1.0, 1.0], SIGNATURE, RESULTS, capacity=8, generation=0)
+
+        assert cache.lookup("local", "docs", [10.0, 10.0], SIGNATURE, 0.01) is None
+        assert cache.lookup("local", "docs", [1.005, 1.0], SIGNATURE, 0.01) == RESULTS
+
+    def test_miss_for_different_parameters(self):
+        cache = SemanticCache()
+        cache.store("local", "docs", [1.0, 0.0], SIGNATURE, RESULTS, capacity=8, generation=0)
+
+        assert cache.lookup("local", "docs", [1.0, 0.0], (10, None, None), 0.01) is None
+
+    def test_lru_eviction(self):
+        cache = SemanticCache()
+        cache.store("local", "docs", [1.0, 0.0, 0.0], SIGNATURE, [{"id": 1}], capacity=2, generation=0)
+        cache.store("local", "docs", [0.0, 1.0, 0.0], SIGNATURE, [{"id": 2}], capacity=2, generation=0)
+        cache.lookup("local", "docs", [1.0, 0.0, 0.0], SIGNATURE, 0.01)
+        cache.store("local", "docs", [0.0, 0.0, 1.0], SIGNATURE, [{"id": 3}], capacity=2, generation=0)
+
+        assert cache.lookup("local", "docs", [1.0, 0.0, 0.0], SIGNATURE, 0.01) == [{"id": 1}]
+        assert cache.lookup("local", "docs", [0.0, 1.0, 0.0], SIGNATURE, 0.01) is None
+        assert cache.lookup("local", "docs", [0.0, 0.0, 1.0], SIGNATURE, 0.01) == [{"id": 3}]
+
+    def test_invalidate_drops_entries_and_stale_stores(self):
+        cache = SemanticCache()
+        generation = cache.generation("local", "docs")
+        cache.store("local", "docs", [1.0, 0.0], SIGNATURE, RESULTS, capacity=8, generation=generation)
+
+        cache.invalidate("local", "docs")
+        cache.store("local", "docs", [1.0, 0.0], SIGNATURE, RESULTS, capacity=8, generation=generation)
+
+        assert cache.lookup("local", "docs", [1.0, 0.0], SIGNATURE, 0.01) is None
+
+    def test_collections_are_bounded(self):
+        cache = SemanticCache(max_collections=1)
+        cache.store("local", "a", [1.0, 0.0], SIGNATURE, RESULTS, capacity=8, generation=0)
+        cache.store("local", "b", [1.0, 0.0], SIGNATURE, RESULTS, capacity=8, generation=0)
+
+        assert cache.lookup("local", "a", [1.0, 0.0], SIGNATURE, 0.01) is None
+        assert cache.lookup("local", "b", [1.0, 0.0], SIGNATURE, 0.01) == RESULTS
@@ -0,0 +1,72 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from qdrant_rooms_pkg.services.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    def test_single_call_returns_result(self):
+        flight = SingleFlight()
+
+        assert flight.do("key", lambda: 42) == 42
+        assert flight.in_flight() == 0
+
+    def test_concurrent_identical_calls_share_execution(self):
+        flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def slow():
+            calls.append(1)
+            release.wait(2)
+            return "shared"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("key", slow))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == ["shared"] * 5
+
+    def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+
+    def test_error_is_shared_and_key_released(self):
+        flight = SingleFlight()
+
+        def failing():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            flight.do("key", failing)
+
+        assert flight.in_flight() == 0
+        assert flight.do("key", lambda: "recovered") == "recovered"
+
+    def test_asyncio_callers_share_execution(self):
+        flight = SingleFlight()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.2)
+            return "shared"
+
+        async def main():
+            return await asyncio.gather(*(asyncio.to_thread(flight.do, "key", slow) for _ in range(4)))
+
+        results = asyncio.run(main())
+
+        assert len(calls) == 1
+        assert results == ["shared"] * 4
@@ -0,0 +1,207 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from qdrant_rooms_pkg.actions.delete_points import delete_points
+from qdrant_rooms_pkg.actions.upsert_points import upsert_points
+from qdrant_rooms_pkg.configuration import CustomAddonConfig
+from qdrant_rooms_pkg.storage.spool import WriteSpool, close_spools, get_spool
+
+
+class Recorder:
+    def __init__(self, fail=0):
+        self.batches = []
+        self.fail = fail
+
+    def __call__(self, collection_name, points, shard_key):
+        if self.fail:
+            self.fail -= 1
+            raise ConnectionError("qdrant is down")
+        self.batches.append((collection_name, [point["id"] for point in points], shard_key))
+
+
+class TestWriteSpool:
+    def test_replays_grouped_batches(self, tmp_path):
+        write = Recorder()
+        spool = WriteSpool(tmp_path, write, batch_size=3)
+
+        spool.append("docs", [{"id": 1, "vector": [0.1]}])
+        spool.append("docs", [{"id": 2, "vector": [0.2]}])
+        spool.append("notes", [{"id": 3, "vector": [0.3]}])
+        spool.append("notes", [{"id": 4, "vector": [0.4]}, {"id": 5, "vector": [0.5]}])
+        spool.append("notes", [{"id": 6, "vector": [0.6]}], shard_key="eu")
+
+        assert spool.pending() == 5
+        assert spool.flush() is True
+        assert write.batches == [
+            ("docs", [1, 2], None),
+            ("notes", [3, 4, 5], None),
+            ("notes", [6], "eu"),
+        ]
+        assert spool.pending() == 0
+        spool.close()
+
+    def test_assigns_missing_ids(self, tmp_path):
+        write = Recorder()
+        spool = WriteSpool(tmp_path, write)
+
+        spool.append("docs", [{"vector": [0.1]}])
+        spool.flush()
+
+        assert len(write.batches[0][1][0]) == 36
+        spool.close()
+
+    def test_restart_resumes_after_checkpoint(self, tmp_path):
+        first = Recorder()
+        spool = WriteSpool(tmp_path, first)
+        spool.append("docs", [{"id": 1, "vector": [0.1]}])
+        spool.flush()
+        spool.append("docs", [{"id": 2, "vector": [0.2]}])
+        spool.close()
+
+        second = Recorder()
+        restarted = WriteSpool(tmp_path, second)
+
+        assert restarted.pending() == 1
+        assert restarted.append("docs", [{"id": 3, "vector": [0.3]}]) == 3
+        restarted.flush()
+        assert second.batches == [("docs", [2, 3], None)]
+        restarted.close()
+
+    def test_torn_write_is_truncated(self, tmp_path):
+        spool = WriteSpool(tmp_path, Recorder())
+        spool.append("docs", [{"id": 1, "vector": [0.1]}])
+        spool.close()
+        segment = next(tmp_path.glob("*.log"))
+        with open(segment, "ab") as log:
+            log.write(b'{"seq":2,"collection":"do')
+
+        write = Recorder()
+        recovered = WriteSpool(tmp_path, write)
+
+        assert recovered.pending() == 1
+        recovered.flush()
+        assert write.batches == [("docs", [1], None)]
+        assert segment.read_bytes().endswith(b"\n")
+        recovered.close()
+
+    def test_segments_roll_and_are_dropped(self, tmp_path):
+        write = Recorder()
+        spool = WriteSpool(tmp_path, write, segment_bytes=200, batch_size=2)
+
+        for i in range(6):
+            spool.append("docs", [{"id": i, "vector": [0.1, 0.2, 0.3]}])
+        assert len(list(tmp_path.glob("*.log"))) > 1
+
+        spool.flush()
+
+        assert [ids for _, ids, _ in write.batches] == [[0, 1], [2, 3], [4, 5]]
+        assert len(list(tmp_path.glob("*.log"))) == 1
+        spool.close()
+
+    def test_failed_replay_keeps_writes(self, tmp_path):
+        write = Recorder(fail=1)
+        spool = WriteSpool(tmp_path, write)
+        spool.append("docs", [{"id": 1, "vector": [0.1]}])
+
+        with pytest.raises(ConnectionError):
+            spool.replay_once()
+        assert spool.pending() == 1
+
+        assert spool.replay_once() == 1
+        assert write.batches == [("docs", [1], None)]
+        spool.close()
+
+    def test_background_replay(self, tmp_path):
+        write = Recorder(fail=1)
+        spool = WriteSpool(tmp_path, write, replay_interval=0.01).start()
+        spool.append("docs", [{"id": 1, "vector": [0.1]}])
+
+        assert spool.flush(timeout=5) is True
+        assert write.batches == [("docs", [1], None)]
+        assert spool.close(timeout=5) is True
+
+    def test_unwritable_batch_is_dead_lettered(self, tmp_path):
+        written = []
+
+        def write(collection_name, points, shard_key):
+            if any(point["id"] == 2 for point in points):
+                raise ValueError("wrong vector dimension")
+            written.append([point["id"] for point in points])
+
+        spool = WriteSpool(tmp_path, write, retryable=lambda error: isinstance(error, ConnectionError))
+        for i in range(1, 4):
+            spool.append("docs", [{"id": i, "vector": [0.1]}])
+
+        assert spool.replay_once() == 3
+        assert spool.pending() == 0
+        assert written == [[1], [3]]
+        dead = [json.loads(line) for line in (tmp_path / "dead-letter.jsonl").read_text().splitlines()]
+        assert [(record["seq"], record["error"]) for record in dead] == [(2, "wrong vector dimension")]
+        spool.close()
+
+    def test_invalid_fsync_policy(self, tmp_path):
+        with pytest.raises(ValueError):
+            WriteSpool(tmp_path, Recorder(), fsync="sometimes")
+
+
+class TestSpooledUpsert:
+    @pytest.fixture
+    def spool_config(self, tmp_path):
+        config = CustomAddonConfig(
+            id="test_qdrant_addon_id",
+            type="storage",
+            name="test_qdrant_addon",
+            url="http://localhost:6333",
+            secrets={},
+            spool_enabled=True,
+            spool_dir=str(tmp_path / "spool"),
+            spool_fsync="always"
+        )
+        yield config
+        close_spools(timeout=5)
+
+    def test_upsert_is_spooled_then_replayed(self, spool_config):
+        client = QdrantClient(":memory:")
+        client.create_collection("docs", vectors_config=VectorParams(size=2, distance=Distance.COSINE))
+
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient", return_value=client):
+            response = upsert_points(spool_config, "docs", [{"id": 1, "vector": [1.0, 0.0]}])
+
+            assert response.code == 200
+            assert response.output.status == "spooled"
+            assert response.output.operation_id is None
+
+            close_spools(timeout=5)
+
+        assert client.count("docs").count == 1
+
+    def test_invalid_points_are_not_spooled(self, spool_config):
+        spool_config.vector_dim = 4
+
+        response = upsert_points(spool_config, "docs", [{"id": 1, "vector": [1.0, 0.0, 0.0]}])
+
+        assert response.code == 500
+        assert "dimension 4" in response.message
+        assert get_spool(spool_config).pending() == 0
+
+    def test_delete_waits_for_spooled_upserts(self, spool_config):
+        client = QdrantClient(":memory:")
+        client.create_collection("docs", vectors_config=VectorParams(size=2, distance=Distance.COSINE))
+
+        # without a replay thread spooled upserts only reach Qdrant when the spool is flushed
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient", return_value=client), \
+                patch.object(WriteSpool, "start", lambda spool: spool):
+            upsert_points(spool_config, "docs", [{"id": 1, "vector": [1.0, 0.0]}, {"id": 2, "vector": [0.0, 1.0]}])
+            response = delete_points(spool_config, "docs", ids=[1])
+            get_spool(spool_config).flush()
+
+        assert response.code == 200
+        assert [record.id for record in client.scroll("docs")[0]] == [2]
+
+    def test_invalid_spool_fsync(self):
+        with pytest.raises(ValueError):
+            CustomAddonConfig(id="a", type="storage", name="a", secrets={}, spool_fsync="sometimes")
@@ -254,3 +254,84 @@ class TestToolRegistry:
         schema = registry._basic_type_converter(no_annotations_func)
 
         assert schema == {"type": "object", "properties": {}, "required": []}
+
+
+class TestToolDispatch:
+    def test_schema_compiled_once_per_function(self, sample_tools):
+        registry = ToolRegistry()
+
+        with patch.object(registry, "_build_schema", wraps=registry._build_schema) as build:
+            registry.register_tools(sample_tools)
+            registry.register_tools(sample_tools)
+
+        assert build.call_count == 2
+        assert registry.tool_definitions["test_tool"]["input_schema"]["required"] == ["param1"]
+
+    def test_get_tools_snapshot_is_read_only_and_rebuilt_on_change(self, sample_tools):
+        registry = ToolRegistry()
+        registry.register_tools(sample_tools)
+
+        first = registry.get_tools_for_action()
+        assert registry.get_tools_for_action() is first
+        with pytest.raises(TypeError):
+            first["test_tool"] = {}
+        first["test_tool"]["input_schema"]["required"].append("injected")
+        assert registry.tool_definitions["test_tool"]["input_schema"]["required"] == ["param1"]
+
+        registry.register_tools({"third_tool": lambda: "ok"})
+        assert "third_tool" in registry.get_tools_for_action()
+        assert "third_tool" not in first
+
+    def test_registrations_do_not_share_schemas(self, sample_tools):
+        registry = ToolRegistry()
+        registry.register_tools({"a": sample_tools["test_tool"], "b": sample_tools["test_tool"]})
+
+        registry.tool_definitions["a"]["input_schema"]["required"].append("injected")
+
+        assert registry.tool_definitions["b"]["input_schema"]["required"] == ["param1"]
+
+        registry.clear()
+        assert registry.get_tools_for_action() == {}
+
+    def test_invoke_validates_and_coerces(self, sample_tools):
+        registry = ToolRegistry()
+        registry.register_tools(sample_tools)
+
+        result = registry.invoke("test_tool", {"param1": "value", "param2": "7"})
+
+        assert result == {"tool": "test_tool", "param1": "value", "param2": 7}
+        assert registry.invoke("test_tool", {"param1": "value"})["param2"] == 5
+        assert registry.invoke("another_tool") == "success"
+
+    def test_invoke_invalid_arguments(self, sample_tools):
+        from pydantic import ValidationError
+
+        registry = ToolRegistry()
+        registry.register_tools(sample_tools)
+
+        with pytest.raises(ValidationError):
+            registry.invoke("test_tool", {"param2": 3})
+
+    def test_invoke_unknown_tool(self):
+        registry = ToolRegistry()
+
+        with pytest.raises(KeyError):
+            registry.invoke("missing")
+
+    def test_invoke_retries(self):
+        registry = ToolRegistry()
+        flaky = Mock(side_effect=[RuntimeError("boom"), RuntimeError("boom"), "done"])
+
+        def flaky_tool(query: str) -> str:
+            return flaky(query)
+
+        registry.register_tools({"flaky_tool": flaky_tool}, tool_max_retries={"flaky_tool": 2})
+        assert registry.invoke("flaky_tool", {"query": "q"}) == "done"
+        assert flaky.call_count == 3
+
+        flaky.side_effect = RuntimeError("still broken")
+        flaky.reset_mock()
+        registry.tool_max_retries["flaky_tool"] = 1
+        with pytest.raises(RuntimeError):
+            registry.invoke("flaky_tool", {"query": "q"})
+        assert flaky.call_count == 2
@@ -0,0 +1,178 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from qdrant_rooms_pkg.actions.create_collection import create_collection
+from qdrant_rooms_pkg.actions.search_points import search_points
+from qdrant_rooms_pkg.actions.upsert_points import upsert_points
+from qdrant_rooms_pkg.configuration import CustomAddonConfig
+from qdrant_rooms_pkg.utils.vectors import (
+    as_float32,
+    convert_datatype,
+    l2_normalize,
+    prepare_vectors,
+    preprocess,
+    truncate,
+    validate_dimension,
+)
+
+
+class TestVectorUtilities:
+    def test_as_float32(self):
+        matrix = as_float32([[1, 2], [3, 4]])
+
+        assert matrix.dtype == np.float32
+        assert matrix.flags.c_contiguous
+        assert as_float32([1.0, 2.0]).shape == (1, 2)
+
+    def test_as_float32_does_not_copy_contiguous_arrays(self):
+        vectors = np.ones((3, 4), dtype=np.float32)
+
+        assert as_float32(vectors) is vectors
+
+    def test_as_float32_rejects_ragged_vectors(self):
+        with pytest.raises(ValueError, match="same dimension"):
+            as_float32([[1.0, 2.0], [3.0]])
+
+    def test_l2_normalize_in_place(self):
+        vectors = np.array([[3.0, 4.0], [0.0, 0.0]], dtype=np.float32)
+
+        normalized = l2_normalize(vectors)
+
+        assert normalized is vectors
+        np.testing.assert_allclose(vectors, [[0.6, 0.8], [0.0, 0.0]])
+
+    def test_truncate(self):
+        vectors = as_float32([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+        truncated = truncate(vectors, 2)
+
+        assert truncated.flags.c_contiguous
+        np.testing.assert_array_equal(truncated, [[1.0, 2.0], [4.0, 5.0]])
+        with pytest.raises(ValueError):
+            truncate(vectors, 4)
+
+    def test_validate_dimension(self):
+        with pytest.raises(ValueError, match="Expected vectors of dimension 3, got 2"):
+            validate_dimension(as_float32([[1.0, 2.0]]), 3)
+
+    def test_prepare_vectors_truncates_then_normalizes(self):
+        prepared = prepare_vectors([[3.0, 4.0, 12.0]], dim=2, normalize=True, truncate_dim=2)
+
+        np.testing.assert_allclose(prepared, [[0.6, 0.8]])
+
+    def test_prepare_vectors_copies_unless_in_place(self):
+        vectors = np.array([[3.0, 4.0]], dtype=np.float32)
+
+        prepare_vectors(vectors, normalize=True)
+        np.testing.assert_array_equal(vectors, [[3.0, 4.0]])
+
+        prepare_vectors(vectors, normalize=True, inplace=True)
+        np.testing.assert_allclose(vectors, [[0.6, 0.8]])
+
+    def test_convert_datatype(self):
+        matrix = as_float32([[0.1, 200.4, 3.6]])
+
+        assert convert_datatype(matrix, "float32") is matrix
+        assert convert_datatype(matrix, "float16").dtype == np.float16
+        np.testing.assert_array_equal(convert_datatype(matrix, "uint8"), [[0, 200, 4]])
+
+    def test_convert_datatype_rejects_out_of_range_values(self):
+        with pytest.raises(ValueError, match="0 and 255"):
+            convert_datatype(as_float32([[-3.0, 1.0]]), "uint8")
+        with pytest.raises(ValueError, match="65504"):
+            convert_datatype(as_float32([[1e6]]), "float16")
+        with pytest.raises(ValueError, match="Unknown vector datatype"):
+            convert_datatype(as_float32([[1.0]]), "int4")
+
+
+class TestPreprocessingStages:
+    @pytest.fixture
+    def config(self):
+        return CustomAddonConfig(
+            id="test_qdrant_addon_id",
+            type="storage",
+            name="test_qdrant_addon",
+            url="http://localhost:6333",
+            secrets={},
+            vector_normalize=True,
+            vector_truncate_dim=2
+        )
+
+    def test_upsert_and_search_are_preprocessed(self, config):
+        client = QdrantClient(":memory:")
+        client.create_collection("docs", vectors_config=VectorParams(size=2, distance=Distance.DOT))
+
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient", return_value=client):
+            upserted = upsert_points(config, "docs", [
+                {"id": 1, "vector": [3.0, 4.0, 9.0]},
+                {"id": 2, "vector": np.array([0.0, 2.0, 1.0])},
+            ])
+            response = search_points(config, "docs", [6.0, 8.0, 1.0], limit=2)
+
+        assert upserted.code == 200
+        stored = client.retrieve("docs", [1], with_vectors=True)[0].vector
+        np.testing.assert_allclose(stored, [0.6, 0.8], rtol=1e-6)
+        assert [result["id"] for result in response.output.results] == [1, 2]
+        assert response.output.results[0]["score"] == pytest.approx(1.0, rel=1e-5)
+
+    def test_dimension_mismatch_fails_before_qdrant(self, config):
+        config.vector_dim = 3
+
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient") as MockClient:
+            response = upsert_points(config, "docs", [{"id": 1, "vector": [1.0, 0.0, 0.0]}])
+
+        assert response.code == 500
+        assert "Expected vectors of dimension 3, got 2" in response.message
+        MockClient.return_value.upsert.assert_not_called()
+
+    def test_uint8_collection_end_to_end(self):
+        config = CustomAddonConfig(
+            id="test_qdrant_addon_id",
+            type="storage",
+            name="test_qdrant_addon",
+            url="http://localhost:6333",
+            secrets={},
+            vector_datatype="uint8"
+        )
+        client = QdrantClient(":memory:")
+
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient", return_value=client):
+            create_collection(config, "docs", vector_size=2, distance="Dot")
+            upserted = upsert_points(config, "docs", [
+                {"id": 1, "vector": np.array([10.2, 250.0])},
+                {"id": 2, "vector": [100.0, 1.0]},
+            ])
+            response = search_points(config, "docs", [0.0, 1.4], limit=2)
+
+        assert upserted.code == 200
+        assert client.get_collection("docs").config.params.vectors.datatype.value == "uint8"
+        assert client.retrieve("docs", [1], with_vectors=True)[0].vector == [10.0, 250.0]
+        assert [result["id"] for result in response.output.results] == [1, 2]
+
+    def test_uint8_query_vectors_stay_float(self):
+        config = CustomAddonConfig(
+            id="test_qdrant_addon_id",
+            type="storage",
+            name="test_qdrant_addon",
+            url="http://localhost:6333",
+            secrets={},
+            vector_datatype="uint8"
+        )
+        client = QdrantClient(":memory:")
+
+        with patch("qdrant_rooms_pkg.services.endpoints.QdrantClient", return_value=client):
+            create_collection(config, "cosine_bytes", vector_size=2)
+            upsert_points(config, "cosine_bytes", [{"id": 1, "vector": [10.0, 250.0]}])
+            response = search_points(config, "cosine_bytes", [0.4, 0.6], limit=1)
+
+        assert response.code == 200
+        assert response.output.results[0]["id"] == 1
+        assert preprocess(config, [[0.4, 0.6]], for_query=True).dtype == np.float32
+
+    def test_uint8_cannot_be_normalized(self):
+        with pytest.raises(ValueError):
+            CustomAddonConfig(id="a", type="storage", name="a", secrets={}, vector_datatype="uint8", vector_normalize=True)